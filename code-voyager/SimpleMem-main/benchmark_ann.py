@@ -0,0 +1,166 @@
+"""
+ANN Benchmark - recall@k versus latency for the semantic layer index
+
+Builds LanceDB tables of synthetic, clustered, normalized vectors (shaped like
+sentence embeddings) at several sizes, indexes them with the same parameters
+VectorStore uses, and compares nprobes / refine_factor settings against an
+exact flat scan. Ground truth is computed with numpy.
+
+Run from the SimpleMem root (needs config.py like the other scripts):
+    python benchmark_ann.py --sizes 10000,100000,1000000 --dim 1024
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import lancedb
+import numpy as np
+import pyarrow as pa
+
+from database.vector_store import ann_index_params
+
+
+def synthetic_vectors(n: int, dim: int, rng: np.random.Generator, clusters: int = 1000) -> np.ndarray:
+    """
+    Gaussian clusters around random centers, L2-normalized
+    """
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, n)] + 0.5 * rng.standard_normal((n, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def exact_neighbors(vectors: np.ndarray, queries: np.ndarray, k: int, chunk: int = 100_000) -> np.ndarray:
+    """
+    Exact top-k row ids by L2 distance (max dot product, as vectors are normalized)
+    """
+    best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+    best_ids = np.zeros((len(queries), 0), dtype=np.int64)
+    for start in range(0, len(vectors), chunk):
+        scores = queries @ vectors[start:start + chunk].T
+        ids = np.broadcast_to(np.arange(start, start + scores.shape[1]), scores.shape)
+        scores = np.concatenate([best_scores, scores], axis=1)
+        ids = np.concatenate([best_ids, ids], axis=1)
+        top = np.argpartition(-scores, min(k, scores.shape[1] - 1), axis=1)[:, :k]
+        best_scores = np.take_along_axis(scores, top, axis=1)
+        best_ids = np.take_along_axis(ids, top, axis=1)
+    return best_ids
+
+
+def build_table(db, name: str, vectors: np.ndarray, batch: int = 100_000):
+    dim = vectors.shape[1]
+    table = None
+    for start in range(0, len(vectors), batch):
+        chunk = vectors[start:start + batch]
+        data = pa.table({
+            "id": pa.array(np.arange(start, start + len(chunk)), pa.int64()),
+            "vector": pa.FixedSizeListArray.from_arrays(pa.array(chunk.reshape(-1), pa.float32()), dim),
+        })
+        if table is None:
+            table = db.create_table(name, data=data)
+        else:
+            table.add(data)
+    return table
+
+
+def run_queries(table, queries: np.ndarray, k: int,
+                nprobes: Optional[int] = None, refine_factor: Optional[int] = None) -> Tuple[List[List[int]], List[float]]:
+    results, latencies = [], []
+    for query in queries:
+        builder = table.search(query.tolist()).limit(k).select(["id"])
+        if nprobes is not None:
+            builder = builder.nprobes(nprobes)
+        if refine_factor is not None:
+            builder = builder.refine_factor(refine_factor)
+        start = time.perf_counter()
+        rows = builder.to_list()
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append([row["id"] for row in rows])
+    return results, latencies
+
+
+def recall_at_k(results: List[List[int]], truth: np.ndarray) -> float:
+    hits = sum(len(set(found) & set(expected.tolist())) for found, expected in zip(results, truth))
+    return hits / truth.size
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))]
+
+
+def benchmark_size(db, n: int, args, rng: np.random.Generator) -> List[Dict]:
+    print(f"\n=== {n:,} vectors, dim {args.dim} ===")
+    vectors = synthetic_vectors(n, args.dim, rng)
+    # Queries: perturbed dataset points, so true neighbors exist
+    queries = vectors[rng.integers(0, n, args.queries)] + 0.1 * rng.standard_normal((args.queries, args.dim)).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    truth = exact_neighbors(vectors, queries, args.k)
+
+    table = build_table(db, f"bench_{n}", vectors)
+    rows = []
+
+    if n <= args.max_flat:
+        results, latencies = run_queries(table, queries, args.k)
+        rows.append({"size": n, "config": "flat (exact)", "recall": recall_at_k(results, truth),
+                     "p50": statistics.median(latencies), "p95": percentile(latencies, 0.95)})
+
+    params = ann_index_params(n, args.dim, args.index_type)
+    start = time.perf_counter()
+    table.create_index(**params)
+    build_seconds = time.perf_counter() - start
+    print(f"{args.index_type} index ({params['num_partitions']} partitions) built in {build_seconds:.1f}s")
+
+    for nprobes in args.nprobes:
+        for refine_factor in args.refine:
+            results, latencies = run_queries(table, queries, args.k, nprobes, refine_factor)
+            rows.append({"size": n, "config": f"nprobes={nprobes} refine={refine_factor}",
+                         "recall": recall_at_k(results, truth),
+                         "p50": statistics.median(latencies), "p95": percentile(latencies, 0.95)})
+    db.drop_table(f"bench_{n}")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ANN recall@k versus latency on synthetic vectors")
+    parser.add_argument("--sizes", type=str, default="10000,100000,1000000",
+                        help="Comma-separated table sizes")
+    parser.add_argument("--dim", type=int, default=1024, help="Vector dimension (1024 for Qwen3-Embedding)")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per configuration")
+    parser.add_argument("--k", type=int, default=10, help="Neighbors per query (recall@k)")
+    parser.add_argument("--index-type", type=str, default="IVF_PQ", help="IVF_PQ or IVF_HNSW_SQ")
+    parser.add_argument("--nprobes", type=str, default="5,10,20,50", help="nprobes values to sweep")
+    parser.add_argument("--refine", type=str, default="none,10", help="refine_factor values to sweep")
+    parser.add_argument("--max-flat", type=int, default=1_000_000,
+                        help="Largest size to also time with an exact flat scan")
+    parser.add_argument("--db-path", type=str, default=None, help="Where to build tables (default: temp dir)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    args.nprobes = [int(value) for value in args.nprobes.split(",")]
+    args.refine = [None if value.lower() == "none" else int(value) for value in args.refine.split(",")]
+
+    db_path = args.db_path or tempfile.mkdtemp(prefix="simplemem_ann_")
+    os.makedirs(db_path, exist_ok=True)
+    rng = np.random.default_rng(args.seed)
+    rows = []
+    try:
+        db = lancedb.connect(db_path)
+        for n in sizes:
+            rows.extend(benchmark_size(db, n, args, rng))
+    finally:
+        if args.db_path is None:
+            shutil.rmtree(db_path, ignore_errors=True)
+
+    print(f"\n{'size':>10}  {'config':<24} {'recall@' + str(args.k):>10} {'p50 ms':>9} {'p95 ms':>9}")
+    for row in rows:
+        print(f"{row['size']:>10,}  {row['config']:<24} {row['recall']:>10.3f} {row['p50']:>9.2f} {row['p95']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Embedding Benchmark - query latency with and without the embedding cache
+
+Measures encode_single latency for retrieval-style queries:
+- no cache: every query runs the model
+- cold cache: first pass, every query is a miss
+- warm cache: repeated queries (as in planning and reflection rounds)
+the throughput of concurrent encode_single calls from worker threads,
+with and without micro-batching, and document throughput (docs/s) of
+encode_documents for each inference backend (PyTorch, ONNX Runtime, int8).
+
+Run from the SimpleMem root (needs config.py like the other scripts):
+    python benchmark_embedding.py --queries 200 --threads 8
+    python benchmark_embedding.py --backends torch,onnx,torch_int8 --docs 1000 --num-threads 4
+"""
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from utils.embedding import EmbeddingModel
+
+PEOPLE = ["Alice", "Bob", "Carol", "Dave", "Erin", "Frank"]
+TOPICS = ["the marketing plan", "a hiking trip", "the quarterly budget", "a new job", "their garden", "a concert"]
+
+
+def synthetic_queries(n: int) -> List[str]:
+    return [
+        f"What did {PEOPLE[i % len(PEOPLE)]} say about {TOPICS[(i // len(PEOPLE)) % len(TOPICS)]} in week {i % 52}?"
+        for i in range(n)
+    ]
+
+
+def latency_stats(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "mean": statistics.fmean(ordered),
+        "p50": statistics.median(ordered),
+        "p95": ordered[max(0, round(0.95 * len(ordered)) - 1)],
+    }
+
+
+def time_sequential(model: EmbeddingModel, queries: List[str]) -> Dict[str, float]:
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        model.encode_single(query, is_query=True)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latency_stats(latencies)
+
+
+def synthetic_documents(n: int) -> List[str]:
+    return [
+        f"{PEOPLE[i % len(PEOPLE)]} told {PEOPLE[(i + 1) % len(PEOPLE)]} about "
+        f"{TOPICS[(i // len(PEOPLE)) % len(TOPICS)]} on day {i} of the project, "
+        f"and they agreed to follow up at {8 + i % 10}:00 the next morning."
+        for i in range(n)
+    ]
+
+
+def documents_per_second(model: EmbeddingModel, documents: List[str]) -> float:
+    model.encode_documents(documents[:model.batch_size])  # warm up
+    start = time.perf_counter()
+    model.encode_documents(documents)
+    return len(documents) / (time.perf_counter() - start)
+
+
+def time_concurrent(model: EmbeddingModel, queries: List[str], threads: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda query: model.encode_single(query, is_query=True), queries))
+    return len(queries) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding query latency and cache effect")
+    parser.add_argument("--queries", type=int, default=200, help="Number of distinct queries")
+    parser.add_argument("--threads", type=int, default=8, help="Worker threads for the concurrent test")
+    parser.add_argument("--model", type=str, default=None, help="Embedding model (default: config.EMBEDDING_MODEL)")
+    parser.add_argument("--backends", type=str, default=None,
+                        help="Comma-separated backends to compare on document throughput (e.g. torch,onnx,torch_int8)")
+    parser.add_argument("--docs", type=int, default=1000, help="Documents per backend throughput run")
+    parser.add_argument("--num-threads", type=int, default=None, help="CPU threads (default: EMBEDDING_NUM_THREADS)")
+    args = parser.parse_args()
+
+    if args.backends:
+        documents = synthetic_documents(args.docs)
+        print(f"\nencode_documents throughput, {args.docs} documents (no cache)")
+        for backend in args.backends.split(","):
+            model = EmbeddingModel(args.model, use_cache=False, use_microbatching=False,
+                                   backend=backend, num_threads=args.num_threads)
+            if model.backend != backend:
+                print(f"  {backend:<12} unavailable (fell back to {model.backend})")
+                continue
+            print(f"  {backend:<12} {documents_per_second(model, documents):>8.1f} docs/s")
+        return
+
+    queries = synthetic_queries(args.queries)
+
+    uncached = EmbeddingModel(args.model, use_cache=False, use_microbatching=False)
+    uncached.encode(queries[:4], is_query=True)  # warm up the model
+    rows = [("no cache", time_sequential(uncached, queries))]
+
+    cached = EmbeddingModel(args.model, use_cache=True, use_microbatching=False)
+    rows.append(("cold cache", time_sequential(cached, queries)))
+    rows.append(("warm cache", time_sequential(cached, queries)))
+
+    print(f"\nQuery latency over {args.queries} queries (ms)")
+    print(f"  {'mode':<12} {'mean':>8} {'p50':>8} {'p95':>8}")
+    for name, stats in rows:
+        print(f"  {name:<12} {stats['mean']:>8.2f} {stats['p50']:>8.2f} {stats['p95']:>8.2f}")
+    print(f"  cache: {cached.cache_stats()}")
+
+    batched = EmbeddingModel(args.model, use_cache=False, use_microbatching=True)
+    print(f"\nConcurrent encode_single, {args.threads} threads (queries/s, no cache)")
+    print(f"  {'unbatched':<12} {time_concurrent(uncached, queries, args.threads):>8.1f}")
+    print(f"  {'micro-batch':<12} {time_concurrent(batched, queries, args.threads):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
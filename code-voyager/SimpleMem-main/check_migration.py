@@ -0,0 +1,97 @@
+"""
+Migration Check - reopen a store created before the typed timestamp column
+
+Writes a table with the pre-migration schema (string timestamps only,
+including empty and unparseable ones), opens it with VectorStore and checks
+that the timestamp_ts column was added, every row survived, and timestamp
+range filters still work. Exits non-zero on failure.
+
+Run from the SimpleMem root (needs config.py like the other scripts):
+    python check_migration.py
+"""
+import shutil
+import sys
+import tempfile
+
+import lancedb
+import numpy as np
+import pyarrow as pa
+
+from database.vector_store import TIMESTAMP_COLUMN, VectorStore
+
+DIM = 8
+
+ROWS = [
+    ("valid-datetime", "2025-01-15T10:00:00"),
+    ("valid-date", "2025-03-02"),
+    ("empty", ""),
+    ("garbage", "sometime last spring"),
+]
+
+
+class FixedDimension:
+    """
+    Only the dimension is read when a store opens an existing table
+    """
+    dimension = DIM
+
+
+def write_legacy_table(path: str, table_name: str):
+    vectors = np.random.default_rng(0).standard_normal((len(ROWS), DIM)).astype(np.float32)
+    data = pa.table({
+        "entry_id": [entry_id for entry_id, _ in ROWS],
+        "lossless_restatement": [f"Entry {entry_id}" for entry_id, _ in ROWS],
+        "keywords": [[entry_id] for entry_id, _ in ROWS],
+        "timestamp": [timestamp for _, timestamp in ROWS],
+        "location": [""] * len(ROWS),
+        "persons": [[] for _ in ROWS],
+        "entities": [[] for _ in ROWS],
+        "topic": [""] * len(ROWS),
+        "vector": pa.FixedSizeListArray.from_arrays(pa.array(vectors.reshape(-1), pa.float32()), DIM),
+    }, schema=pa.schema([
+        pa.field("entry_id", pa.string()),
+        pa.field("lossless_restatement", pa.string()),
+        pa.field("keywords", pa.list_(pa.string())),
+        pa.field("timestamp", pa.string()),
+        pa.field("location", pa.string()),
+        pa.field("persons", pa.list_(pa.string())),
+        pa.field("entities", pa.list_(pa.string())),
+        pa.field("topic", pa.string()),
+        pa.field("vector", pa.list_(pa.float32(), DIM)),
+    ]))
+    lancedb.connect(path).create_table(table_name, data=data)
+
+
+def main() -> int:
+    path = tempfile.mkdtemp(prefix="simplemem-migration-")
+    failures = []
+    try:
+        write_legacy_table(path, "memories")
+        store = VectorStore(db_path=path, embedding_model=FixedDimension(), table_name="memories")
+
+        if TIMESTAMP_COLUMN not in store.table.schema.names:
+            failures.append(f"{TIMESTAMP_COLUMN} was not added")
+        if store.table.count_rows() != len(ROWS):
+            failures.append(f"expected {len(ROWS)} rows, found {store.table.count_rows()}")
+        if TIMESTAMP_COLUMN in store.table.schema.names:
+            nulls = store.table.to_arrow().column(TIMESTAMP_COLUMN).null_count
+            if nulls != 2:
+                failures.append(f"expected 2 null {TIMESTAMP_COLUMN} values, found {nulls}")
+
+        found = {entry.entry_id for entry in store.structured_search(timestamp_range=("2025-01-01", "2025-01-31"))}
+        if found != {"valid-datetime"}:
+            failures.append(f"timestamp range matched {sorted(found)}, expected ['valid-datetime']")
+
+        # Reopening a migrated table must not migrate again
+        VectorStore(db_path=path, embedding_model=FixedDimension(), table_name="memories")
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print("Migration check passed" if not failures else f"Migration check failed ({len(failures)} problems)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""
+Ingestion Pipeline - overlapped compression, embedding and storage of dialogues
+
+Paper Reference: Section 3.1 - Semantic Structured Compression
+Runs the write path as three stages connected by bounded queues, so LLM
+calls, embedding and disk writes for a long conversation overlap instead of
+running one window at a time:
+1. Extraction: worker threads turn dialogue windows into MemoryEntry lists (LLM)
+2. Embedding: one thread encodes the entries of all waiting windows in one call
+3. Storage: one thread appends all waiting encoded batches with one table.add
+
+A full queue blocks the stage feeding it, so a slow stage throttles the ones
+before it (down to add_dialogue) instead of buffering without bound.
+"""
+from typing import Callable, List, Optional, Dict, Any, Tuple
+import queue
+import threading
+import time
+import numpy as np
+from models.memory_entry import Dialogue, MemoryEntry
+from database.vector_store import VectorStore
+import config
+
+
+# Queue sentinel telling a stage to stop after the work before it
+_STOP = object()
+
+
+class IngestionPipeline:
+    """
+    Pipelined dialogue ingestion into a VectorStore
+
+    Dialogues are grouped into windows of window_size (consecutive windows
+    share overlap_size dialogues for context) and passed to extract_fn, which
+    returns the window's atomic entries, e.g. via the LLM compression prompt.
+    """
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        extract_fn: Callable[[List[Dialogue]], List[MemoryEntry]],
+        window_size: Optional[int] = None,
+        overlap_size: Optional[int] = None,
+        extraction_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        embed_batch_size: Optional[int] = None,
+        append_batch_rows: Optional[int] = None,
+    ):
+        self.vector_store = vector_store
+        self.extract_fn = extract_fn
+        self.window_size = window_size or getattr(config, "WINDOW_SIZE", 40)
+        self.overlap_size = min(overlap_size if overlap_size is not None else getattr(config, "OVERLAP_SIZE", 2),
+                                self.window_size - 1)
+        self.extraction_workers = extraction_workers or getattr(
+            config, "INGEST_EXTRACTION_WORKERS", getattr(config, "MAX_PARALLEL_WORKERS", 4))
+        queue_size = queue_size or getattr(config, "INGEST_QUEUE_SIZE", 32)
+        self.embed_batch_size = embed_batch_size or getattr(config, "INGEST_EMBED_BATCH_SIZE", 256)
+        self.append_batch_rows = append_batch_rows or getattr(config, "INGEST_APPEND_BATCH_ROWS", 1000)
+
+        # windows -> entries -> (entries, vectors); items carry the number of
+        # new (non-overlap) dialogues they cover, for throughput accounting
+        self._windows: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._extracted: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._encoded: "queue.Queue" = queue.Queue(maxsize=queue_size)
+
+        self._buffer: List[Dialogue] = []
+        self._new_in_buffer = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.dialogues_submitted = 0
+        self.dialogues_stored = 0
+        self.entries_stored = 0
+        self.windows_failed = 0
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+        self._extractors = [
+            threading.Thread(target=self._extract_loop, name=f"ingest-extract-{i}", daemon=True)
+            for i in range(self.extraction_workers)
+        ]
+        self._embedder = threading.Thread(target=self._embed_loop, name="ingest-embed", daemon=True)
+        self._writer = threading.Thread(target=self._write_loop, name="ingest-write", daemon=True)
+        for thread in [*self._extractors, self._embedder, self._writer]:
+            thread.start()
+
+    def add_dialogue(self, dialogue: Dialogue):
+        """
+        Buffer a dialogue; a full window is queued for extraction (blocks while the pipeline is full)
+        """
+        if self._closed:
+            raise RuntimeError("IngestionPipeline is finalized")
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
+        self._buffer.append(dialogue)
+        self._new_in_buffer += 1
+        self.dialogues_submitted += 1
+        if len(self._buffer) >= self.window_size:
+            self._submit_window()
+
+    def add_dialogues(self, dialogues: List[Dialogue]):
+        for dialogue in dialogues:
+            self.add_dialogue(dialogue)
+
+    def _submit_window(self):
+        window = self._buffer[:self.window_size]
+        self._windows.put((window, self._new_in_buffer))
+        carry = self._buffer[self.window_size - self.overlap_size:] if self.overlap_size else self._buffer[self.window_size:]
+        self._buffer = carry
+        # Carried-over overlap dialogues were already counted with this window
+        self._new_in_buffer = max(0, len(carry) - self.overlap_size)
+
+    def flush(self):
+        """
+        Queue the partial window, then wait until everything queued is stored
+        """
+        if self._new_in_buffer:
+            self._windows.put((list(self._buffer), self._new_in_buffer))
+            self._buffer = self._buffer[-self.overlap_size:] if self.overlap_size else []
+            self._new_in_buffer = 0
+        for stage in (self._windows, self._extracted, self._encoded):
+            stage.join()
+        self._finished_at = time.perf_counter()
+
+    def finalize(self) -> Dict[str, Any]:
+        """
+        Flush, stop the stage threads and report throughput
+        """
+        if not self._closed:
+            self.flush()
+            self._closed = True
+            for _ in self._extractors:
+                self._windows.put(_STOP)
+            for thread in self._extractors:
+                thread.join()
+            self._extracted.put(_STOP)
+            self._embedder.join()
+            self._writer.join()
+
+        stats = self.stats()
+        print(f"Ingested {stats['dialogues']} dialogues into {stats['entries']} entries "
+              f"in {stats['seconds']:.2f}s ({stats['dialogues_per_second']:.1f} dialogues/s)")
+        if stats["failed_windows"]:
+            print(f"Warning: {stats['failed_windows']} windows failed and were skipped")
+        return stats
+
+    def stats(self) -> Dict[str, Any]:
+        end = self._finished_at or time.perf_counter()
+        seconds = end - self._started_at if self._started_at is not None else 0.0
+        return {
+            "dialogues": self.dialogues_stored,
+            "entries": self.entries_stored,
+            "failed_windows": self.windows_failed,
+            "seconds": seconds,
+            "dialogues_per_second": self.dialogues_stored / seconds if seconds > 0 else 0.0,
+        }
+
+    def _extract_loop(self):
+        while True:
+            item = self._windows.get()
+            try:
+                if item is _STOP:
+                    return
+                window, new_dialogues = item
+                try:
+                    entries = self.extract_fn(window)
+                except Exception as e:
+                    print(f"Warning: extraction failed for window of {len(window)} dialogues: {e}")
+                    with self._lock:
+                        self.windows_failed += 1
+                    continue
+                self._extracted.put((entries or [], new_dialogues))
+            finally:
+                self._windows.task_done()
+
+    def _embed_loop(self):
+        while True:
+            batch, stop = self._drain(self._extracted, self.embed_batch_size, lambda item: len(item[0]))
+            try:
+                entries = [entry for window_entries, _ in batch for entry in window_entries]
+                new_dialogues = sum(count for _, count in batch)
+                if entries or new_dialogues:
+                    vectors = self.vector_store.embedding_model.encode_documents(
+                        [entry.lossless_restatement for entry in entries]
+                    ) if entries else None
+                    self._encoded.put((entries, vectors, new_dialogues))
+            except Exception as e:
+                print(f"Warning: embedding failed for {len(batch)} windows: {e}")
+                with self._lock:
+                    self.windows_failed += len(batch)
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._extracted.task_done()
+            if stop:
+                self._encoded.put(_STOP)
+                return
+
+    def _write_loop(self):
+        while True:
+            batch, stop = self._drain(self._encoded, self.append_batch_rows, lambda item: len(item[0]))
+            try:
+                entries = [entry for chunk_entries, _, _ in batch for entry in chunk_entries]
+                if entries:
+                    vectors = np.concatenate([vectors for chunk_entries, vectors, _ in batch if chunk_entries])
+                    self.vector_store.add_entries(entries, vectors=vectors)
+                with self._lock:
+                    self.entries_stored += len(entries)
+                    self.dialogues_stored += sum(count for _, _, count in batch)
+            except Exception as e:
+                print(f"Warning: storing {len(batch)} batches failed: {e}")
+                with self._lock:
+                    self.windows_failed += len(batch)
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._encoded.task_done()
+            if stop:
+                return
+
+    @staticmethod
+    def _drain(stage: "queue.Queue", max_rows: int, rows: Callable[[Any], int]) -> Tuple[List[Any], bool]:
+        """
+        Block for one item, then take whatever else is already waiting (up to max_rows)
+
+        Returns the items and whether the stop sentinel was reached.
+        """
+        batch: List[Any] = []
+        item = stage.get()
+        total = 0
+        while item is not _STOP:
+            batch.append(item)
+            total += rows(item)
+            if total >= max_rows:
+                return batch, False
+            try:
+                item = stage.get_nowait()
+            except queue.Empty:
+                return batch, False
+        return batch, True
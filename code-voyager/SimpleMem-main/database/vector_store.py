@@ -7,16 +7,205 @@ Implements the three structured indexing dimensions:
 - Lexical Layer: Sparse vectors h_k ∈ ℝ^|V| (BM25/keyword matching)
 - Symbolic Layer: Metadata R_k = {(key, val)} (structured filtering by time, entities, etc.)
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import math
+import threading
 import lancedb
-import pyarrow as pa
 import numpy as np
-from models.memory_entry import MemoryEntry
+import pyarrow as pa
+from dateutil import parser as date_parser
+from models.memory_entry import MemoryEntry, MemoryEntryView
 from utils.embedding import EmbeddingModel
 import config
 import os
 
 
+# Lexical layer: BM25 full-text indices, one per column. A keyword-list hit
+# counts more than a hit in the restatement text (as in the original scoring).
+FTS_COLUMN_WEIGHTS = {"keywords": 2.0, "lossless_restatement": 1.0}
+
+# Candidates fetched per column before the weighted merge, as a multiple of top_k
+FTS_CANDIDATE_MULTIPLIER = 4
+
+# Symbolic layer: scalar indices used by structured_search predicates.
+# LABEL_LIST serves array_has_any on list columns; BTREE serves range filters.
+SCALAR_INDEXES = {"persons": "LABEL_LIST", "entities": "LABEL_LIST", "timestamp_ts": "BTREE"}
+
+# Typed copy of `timestamp`, parsed once at insert; null when missing or unparseable
+TIMESTAMP_COLUMN = "timestamp_ts"
+
+# Hybrid retrieval: reciprocal rank fusion, score = sum(weight / (RRF_K + rank))
+RRF_K = 60
+HYBRID_LAYER_WEIGHTS = {"semantic": 1.0, "lexical": 1.0, "symbolic": 0.5}
+
+# Candidates taken from each layer before fusion, as a multiple of k
+HYBRID_CANDIDATE_MULTIPLIER = 3
+
+# Semantic layer: rebuild the ANN index (re-train its partitions) once the
+# table has grown by this factor since it was built. Smaller growth is folded
+# into the existing partitions by optimize().
+ANN_REBUILD_GROWTH = 2.0
+
+# Storage type of the vector column. float16 halves vector disk and memory
+# use; LanceDB cannot search integer vectors, so 8-bit codes are left to the
+# ANN index (IVF_PQ, or IVF_HNSW_SQ for scalar int8 quantization).
+VECTOR_DTYPES = {"float32": pa.float32(), "float16": pa.float16()}
+
+# With float16 storage, semantic search fetches top_k * this many candidates
+# and re-ranks them by float32 distance to the (float32) query
+VECTOR_RESCORE_MULTIPLIER = 4
+
+# Columns returned by non-vector queries (never the embedding itself)
+ENTRY_COLUMNS = ["entry_id", "lossless_restatement", "keywords", "timestamp",
+                 "location", "persons", "entities", "topic"]
+
+# Relevance columns are selected explicitly: LanceDB's implicit projection of
+# them with select() is deprecated and will stop
+DISTANCE_COLUMN = "_distance"
+SCORE_COLUMN = "_score"
+
+
+def _sql_literal(value: str) -> str:
+    """
+    Quote a string for a LanceDB (DataFusion SQL) filter expression
+    """
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _sql_list(values: List[str]) -> str:
+    return "[" + ", ".join(_sql_literal(v) for v in values) + "]"
+
+
+def parse_timestamp(value: Optional[str], end_of_day: bool = False) -> Optional[datetime]:
+    """
+    Parse a memory timestamp to a naive datetime (aware values become UTC)
+
+    ISO 8601 is parsed directly; other formats go through dateutil. With
+    end_of_day, a date without a time maps to the last microsecond of that
+    day, so ("2025-11-15", "2025-11-15") covers the whole day.
+    """
+    text = (value or "").strip()
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        try:
+            parsed = date_parser.parse(text)
+        except (ValueError, OverflowError):
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    if end_of_day and len(text) <= 10 and parsed.time() == datetime.min.time():
+        parsed += timedelta(days=1, microseconds=-1)
+    return parsed
+
+
+def _sql_timestamp(value: datetime) -> str:
+    return f"TIMESTAMP '{value.strftime('%Y-%m-%d %H:%M:%S.%f')}'"
+
+
+def ann_index_params(num_rows: int, dimension: int, index_type: str = "IVF_PQ") -> Dict[str, Any]:
+    """
+    Arguments for LanceTable.create_index sized to the table
+
+    Uses about sqrt(n) IVF partitions and, for PQ, sub-vectors of 16 (or
+    fewer) dimensions, which must divide the embedding dimension.
+    """
+    params: Dict[str, Any] = {
+        "metric": "l2",  # embeddings are normalized, so this ranks like cosine
+        "vector_column_name": "vector",
+        "index_type": index_type,
+        "num_partitions": max(1, min(4096, int(math.sqrt(num_rows)))),
+        "replace": True,
+    }
+    if index_type == "IVF_PQ":
+        sub_dim = next(d for d in (16, 8, 4, 2, 1) if dimension % d == 0)
+        params["num_sub_vectors"] = dimension // sub_dim
+    return params
+
+
+def vectors_to_arrow(vectors: np.ndarray, dtype: str = "float32") -> pa.FixedSizeListArray:
+    """
+    Wrap a (n, d) matrix as a fixed-size-list vector column
+
+    Arrow takes the NumPy buffer as is (no copy, no Python floats) when it is
+    already C-contiguous in the storage dtype; otherwise it is converted once.
+    """
+    matrix = np.ascontiguousarray(vectors, dtype=np.dtype(dtype))
+    return pa.FixedSizeListArray.from_arrays(pa.array(matrix.reshape(-1)), matrix.shape[1])
+
+
+def rescore_candidates(data: pa.Table, query_vector: np.ndarray, top_k: int) -> pa.Table:
+    """
+    Re-rank vector search candidates by exact float32 L2 distance, keeping top_k
+
+    Distances over float16 vectors lose precision where neighbors are close;
+    the short candidate list is cheap to score again in full precision.
+    """
+    if data.num_rows <= 1:
+        return data
+    query = np.asarray(query_vector, dtype=np.float32)
+    column = data.column("vector").combine_chunks()
+    vectors = column.flatten().to_numpy(zero_copy_only=False).reshape(-1, len(query))
+    distances = np.square(vectors.astype(np.float32) - query).sum(axis=1)
+    order = np.argsort(distances, kind="stable")[:top_k]
+    return data.take(pa.array(order))
+
+
+def entries_from_arrow(data: "pa.Table | pa.RecordBatch") -> List[MemoryEntryView]:
+    """
+    Convert query results to entry views in bulk
+
+    Each column is converted to Python once, then zipped into views; no
+    per-row dict, pydantic validation or list copies. Empty strings (our
+    stand-in for missing values) become None.
+    """
+    if data.num_rows == 0:
+        return []
+    ids, texts, keywords, timestamps, locations, persons, entities, topics = (
+        data.column(name).to_pylist() for name in ENTRY_COLUMNS
+    )
+    return [
+        MemoryEntryView(entry_id, text, kw or [], ts or None, loc or None, ps or [], es or [], topic or None)
+        for entry_id, text, kw, ts, loc, ps, es, topic
+        in zip(ids, texts, keywords, timestamps, locations, persons, entities, topics)
+    ]
+
+
+def reciprocal_rank_fusion(
+    rankings: Dict[str, List[MemoryEntryView]],
+    weights: Optional[Dict[str, float]] = None,
+    rrf_k: int = RRF_K,
+) -> List[Tuple[MemoryEntryView, float]]:
+    """
+    Fuse per-layer rankings into one, deduplicated by entry_id
+
+    Each layer adds weight / (rrf_k + rank) for every entry it returns. Ties
+    keep the order in which entries were first seen, so results are stable.
+    """
+    weights = weights or {}
+    scores: Dict[str, float] = {}
+    views: Dict[str, MemoryEntryView] = {}
+    for layer, ranked in rankings.items():
+        weight = weights.get(layer, 1.0)
+        if weight <= 0:
+            continue
+        seen = set()
+        for view in ranked:
+            if view.entry_id in seen:
+                continue
+            seen.add(view.entry_id)
+            scores[view.entry_id] = scores.get(view.entry_id, 0.0) + weight / (rrf_k + len(seen))
+            views.setdefault(view.entry_id, view)
+
+    order = {entry_id: i for i, entry_id in enumerate(views)}
+    ranked_ids = sorted(scores, key=lambda entry_id: (-scores[entry_id], order[entry_id]))
+    return [(views[entry_id], scores[entry_id]) for entry_id in ranked_ids]
+
+
 class VectorStore:
     """
     Structured Multi-View Indexing - Storage and retrieval for Atomic Entries
@@ -36,6 +225,32 @@ class VectorStore:
         self.db = lancedb.connect(self.db_path)
         self.table_name = table_name or config.MEMORY_TABLE_NAME
         self.table = None
+        self.fts_enabled = True
+        self._indices_ready = False
+        self._unindexed_rows = 0
+
+        # Rows added before the indices are updated. New rows are still
+        # searchable (flat-scanned) until the indices are optimized.
+        self.index_optimize_threshold = getattr(config, "INDEX_OPTIMIZE_THRESHOLD", 1000)
+
+        # ANN index: built once the table reaches ann_min_rows (below that a
+        # flat scan is fast and exact). nprobes/refine_factor trade recall
+        # for latency at query time.
+        self.ann_min_rows = getattr(config, "ANN_INDEX_MIN_ROWS", 10000)
+        self.ann_index_type = getattr(config, "ANN_INDEX_TYPE", "IVF_PQ")
+        self.nprobes = getattr(config, "ANN_NPROBES", 20)
+        self.refine_factor = getattr(config, "ANN_REFINE_FACTOR", 10)
+        self.ann_background = getattr(config, "ANN_BACKGROUND_INDEX", True)
+        self._ann_indexed_rows = 0
+        self._ann_thread: Optional[threading.Thread] = None
+        self._row_count = 0
+
+        # Vector column storage; an existing table keeps the type it was created with
+        self.vector_dtype = getattr(config, "VECTOR_STORAGE_DTYPE", "float32")
+        if self.vector_dtype not in VECTOR_DTYPES:
+            print(f"Warning: unsupported VECTOR_STORAGE_DTYPE {self.vector_dtype!r}, using float32")
+            self.vector_dtype = "float32"
+        self.rescore_multiplier = getattr(config, "VECTOR_RESCORE_MULTIPLIER", VECTOR_RESCORE_MULTIPLIER)
 
         self._init_table()
 
@@ -49,11 +264,12 @@ class VectorStore:
             pa.field("lossless_restatement", pa.string()),
             pa.field("keywords", pa.list_(pa.string())),
             pa.field("timestamp", pa.string()),
+            pa.field(TIMESTAMP_COLUMN, pa.timestamp("us")),
             pa.field("location", pa.string()),
             pa.field("persons", pa.list_(pa.string())),
             pa.field("entities", pa.list_(pa.string())),
             pa.field("topic", pa.string()),
-            pa.field("vector", pa.list_(pa.float32(), self.embedding_model.dimension))
+            pa.field("vector", pa.list_(VECTOR_DTYPES[self.vector_dtype], self.embedding_model.dimension))
         ])
 
         # Create table if it doesn't exist
@@ -63,138 +279,324 @@ class VectorStore:
         else:
             self.table = self.db.open_table(self.table_name)
             print(f"Opened existing table: {self.table_name}")
+            if TIMESTAMP_COLUMN not in self.table.schema.names:
+                try:
+                    self._migrate_timestamp_column(schema)
+                except Exception as e:
+                    self.table = self.db.open_table(self.table_name)
+                    print(f"Warning: Could not add {TIMESTAMP_COLUMN}, timestamp ranges will compare strings: {e}")
+            stored = self.table.schema.field("vector").type.value_type
+            if stored != VECTOR_DTYPES[self.vector_dtype]:
+                self.vector_dtype = next((name for name, t in VECTOR_DTYPES.items() if t == stored), "float32")
+                print(f"Table stores {self.vector_dtype} vectors; VECTOR_STORAGE_DTYPE applies to new tables only")
+
+        # Without the typed column (failed migration) ranges use the string column
+        self._typed_timestamps = TIMESTAMP_COLUMN in self.table.schema.names
+
+        # Cached row count; kept current by add_entries
+        self._row_count = self.table.count_rows()
+        self._ann_indexed_rows = self._find_ann_index_rows()
+
+        self._indices_ready = False
+        self._ensure_indices()
+        self._maybe_build_ann_index()
 
-    def add_entries(self, entries: List[MemoryEntry]):
+    def _migrate_timestamp_column(self, schema: pa.Schema):
+        """
+        Add the typed timestamp column to a table created before it existed
+
+        Existing string timestamps are parsed once and the table is rewritten
+        with the new column; empty or unparseable timestamps become null.
+        Lance cannot merge a column of nullable timestamps into an existing
+        dataset, so the rows are read and written back in one overwrite.
+        """
+        if self.table.count_rows() == 0:
+            self.db.drop_table(self.table_name)
+            self.table = self.db.create_table(self.table_name, schema=schema)
+            print(f"Recreated empty table with {TIMESTAMP_COLUMN}: {self.table_name}")
+            return
+
+        data = self.table.to_arrow()
+        parsed = pa.array(
+            [parse_timestamp(value) for value in data.column("timestamp").to_pylist()],
+            type=pa.timestamp("us"),
+        )
+        # Keep the stored column order and vector type; only the new column is added
+        data = data.append_column(pa.field(TIMESTAMP_COLUMN, pa.timestamp("us")), parsed)
+        self.table = self.db.create_table(self.table_name, data=data, mode="overwrite")
+        print(f"Added {TIMESTAMP_COLUMN} to {data.num_rows} existing entries "
+              f"({parsed.null_count} without a parseable timestamp)")
+
+    def _ensure_indices(self) -> bool:
+        """
+        Create the lexical (BM25) and symbolic (scalar) indices if missing
+
+        Indices are built once the table has rows. Until then, or if the
+        LanceDB version does not support an index type, searches scan.
+        """
+        if self._indices_ready:
+            return True
+        try:
+            if self._row_count == 0:
+                return False
+            indexed = {tuple(index.columns) for index in self.table.list_indices()}
+        except Exception as e:
+            print(f"Warning: Failed to list indices: {e}")
+            return False
+
+        if self.fts_enabled:
+            try:
+                for column in FTS_COLUMN_WEIGHTS:
+                    if (column,) not in indexed:
+                        self.table.create_fts_index(
+                            column,
+                            use_tantivy=False,
+                            with_position=False,
+                            lower_case=True,
+                            stem=True,
+                            replace=True,
+                        )
+            except Exception as e:
+                self.fts_enabled = False
+                print(f"Warning: Full-text index unavailable, keyword search will scan: {e}")
+
+        for column, index_type in SCALAR_INDEXES.items():
+            if (column,) in indexed or column not in self.table.schema.names:
+                continue
+            try:
+                self.table.create_scalar_index(column, index_type=index_type, replace=True)
+            except Exception as e:
+                print(f"Warning: Failed to create {index_type} index on {column}: {e}")
+
+        self._indices_ready = True
+        self._unindexed_rows = 0
+        return True
+
+    def _find_ann_index_rows(self) -> int:
+        """
+        Rows covered by an existing vector index (0 if there is none)
+        """
+        try:
+            for index in self.table.list_indices():
+                if list(index.columns) == ["vector"]:
+                    return self.table.index_stats(index.name).num_indexed_rows or self._row_count
+        except Exception as e:
+            print(f"Warning: Failed to inspect vector index: {e}")
+        return 0
+
+    def _maybe_build_ann_index(self):
+        """
+        Build or rebuild the ANN index when the table is large enough
+
+        Runs in a background thread unless ANN_BACKGROUND_INDEX is False;
+        searches keep working (flat or with the previous index) meanwhile.
+        """
+        if self._row_count < self.ann_min_rows:
+            return
+        if self._ann_indexed_rows and self._row_count < self._ann_indexed_rows * ANN_REBUILD_GROWTH:
+            return
+        if self._ann_thread is not None and self._ann_thread.is_alive():
+            return
+
+        num_rows = self._row_count
+        if not self.ann_background:
+            self._build_ann_index(num_rows)
+            return
+        self._ann_thread = threading.Thread(target=self._build_ann_index, args=(num_rows,), daemon=True)
+        self._ann_thread.start()
+
+    def _build_ann_index(self, num_rows: int):
+        try:
+            params = ann_index_params(num_rows, self.embedding_model.dimension, self.ann_index_type)
+            self.table.create_index(**params)
+            self._ann_indexed_rows = num_rows
+            print(f"Built {self.ann_index_type} index over {num_rows} entries")
+        except Exception as e:
+            print(f"Warning: Failed to build vector index: {e}")
+
+    def wait_for_index(self, timeout: Optional[float] = None):
+        """
+        Block until a background ANN index build (if any) finishes
+        """
+        if self._ann_thread is not None:
+            self._ann_thread.join(timeout)
+
+    def _update_indices(self, added: int):
+        """
+        Fold newly added rows into the indices once enough have accumulated
+        """
+        if not self._indices_ready:
+            self._ensure_indices()
+            return
+        self._unindexed_rows += added
+        if self._unindexed_rows < self.index_optimize_threshold:
+            return
+        try:
+            self.table.optimize()
+            self._unindexed_rows = 0
+        except Exception as e:
+            print(f"Warning: Failed to update indices: {e}")
+
+    def add_entries(self, entries: List[MemoryEntry], vectors: Optional[np.ndarray] = None):
         """
         Batch add memory entries
+
+        vectors (one row per entry) can be passed when already encoded,
+        e.g. by the embedding stage of the ingestion pipeline
         """
         if not entries:
             return
 
         # Generate vectors (encode documents without query prompt)
         restatements = [entry.lossless_restatement for entry in entries]
-        vectors = self.embedding_model.encode_documents(restatements)
-
-        # Build data
-        data = []
-        for entry, vector in zip(entries, vectors):
-            data.append({
-                "entry_id": entry.entry_id,
-                "lossless_restatement": entry.lossless_restatement,
-                "keywords": entry.keywords,
-                "timestamp": entry.timestamp or "",
-                "location": entry.location or "",
-                "persons": entry.persons,
-                "entities": entry.entities,
-                "topic": entry.topic or "",
-                "vector": vector.tolist()
-            })
+        if vectors is None:
+            vectors = self.embedding_model.encode_documents(restatements)
+
+        # Build data column-wise; the vectors go to Arrow as one buffer
+        columns = {
+            "entry_id": [entry.entry_id for entry in entries],
+            "lossless_restatement": restatements,
+            "keywords": [entry.keywords for entry in entries],
+            "timestamp": [entry.timestamp or "" for entry in entries],
+            TIMESTAMP_COLUMN: [parse_timestamp(entry.timestamp) for entry in entries],
+            "location": [entry.location or "" for entry in entries],
+            "persons": [entry.persons for entry in entries],
+            "entities": [entry.entities for entry in entries],
+            "topic": [entry.topic or "" for entry in entries],
+            "vector": vectors_to_arrow(vectors, self.vector_dtype),
+        }
+        if not self._typed_timestamps:
+            del columns[TIMESTAMP_COLUMN]
+        data = pa.table(columns, schema=self.table.schema)
 
         # Add to table
         self.table.add(data)
+        self._row_count += data.num_rows
+        self._update_indices(data.num_rows)
+        self._maybe_build_ann_index()
         print(f"Added {len(entries)} memory entries")
 
-    def semantic_search(self, query: str, top_k: int = 5) -> List[MemoryEntry]:
+    def semantic_search(self, query: str, top_k: int = 5) -> List[MemoryEntryView]:
         """
         Semantic Layer Search - Dense vector similarity
 
         Paper Reference: Section 3.1
         Retrieves based on v_k = E_dense(S_k) where S_k is the lossless restatement
+        Uses the ANN index once built, otherwise an exact flat scan
+        """
+        return self._semantic_candidates(query, top_k)
+
+    def _semantic_candidates(self, query: str, top_k: int, where: Optional[str] = None) -> List[MemoryEntryView]:
+        """
+        Vector search, optionally restricted by a SQL predicate applied before the ANN scan
         """
         try:
             # Check if table is empty
-            if self.table.count_rows() == 0:
+            if self._row_count == 0:
                 return []
 
             # Generate query vector (use query prompt optimization for Qwen3)
             query_vector = self.embedding_model.encode_single(query, is_query=True)
 
-            # Execute vector search
-            results = self.table.search(query_vector.tolist()).limit(top_k).to_list()
-
-            # Convert to MemoryEntry objects
-            entries = []
-            for result in results:
-                try:
-                    entry = MemoryEntry(
-                        entry_id=result["entry_id"],
-                        lossless_restatement=result["lossless_restatement"],
-                        keywords=list(result["keywords"]) if result["keywords"] is not None else [],
-                        timestamp=result["timestamp"] if result["timestamp"] else None,
-                        location=result["location"] if result["location"] else None,
-                        persons=list(result["persons"]) if result["persons"] is not None else [],
-                        entities=list(result["entities"]) if result["entities"] is not None else [],
-                        topic=result["topic"] if result["topic"] else None
-                    )
-                    entries.append(entry)
-                except Exception as e:
-                    print(f"Warning: Failed to parse search result: {e}")
-                    continue
-
-            return entries
+            # Execute vector search; quantized storage over-fetches for rescoring
+            rescore = self.vector_dtype != "float32" and self.rescore_multiplier > 1
+            columns = ENTRY_COLUMNS + [DISTANCE_COLUMN] + (["vector"] if rescore else [])
+            limit = top_k * self.rescore_multiplier if rescore else top_k
+            search = self.table.search(query_vector.tolist()).select(columns).limit(limit)
+            if where:
+                search = search.where(where, prefilter=True)
+            if self._ann_indexed_rows:
+                search = search.nprobes(self.nprobes).refine_factor(self.refine_factor)
+            data = search.to_arrow()
+            if rescore:
+                data = rescore_candidates(data, query_vector, top_k)
+            return entries_from_arrow(data)
 
         except Exception as e:
             print(f"Error during semantic search: {e}")
             return []
 
-    def keyword_search(self, keywords: List[str], top_k: int = 3) -> List[MemoryEntry]:
+    def keyword_search(self, keywords: List[str], top_k: int = 3) -> List[MemoryEntryView]:
         """
         Lexical Layer Search - Sparse keyword matching
 
         Paper Reference: Section 3.1
         Retrieves based on h_k = Sparse(S_k) for precise term and entity matching
-        Uses inclusion-based scoring (approximates BM25)
+        Ranked by BM25 over the keyword list and restatement text
+        """
+        return [entry for entry, _ in self.keyword_search_with_scores(keywords, top_k)]
+
+    def keyword_search_with_scores(
+        self, keywords: List[str], top_k: int = 3, where: Optional[str] = None
+    ) -> List[Tuple[MemoryEntryView, float]]:
         """
+        Lexical Layer Search returning (entry, score) pairs, best first
+
+        Uses the BM25 inverted indices: one FTS query per indexed column, with
+        scores combined by FTS_COLUMN_WEIGHTS. Only matching rows are read.
+        An optional SQL predicate restricts the rows searched.
+        """
+        terms = list(dict.fromkeys(str(kw).strip() for kw in keywords or [] if str(kw).strip()))
+        if not terms:
+            return []
+        if not (self._indices_ready and self.fts_enabled):
+            return self._keyword_scan(terms, top_k, where)
+
         try:
-            # Get all entries (should use more efficient method in production)
-            all_entries = self.table.to_pandas()
+            query = " ".join(terms)
+            limit = max(top_k, 1) * FTS_CANDIDATE_MULTIPLIER
+            scores: Dict[str, float] = {}
+            views: Dict[str, MemoryEntryView] = {}
+            for column, weight in FTS_COLUMN_WEIGHTS.items():
+                search = self.table.search(query, query_type="fts", fts_columns=column)
+                if where:
+                    search = search.where(where, prefilter=True)
+                results = search.select(ENTRY_COLUMNS + [SCORE_COLUMN]).limit(limit).to_arrow()
+                column_scores = results.column(SCORE_COLUMN).to_pylist()
+                for view, score in zip(entries_from_arrow(results), column_scores):
+                    scores[view.entry_id] = scores.get(view.entry_id, 0.0) + weight * float(score or 0.0)
+                    views.setdefault(view.entry_id, view)
+
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+            return [(views[entry_id], score) for entry_id, score in ranked]
 
-            # Handle empty table
-            if len(all_entries) == 0:
-                return []
+        except Exception as e:
+            print(f"Error during full-text keyword search, falling back to scan: {e}")
+            return self._keyword_scan(terms, top_k, where)
 
-            # Handle empty keywords
-            if not keywords:
-                return []
+    def _keyword_scan(
+        self, keywords: List[str], top_k: int, where: Optional[str] = None
+    ) -> List[Tuple[MemoryEntryView, float]]:
+        """
+        Inclusion-based keyword scoring over the whole table
 
-            # Calculate matching scores
+        Fallback for when the FTS indices are unavailable; linear in table size.
+        """
+        try:
+            lowered = [str(kw).lower() for kw in keywords]
+            query = self.table.search().select(ENTRY_COLUMNS).limit(None)
+            if where:
+                query = query.where(where)
             scored_entries = []
-            for _, row in all_entries.iterrows():
-                try:
-                    score = 0
-                    # Convert to list to avoid array truth value ambiguity
-                    row_keywords = list(row["keywords"]) if row["keywords"] is not None else []
-                    row_text = str(row["lossless_restatement"]).lower()
-
-                    for kw in keywords:
-                        kw_lower = str(kw).lower()
-                        # Keyword list matching
-                        if len(row_keywords) > 0 and any(kw_lower in str(rk).lower() for rk in row_keywords):
-                            score += 2
-                        # Text matching
-                        if kw_lower in row_text:
-                            score += 1
-
-                    if score > 0:
-                        # Convert arrays to lists for MemoryEntry
-                        entry = MemoryEntry(
-                            entry_id=row["entry_id"],
-                            lossless_restatement=row["lossless_restatement"],
-                            keywords=list(row["keywords"]) if row["keywords"] is not None else [],
-                            timestamp=row["timestamp"] if row["timestamp"] else None,
-                            location=row["location"] if row["location"] else None,
-                            persons=list(row["persons"]) if row["persons"] is not None else [],
-                            entities=list(row["entities"]) if row["entities"] is not None else [],
-                            topic=row["topic"] if row["topic"] else None
-                        )
-                        scored_entries.append((score, entry))
-                except Exception as e:
-                    print(f"Warning: Failed to process row in keyword search: {e}")
-                    continue
+            for entry in entries_from_arrow(query.to_arrow()):
+                row_keywords = [str(rk).lower() for rk in entry.keywords]
+                row_text = str(entry.lossless_restatement).lower()
+
+                score = 0
+                for kw_lower in lowered:
+                    # Keyword list matching
+                    if any(kw_lower in rk for rk in row_keywords):
+                        score += 2
+                    # Text matching
+                    if kw_lower in row_text:
+                        score += 1
+
+                if score > 0:
+                    scored_entries.append((entry, float(score)))
 
             # Sort by score and return top_k
-            scored_entries.sort(reverse=True, key=lambda x: x[0])
-            return [entry for _, entry in scored_entries[:top_k]]
+            scored_entries.sort(reverse=True, key=lambda x: x[1])
+            return scored_entries[:top_k]
 
         except Exception as e:
             print(f"Error during keyword search: {e}")
@@ -207,7 +609,7 @@ class VectorStore:
         location: Optional[str] = None,
         entities: Optional[List[str]] = None,
         top_k: Optional[int] = None
-    ) -> List[MemoryEntry]:
+    ) -> List[MemoryEntryView]:
         """
         Symbolic Layer Search - Metadata-based deterministic filtering
 
@@ -215,6 +617,10 @@ class VectorStore:
         Retrieves based on R_k = {(key, val)} for structured constraints
         Enables precise filtering by time, entities, persons, and locations
 
+        Matches are ranked by how many of the requested persons and entities
+        they mention, then newest first (entries without a parseable
+        timestamp last), so top_k keeps the most specific, recent entries.
+
         Args:
             persons: Filter by person names
             timestamp_range: Filter by time range (start, end)
@@ -222,75 +628,15 @@ class VectorStore:
             entities: Filter by entities
             top_k: Maximum number of results to return (default: no limit)
         """
-        try:
-            df = self.table.to_pandas()
-
-            # Handle empty dataframe
-            if len(df) == 0:
-                return []
-
-            # If no filters provided, return empty
-            if not any([persons, timestamp_range, location, entities]):
-                return []
-
-            # Apply filters using numpy array for proper pandas boolean indexing
-            mask = np.ones(len(df), dtype=bool)
-
-            if persons:
-                person_mask = np.array([
-                    any(p in list(row["persons"]) for p in persons) if row["persons"] is not None else False
-                    for _, row in df.iterrows()
-                ])
-                mask = mask & person_mask
-
-            if location:
-                location_mask = np.array([
-                    location.lower() in str(row["location"]).lower() if row["location"] is not None else False
-                    for _, row in df.iterrows()
-                ])
-                mask = mask & location_mask
-
-            if entities:
-                entity_mask = np.array([
-                    any(e in list(row["entities"]) for e in entities) if row["entities"] is not None else False
-                    for _, row in df.iterrows()
-                ])
-                mask = mask & entity_mask
-
-            if timestamp_range:
-                start_time, end_time = timestamp_range
-                timestamp_mask = np.array([
-                    bool(row["timestamp"] and start_time <= row["timestamp"] <= end_time)
-                    for _, row in df.iterrows()
-                ])
-                mask = mask & timestamp_mask
-
-            # Build results - use numpy boolean array for filtering
-            filtered_df = df[mask]
-
-            # Limit results if top_k is specified
-            if top_k is not None and len(filtered_df) > top_k:
-                filtered_df = filtered_df.head(top_k)
-
-            entries = []
-            for _, row in filtered_df.iterrows():
-                try:
-                    entry = MemoryEntry(
-                        entry_id=row["entry_id"],
-                        lossless_restatement=row["lossless_restatement"],
-                        keywords=list(row["keywords"]) if row["keywords"] is not None else [],
-                        timestamp=row["timestamp"] if row["timestamp"] else None,
-                        location=row["location"] if row["location"] else None,
-                        persons=list(row["persons"]) if row["persons"] is not None else [],
-                        entities=list(row["entities"]) if row["entities"] is not None else [],
-                        topic=row["topic"] if row["topic"] else None
-                    )
-                    entries.append(entry)
-                except Exception as e:
-                    print(f"Warning: Failed to parse filtered row: {e}")
-                    continue
+        # If no filters provided, return empty
+        if not any([persons, timestamp_range, location, entities]):
+            return []
 
-            return entries
+        try:
+            predicate = self._structured_predicate(persons, timestamp_range, location, entities)
+            query = self.table.search().where(predicate).select(ENTRY_COLUMNS).limit(None)
+            entries = self._symbolic_order(entries_from_arrow(query.to_arrow()), (persons or []) + (entities or []))
+            return entries[:top_k] if top_k is not None else entries
 
         except Exception as e:
             print(f"Error during structured search: {e}")
@@ -298,30 +644,131 @@ class VectorStore:
             traceback.print_exc()
             return []
 
-    def get_all_entries(self) -> List[MemoryEntry]:
-        """
-        Get all memory entries
-        """
-        df = self.table.to_pandas()
-        entries = []
-        for _, row in df.iterrows():
-            entry = MemoryEntry(
-                entry_id=row["entry_id"],
-                lossless_restatement=row["lossless_restatement"],
-                keywords=list(row["keywords"]) if row["keywords"] is not None else [],
-                timestamp=row["timestamp"] if row["timestamp"] else None,
-                location=row["location"] if row["location"] else None,
-                persons=list(row["persons"]) if row["persons"] is not None else [],
-                entities=list(row["entities"]) if row["entities"] is not None else [],
-                topic=row["topic"] if row["topic"] else None
-            )
-            entries.append(entry)
+    @staticmethod
+    def _symbolic_order(entries: List[MemoryEntryView], values: List[str]) -> List[MemoryEntryView]:
+        """
+        Sort filter matches by matched persons/entities, then timestamp descending
+        """
+        wanted = set(values)
+        # Two stable sorts: recency (undated last) breaks ties in match count
+        entries = sorted(entries, key=lambda entry: parse_timestamp(entry.timestamp) or datetime.min, reverse=True)
+        entries.sort(key=lambda entry: len(wanted.intersection(entry.persons + entry.entities)), reverse=True)
         return entries
 
+    def _structured_predicate(
+        self,
+        persons: Optional[List[str]] = None,
+        timestamp_range: Optional[tuple] = None,
+        location: Optional[str] = None,
+        entities: Optional[List[str]] = None,
+    ) -> str:
+        """
+        Build the SQL filter pushed down to LanceDB for structured_search
+
+        Persons and entities match if any listed value is present; location
+        is a case-insensitive substring; the timestamp range is inclusive and
+        compared as datetimes (a date-only end covers that whole day), or as
+        strings if the bounds do not parse or the table has no typed column.
+        """
+        clauses = []
+        if persons:
+            clauses.append(f"array_has_any(persons, {_sql_list(persons)})")
+        if entities:
+            clauses.append(f"array_has_any(entities, {_sql_list(entities)})")
+        if location:
+            clauses.append(f"strpos(lower(location), {_sql_literal(location.lower())}) > 0")
+        if timestamp_range:
+            start_time, end_time = timestamp_range
+            start, end = parse_timestamp(start_time), parse_timestamp(end_time, end_of_day=True)
+            if self._typed_timestamps and start is not None and end is not None:
+                # Range scan on the BTREE-indexed typed column
+                clauses.append(
+                    f"{TIMESTAMP_COLUMN} >= {_sql_timestamp(start)} AND {TIMESTAMP_COLUMN} <= {_sql_timestamp(end)}"
+                )
+            else:
+                clauses.append(
+                    f"timestamp != '' AND timestamp >= {_sql_literal(start_time)} "
+                    f"AND timestamp <= {_sql_literal(end_time)}"
+                )
+        return " AND ".join(f"({clause})" for clause in clauses)
+
+    def hybrid_search(
+        self,
+        query: str,
+        keywords: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        k: int = 10,
+        weights: Optional[Dict[str, float]] = None,
+        rrf_k: int = RRF_K,
+    ) -> List[MemoryEntryView]:
+        """
+        Multi-View Retrieval - all three layers in one call
+
+        Runs the semantic, lexical and symbolic layers concurrently and fuses
+        their rankings with reciprocal rank fusion, deduplicated by entry_id.
+        Symbolic filters restrict the candidates of every layer (prefiltered
+        before the ANN and FTS scans) and also form a ranking of their own,
+        ordered by matched persons/entities and then recency.
+
+        Args:
+            query: Natural-language query for the semantic layer
+            keywords: Terms for the lexical layer (default: the query text)
+            filters: structured_search arguments: persons, timestamp_range,
+                location, entities
+            k: Number of results
+            weights: Per-layer fusion weights overriding HYBRID_LAYER_WEIGHTS
+            rrf_k: RRF rank offset; larger values flatten the rank curve
+        """
+        return [entry for entry, _ in self.hybrid_search_with_scores(query, keywords, filters, k, weights, rrf_k)]
+
+    def hybrid_search_with_scores(
+        self,
+        query: str,
+        keywords: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        k: int = 10,
+        weights: Optional[Dict[str, float]] = None,
+        rrf_k: int = RRF_K,
+    ) -> List[Tuple[MemoryEntryView, float]]:
+        """
+        hybrid_search returning (entry, fused score) pairs, best first
+        """
+        if self._row_count == 0:
+            return []
+
+        filters = {key: value for key, value in (filters or {}).items() if value}
+        where = self._structured_predicate(**filters) if filters else None
+        limit = max(k, 1) * HYBRID_CANDIDATE_MULTIPLIER
+        terms = keywords or [query]
+
+        layers = {
+            "semantic": lambda: self._semantic_candidates(query, limit, where),
+            "lexical": lambda: [entry for entry, _ in self.keyword_search_with_scores(terms, limit, where)],
+        }
+        if where:
+            layers["symbolic"] = lambda: self.structured_search(**filters, top_k=limit)
+
+        if getattr(config, "ENABLE_PARALLEL_RETRIEVAL", True):
+            with ThreadPoolExecutor(max_workers=len(layers)) as executor:
+                futures = {layer: executor.submit(run) for layer, run in layers.items()}
+                rankings = {layer: future.result() for layer, future in futures.items()}
+        else:
+            rankings = {layer: run() for layer, run in layers.items()}
+
+        fused = reciprocal_rank_fusion(rankings, {**HYBRID_LAYER_WEIGHTS, **(weights or {})}, rrf_k)
+        return fused[:k]
+
+    def get_all_entries(self) -> List[MemoryEntryView]:
+        """
+        Get all memory entries (without reading the vectors)
+        """
+        return entries_from_arrow(self.table.search().select(ENTRY_COLUMNS).limit(None).to_arrow())
+
     def clear(self):
         """
         Clear all data
         """
+        self.wait_for_index()
         self.db.drop_table(self.table_name)
         self._init_table()
         print("Database cleared")
@@ -1,6 +1,6 @@
 """
 Models package
 """
-from .memory_entry import MemoryEntry, Dialogue
+from .memory_entry import MemoryEntry, MemoryEntryView, Dialogue
 
-__all__ = ['MemoryEntry', 'Dialogue']
+__all__ = ['MemoryEntry', 'MemoryEntryView', 'Dialogue']
@@ -5,7 +5,7 @@ Paper Reference: Section 3.1 - Atomic Entries {m_k}
 Each MemoryEntry represents a self-contained, disambiguated fact extracted
 from dialogue via the De-linearization transformation F_θ
 """
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 import uuid
 
@@ -69,6 +69,55 @@ class MemoryEntry(BaseModel):
         }
 
 
+class MemoryEntryView:
+    """
+    Read-only view of a stored Atomic Entry, built without pydantic validation
+
+    VectorStore returns these for data read back from its own table, where
+    the values were already validated on insert. Attribute access matches
+    MemoryEntry; to_entry() builds the full model on demand.
+    """
+    __slots__ = ("entry_id", "lossless_restatement", "keywords", "timestamp",
+                 "location", "persons", "entities", "topic")
+
+    def __init__(
+        self,
+        entry_id: str,
+        lossless_restatement: str,
+        keywords: List[str],
+        timestamp: Optional[str],
+        location: Optional[str],
+        persons: List[str],
+        entities: List[str],
+        topic: Optional[str],
+    ):
+        self.entry_id = entry_id
+        self.lossless_restatement = lossless_restatement
+        self.keywords = keywords
+        self.timestamp = timestamp
+        self.location = location
+        self.persons = persons
+        self.entities = entities
+        self.topic = topic
+
+    def model_dump(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_entry(self) -> MemoryEntry:
+        """
+        Build the pydantic MemoryEntry (skipping validation, as for the view)
+        """
+        return MemoryEntry.model_construct(**self.model_dump())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (MemoryEntryView, MemoryEntry)):
+            return self.model_dump() == other.model_dump()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MemoryEntryView(entry_id={self.entry_id!r}, lossless_restatement={self.lossless_restatement!r})"
+
+
 class Dialogue(BaseModel):
     """
     Original dialogue entry
@@ -2,6 +2,6 @@
 Utils package
 """
 from .llm_client import LLMClient
-from .embedding import EmbeddingModel
+from .embedding import EmbeddingModel, EmbeddingCache
 
-__all__ = ['LLMClient', 'EmbeddingModel']
+__all__ = ['LLMClient', 'EmbeddingModel', 'EmbeddingCache']
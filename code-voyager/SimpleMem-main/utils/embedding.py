@@ -1,22 +1,251 @@
 """
 Embedding utilities - Generate vector embeddings using SentenceTransformers
 Supports Qwen3 Embedding models through SentenceTransformers interface
+
+Encodings are cached (in-memory LRU, optionally backed by SQLite) by a hash
+of model, query/document kind and text, so repeated queries from planning
+and reflection rounds and re-added restatements are encoded once.
+Concurrent encode_single calls from retrieval threads are grouped into one
+forward pass by a MicroBatcher.
+
+On CPU hosts the model can run through ONNX Runtime or with int8 dynamic
+quantization of its linear layers (EMBEDDING_BACKEND), with a fixed thread
+count and an optional cache of tokenized texts.
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future
+import hashlib
+import queue
+import sqlite3
+import threading
+import time
 import numpy as np
 import config
 import os
 
 
+class EmbeddingCache:
+    """
+    Embedding cache - in-memory LRU in front of an optional SQLite file
+    """
+    def __init__(self, max_entries: int = 10000, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: Embedding cache file unavailable ({e}), using memory only")
+                self._db = None
+
+    @staticmethod
+    def key(model_name: str, text: str, is_query: bool) -> str:
+        kind = "query" if is_query else "document"
+        return hashlib.sha256(f"{model_name}\0{kind}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up cached vectors; missing keys are left out of the result
+        """
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+
+            missing = list({key for key in keys if key not in found})
+            if missing and self._db is not None:
+                try:
+                    for start in range(0, len(missing), 500):
+                        chunk = missing[start:start + 500]
+                        rows = self._db.execute(
+                            f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                        ).fetchall()
+                        for key, blob in rows:
+                            found[key] = np.frombuffer(blob, dtype=np.float32)
+                            self._remember(key, found[key])
+                except sqlite3.Error as e:
+                    print(f"Warning: Embedding cache read failed: {e}")
+
+            hits = sum(1 for key in keys if key in found)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return found
+
+    def put_many(self, vectors: Dict[str, np.ndarray]):
+        with self._lock:
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+            if self._db is not None:
+                try:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        [(key, np.asarray(vector, dtype=np.float32).tobytes()) for key, vector in vectors.items()],
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    print(f"Warning: Embedding cache write failed: {e}")
+
+    def _remember(self, key: str, vector: np.ndarray):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.0,
+                "memory_entries": len(self._memory)}
+
+
+class TokenizationCache:
+    """
+    LRU cache of token ids per text, in front of a SentenceTransformer module's tokenize()
+
+    Misses are tokenized together without padding; each batch is then padded
+    from the cached ids, so repeated texts skip the tokenizer.
+    """
+    def __init__(self, module, max_entries: int = 10000):
+        self.module = module
+        self.tokenizer = module.tokenizer
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Dict[str, List[int]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._tokenize = module.tokenize
+        module.tokenize = self.tokenize
+
+    def tokenize(self, texts, padding=True, **kwargs):
+        if kwargs or padding is not True or not all(isinstance(text, str) for text in texts):
+            return self._tokenize(texts, padding=padding, **kwargs)
+
+        # Same normalization as sentence_transformers.models.Transformer.tokenize
+        texts = [text.strip() for text in texts]
+        if getattr(self.module, "do_lower_case", False):
+            texts = [text.lower() for text in texts]
+
+        with self._lock:
+            found = {}
+            for text in texts:
+                ids = self._entries.get(text)
+                if ids is not None:
+                    self._entries.move_to_end(text)
+                    found[text] = ids
+            self.hits += sum(1 for text in texts if text in found)
+            self.misses += sum(1 for text in texts if text not in found)
+
+        missing = list(dict.fromkeys(text for text in texts if text not in found))
+        if missing:
+            encoded = self.tokenizer(missing, padding=False, truncation="longest_first",
+                                     max_length=self.module.max_seq_length)
+            fresh = {text: {name: encoded[name][i] for name in encoded} for i, text in enumerate(missing)}
+            with self._lock:
+                for text, ids in fresh.items():
+                    self._entries[text] = ids
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            found.update(fresh)
+
+        return self.tokenizer.pad([found[text] for text in texts], padding=True, return_tensors="pt")
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._entries)}
+
+
+class MicroBatcher:
+    """
+    Groups concurrent encode_single calls into one forward pass
+
+    A background thread takes the first waiting request, then collects more
+    (up to batch_size) while other callers are still waiting, for at most
+    max_wait_ms. A lone caller is encoded immediately, with no added wait.
+    """
+    def __init__(self, encode_fn, batch_size: int = 32, max_wait_ms: float = 5.0):
+        self._encode = encode_fn
+        self.batch_size = batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "queue.Queue[Tuple[str, bool, Future]]" = queue.Queue()
+        self._inflight = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str, is_query: bool = False) -> np.ndarray:
+        future: Future = Future()
+        with self._lock:
+            self._inflight += 1
+        try:
+            self._queue.put((text, is_query, future))
+            return future.result()
+        finally:
+            with self._lock:
+                self._inflight -= 1
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.batch_size and self._inflight > len(batch):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            for is_query in (True, False):
+                group = [item for item in batch if item[1] == is_query]
+                if not group:
+                    continue
+                try:
+                    vectors = self._encode([text for text, _, _ in group], is_query)
+                    for (_, _, future), vector in zip(group, vectors):
+                        future.set_result(vector)
+                except Exception as e:
+                    for _, _, future in group:
+                        future.set_exception(e)
+
+
+# Inference backends: PyTorch as loaded, ONNX Runtime on CPU, or PyTorch with
+# int8 dynamic quantization of the linear layers
+EMBEDDING_BACKENDS = ("torch", "onnx", "torch_int8")
+
+
 class EmbeddingModel:
     """
     Embedding model using SentenceTransformers (supports Qwen3 and other models)
     """
-    def __init__(self, model_name: str = None, use_optimization: bool = True):
+    def __init__(self, model_name: str = None, use_optimization: bool = True,
+                 batch_size: Optional[int] = None, use_cache: bool = True,
+                 use_microbatching: Optional[bool] = None, backend: Optional[str] = None,
+                 num_threads: Optional[int] = None):
         self.model_name = model_name or config.EMBEDDING_MODEL
         self.use_optimization = use_optimization
-        
-        print(f"Loading embedding model: {self.model_name}")
+        self.batch_size = batch_size or getattr(config, "EMBEDDING_BATCH_SIZE", 32)
+        self.backend = backend or getattr(config, "EMBEDDING_BACKEND", "torch")
+        if self.backend not in EMBEDDING_BACKENDS:
+            print(f"Warning: unknown EMBEDDING_BACKEND {self.backend!r}, using torch")
+            self.backend = "torch"
+        self.num_threads = num_threads or getattr(config, "EMBEDDING_NUM_THREADS", None)
+        if self.num_threads:
+            import torch
+            torch.set_num_threads(self.num_threads)
+
+        print(f"Loading embedding model: {self.model_name} (backend: {self.backend})")
         
         # Check if it's a Qwen3 model (through SentenceTransformers)
         if self.model_name.startswith("qwen3"):
@@ -24,6 +253,23 @@ class EmbeddingModel:
         else:
             self._init_standard_sentence_transformer()
 
+        token_cache_size = getattr(config, "EMBEDDING_TOKEN_CACHE_SIZE", 0)
+        self.token_cache = TokenizationCache(self.model[0], token_cache_size) \
+            if token_cache_size > 0 and hasattr(self.model[0], "tokenizer") else None
+
+        # Created after loading, so keys use the model and backend actually
+        # loaded (after any fallback); quantized backends give different vectors
+        self.cache_name = self.model_name if self.backend == "torch" else f"{self.model_name}@{self.backend}"
+        cache_size = getattr(config, "EMBEDDING_CACHE_SIZE", 10000)
+        self.cache = EmbeddingCache(cache_size, getattr(config, "EMBEDDING_CACHE_PATH", None)) \
+            if use_cache and cache_size > 0 else None
+
+        if use_microbatching is None:
+            use_microbatching = getattr(config, "EMBEDDING_MICROBATCH", True)
+        self.batcher = MicroBatcher(
+            self.encode, self.batch_size, getattr(config, "EMBEDDING_MICROBATCH_WAIT_MS", 5.0)
+        ) if use_microbatching else None
+
     def _init_qwen3_sentence_transformer(self):
         """Initialize Qwen3 model using SentenceTransformers"""
         try:
@@ -39,8 +285,8 @@ class EmbeddingModel:
             model_path = qwen3_models.get(self.model_name, self.model_name)
             print(f"Loading Qwen3 model via SentenceTransformers: {model_path}")
             
-            # Initialize with optimization settings
-            if self.use_optimization:
+            # Initialize with optimization settings (flash attention needs a GPU)
+            if self.use_optimization and self.backend == "torch" and _cuda_available():
                 try:
                     # Try to use flash_attention_2 and left padding for better performance
                     self.model = SentenceTransformer(
@@ -55,9 +301,9 @@ class EmbeddingModel:
                     print("Qwen3 loaded with flash_attention_2 optimization")
                 except Exception as e:
                     print(f"Flash attention failed ({e}), using standard loading...")
-                    self.model = SentenceTransformer(model_path, trust_remote_code=True)
+                    self.model = self._load_sentence_transformer(model_path, trust_remote_code=True)
             else:
-                self.model = SentenceTransformer(model_path, trust_remote_code=True)
+                self.model = self._load_sentence_transformer(model_path, trust_remote_code=True)
             
             self.dimension = self.model.get_sentence_embedding_dimension()
             self.model_type = "qwen3_sentence_transformer"
@@ -77,8 +323,7 @@ class EmbeddingModel:
     def _init_standard_sentence_transformer(self):
         """Initialize standard SentenceTransformer model"""
         try:
-            from sentence_transformers import SentenceTransformer
-            self.model = SentenceTransformer(self.model_name)
+            self.model = self._load_sentence_transformer(self.model_name)
             self.dimension = self.model.get_sentence_embedding_dimension()
             self.model_type = "sentence_transformer"
             self.supports_query_prompt = False
@@ -87,6 +332,34 @@ class EmbeddingModel:
             print(f"Failed to load SentenceTransformer model: {e}")
             raise
 
+    def _load_sentence_transformer(self, model_path: str, **kwargs):
+        """Load a SentenceTransformer with the configured CPU backend"""
+        from sentence_transformers import SentenceTransformer
+
+        if self.backend == "onnx":
+            try:
+                model_kwargs: Dict[str, Any] = {"provider": "CPUExecutionProvider"}
+                if self.num_threads:
+                    import onnxruntime
+                    session_options = onnxruntime.SessionOptions()
+                    session_options.intra_op_num_threads = self.num_threads
+                    model_kwargs["session_options"] = session_options
+                return SentenceTransformer(model_path, backend="onnx", model_kwargs=model_kwargs, **kwargs)
+            except Exception as e:
+                print(f"ONNX backend failed ({e}), using PyTorch...")
+                self.backend = "torch"
+
+        model = SentenceTransformer(model_path, **kwargs)
+        if self.backend == "torch_int8":
+            import torch
+            module = model[0]
+            module.auto_model = torch.ao.quantization.quantize_dynamic(
+                module.auto_model.to("cpu"), {torch.nn.Linear}, dtype=torch.qint8
+            )
+            model.to("cpu")
+            print("Linear layers quantized to int8 (dynamic)")
+        return model
+
     def _fallback_to_sentence_transformer(self):
         """Fallback to default SentenceTransformer model"""
         fallback_model = "sentence-transformers/all-MiniLM-L6-v2"
@@ -104,7 +377,24 @@ class EmbeddingModel:
         """
         if isinstance(texts, str):
             texts = [texts]
-        
+        if self.cache is None:
+            return self._encode_uncached(texts, is_query)
+
+        keys = [EmbeddingCache.key(self.cache_name, text, is_query) for text in texts]
+        vectors = self.cache.get_many(keys)
+        missing = list(dict.fromkeys(text for text, key in zip(texts, keys) if key not in vectors))
+        if missing:
+            fresh = {
+                EmbeddingCache.key(self.cache_name, text, is_query): vector
+                for text, vector in zip(missing, self._encode_uncached(missing, is_query))
+            }
+            self.cache.put_many(fresh)
+            vectors.update(fresh)
+        if not keys:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.stack([vectors[key] for key in keys])
+
+    def _encode_uncached(self, texts: List[str], is_query: bool) -> np.ndarray:
         # Use query prompt for Qwen3 models when encoding queries
         if self.model_type == "qwen3_sentence_transformer" and self.supports_query_prompt and is_query:
             return self._encode_with_query_prompt(texts)
@@ -119,6 +409,8 @@ class EmbeddingModel:
         - text: Text to encode
         - is_query: Whether this is a query text (for Qwen3 prompt optimization)
         """
+        if self.batcher is not None:
+            return self.batcher.submit(text, is_query)
         return self.encode([text], is_query=is_query)[0]
     
     def encode_query(self, queries: List[str]) -> np.ndarray:
@@ -139,6 +431,7 @@ class EmbeddingModel:
             embeddings = self.model.encode(
                 texts, 
                 prompt_name="query",  # Use Qwen3's query prompt
+                batch_size=self.batch_size,
                 show_progress_bar=False,
                 normalize_embeddings=True
             )
@@ -151,7 +444,28 @@ class EmbeddingModel:
         """Encode texts using standard method"""
         embeddings = self.model.encode(
             texts, 
+            batch_size=self.batch_size,
             show_progress_bar=False,
             normalize_embeddings=True
         )
         return embeddings
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Embedding cache hit/miss counts (empty if caching is off)
+        """
+        return self.cache.stats() if self.cache is not None else {}
+
+    def token_cache_stats(self) -> Dict[str, Any]:
+        """
+        Tokenization cache hit/miss counts (empty if it is off)
+        """
+        return self.token_cache.stats() if self.token_cache is not None else {}
+
+
+def _cuda_available() -> bool:
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
@@ -2,10 +2,22 @@
 LLM Client - Handles all LLM interactions
 """
 import json
+import time
 from typing import List, Dict, Any, Optional
 from openai import OpenAI
 import config
 
+try:
+    from voyager.ratelimit import (
+        backoff_delay,
+        estimate_request_tokens,
+        get_rate_limiter,
+        limiter_for_provider,
+        penalize_if_rate_limited,
+    )
+except ImportError:  # Running standalone, without code-voyager
+    get_rate_limiter = None
+
 
 class LLMClient:
     """
@@ -25,8 +37,9 @@ class LLMClient:
         self.enable_thinking = enable_thinking if enable_thinking is not None else config.ENABLE_THINKING
         self.use_streaming = use_streaming if use_streaming is not None else config.USE_STREAMING
 
-        # Initialize OpenAI client with optional base_url
-        client_kwargs = {"api_key": self.api_key}
+        # Initialize OpenAI client with optional base_url. SDK retries are off:
+        # chat_completion retries with rate-limit-aware backoff itself.
+        client_kwargs = {"api_key": self.api_key, "max_retries": 0}
         if self.base_url:
             client_kwargs["base_url"] = self.base_url
             print(f"Using custom OpenAI base URL: {self.base_url}")
@@ -35,6 +48,34 @@ class LLMClient:
             print(f"Deep thinking mode enabled")
 
         self.client = OpenAI(**client_kwargs)
+        self.rate_limiter = self._create_rate_limiter()
+
+    def _create_rate_limiter(self):
+        """
+        Create the shared rate limiter, or None when voyager is not available
+        """
+        if get_rate_limiter is None:
+            return None
+        provider = getattr(config, "LLM_RATE_LIMIT_PROVIDER", None)
+        if provider:
+            return limiter_for_provider(provider)
+        return get_rate_limiter(
+            "simplemem",
+            shared=getattr(config, "LLM_SHARED_RATE_LIMIT", False),
+            requests_per_minute=getattr(config, "LLM_REQUESTS_PER_MINUTE", None),
+            tokens_per_minute=getattr(config, "LLM_TOKENS_PER_MINUTE", None),
+            max_concurrency=getattr(config, "LLM_MAX_CONCURRENCY", None),
+        )
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Delay before retrying a failed call: jittered backoff that honors Retry-After.
+        Rate limit errors also pause every other caller sharing the limiter.
+        """
+        if self.rate_limiter is None:
+            return 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
+        delay = penalize_if_rate_limited(self.rate_limiter, error, attempt)
+        return delay if delay is not None else backoff_delay(attempt)
 
     def chat_completion(
         self,
@@ -75,21 +116,18 @@ class LLMClient:
         last_exception = None
         for attempt in range(max_retries):
             try:
-                # Use streaming if configured
-                if self.use_streaming:
-                    kwargs["stream"] = True
-                    return self._handle_streaming_response(**kwargs)
-                else:
-                    response = self.client.chat.completions.create(**kwargs)
-                    return response.choices[0].message.content
-                    
+                if self.rate_limiter is not None:
+                    tokens = estimate_request_tokens(*(m.get("content") for m in messages))
+                    with self.rate_limiter.slot(tokens):
+                        return self._create_completion(kwargs)
+                return self._create_completion(kwargs)
+
             except Exception as e:
                 last_exception = e
                 if attempt < max_retries - 1:
-                    import time
-                    wait_time = (2 ** attempt)  # Exponential backoff: 1s, 2s, 4s
+                    wait_time = self._retry_delay(e, attempt)
                     print(f"LLM API call failed (attempt {attempt + 1}/{max_retries}): {e}")
-                    print(f"Retrying in {wait_time} seconds...")
+                    print(f"Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                 else:
                     print(f"LLM API call failed after {max_retries} attempts: {e}")
@@ -97,6 +135,17 @@ class LLMClient:
         # If all retries failed, raise the last exception
         raise last_exception
 
+    def _create_completion(self, kwargs: Dict[str, Any]) -> str:
+        """
+        Make one chat completion call
+        """
+        # Use streaming if configured
+        if self.use_streaming:
+            kwargs["stream"] = True
+            return self._handle_streaming_response(**kwargs)
+        response = self.client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
+
     def _handle_streaming_response(self, **kwargs) -> str:
         """
         Handle streaming response and collect full content
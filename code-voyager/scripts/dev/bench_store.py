@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark brain and curriculum store round-trips.
+
+Times load -> validate -> save cycles for brain.json and curriculum.json in a
+scratch project, with the compiled schema validator cache warm (normal
+operation) and cold (cache cleared before every cycle, which is what each
+call cost before validators were cached).
+
+Uses the plugin's real schemas when present, otherwise a representative
+stand-in schema.
+"""
+
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+app = typer.Typer(
+    name="bench-store",
+    help="Benchmark brain/curriculum load -> validate -> save",
+)
+
+# Stand-in schemas used when the plugin schemas are not available
+FALLBACK_SCHEMAS = {
+    "skills/session-brain/schemas/brain.schema.json": {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "required": ["version", "project", "working_set", "decisions", "progress", "signals"],
+        "properties": {
+            "version": {"type": "integer"},
+            "project": {"type": "object"},
+            "working_set": {"type": "object"},
+            "decisions": {"type": "array", "items": {"type": "object"}},
+            "progress": {
+                "type": "object",
+                "properties": {
+                    "recent_changes": {"type": "array", "items": {"type": "string"}},
+                    "done": {"type": "array", "items": {"type": "string"}},
+                },
+            },
+            "signals": {"type": "object"},
+        },
+    },
+    "skills/curriculum-planner/schemas/curriculum.schema.json": {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "required": ["version", "goal", "tracks"],
+        "properties": {
+            "version": {"type": "integer"},
+            "goal": {"type": "string"},
+            "tracks": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["name", "tasks"],
+                    "properties": {
+                        "name": {"type": "string"},
+                        "tasks": {"type": "array", "items": {"type": "object"}},
+                    },
+                },
+            },
+            "metadata": {"type": "object"},
+        },
+    },
+}
+
+
+def _setup_plugin_root(scratch: Path) -> Path:
+    """Return a plugin root containing both schemas."""
+    real_root = Path(__file__).resolve().parents[2]
+    if all((real_root / rel).exists() for rel in FALLBACK_SCHEMAS):
+        return real_root
+
+    for rel, schema in FALLBACK_SCHEMAS.items():
+        path = scratch / "plugin" / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(schema), encoding="utf-8")
+    return scratch / "plugin"
+
+
+def _time(cycle: Callable[[], None], iterations: int, *, cold: bool) -> float:
+    """Run cycle repeatedly and return mean milliseconds per cycle."""
+    from voyager.jsonschema import clear_validator_cache
+
+    clear_validator_cache()
+    cycle()  # Warm-up (imports, first compile)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        if cold:
+            clear_validator_cache()
+        cycle()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+@app.callback(invoke_without_command=True)
+def main(
+    iterations: Annotated[
+        int,
+        typer.Option("--iterations", "-n", help="Cycles per measurement"),
+    ] = 200,
+) -> None:
+    """Benchmark load -> validate -> save for brain and curriculum."""
+    with tempfile.TemporaryDirectory() as tmp:
+        scratch = Path(tmp)
+        os.environ["CLAUDE_PROJECT_DIR"] = str(scratch)
+        os.environ["CLAUDE_PLUGIN_ROOT"] = str(_setup_plugin_root(scratch))
+
+        from voyager.brain.store import create_empty_brain, load_brain, save_brain
+        from voyager.curriculum.store import create_empty_curriculum, load_curriculum, save_curriculum
+
+        brain = create_empty_brain()
+        brain["progress"]["recent_changes"] = [f"change {i}" for i in range(50)]
+        save_brain(brain)
+
+        curriculum = create_empty_curriculum()
+        curriculum["goal"] = "benchmark"
+        curriculum["tracks"] = [{"name": f"track {i}", "tasks": [{"id": f"t{i}"}] * 10} for i in range(5)]
+        save_curriculum(curriculum)
+
+        def brain_cycle() -> None:
+            save_brain(load_brain())
+
+        def curriculum_cycle() -> None:
+            save_curriculum(load_curriculum())
+
+        typer.echo(f"{'store':<12} {'cold ms':>10} {'cached ms':>10} {'speedup':>8}")
+        for name, cycle in (("brain", brain_cycle), ("curriculum", curriculum_cycle)):
+            cold = _time(cycle, iterations, cold=True)
+            warm = _time(cycle, iterations, cold=False)
+            typer.echo(f"{name:<12} {cold:>10.3f} {warm:>10.3f} {cold / warm:>7.1f}x")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,30 @@
+"""Shared pytest fixtures for Voyager tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from voyager.config.settings import CONFIG_CACHE_ENV_VAR
+from voyager.llm_cache import CACHE_ENV_VAR
+from voyager.profiling import PROFILE_ENV_VAR
+
+
+@pytest.fixture(autouse=True)
+def _disable_llm_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep tests from reading or writing the project's LLM response cache.
+
+    Tests that exercise caching re-enable it and point it at tmp_path.
+    """
+    monkeypatch.setenv(CACHE_ENV_VAR, "0")
+
+
+@pytest.fixture(autouse=True)
+def _disable_config_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep tests from writing config snapshots into the project's state dir."""
+    monkeypatch.setenv(CONFIG_CACHE_ENV_VAR, "0")
+
+
+@pytest.fixture(autouse=True)
+def _disable_profiling(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep tests from appending timing traces to the project's state dir."""
+    monkeypatch.setenv(PROFILE_ENV_VAR, "0")
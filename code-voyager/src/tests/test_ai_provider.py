@@ -0,0 +1,286 @@
+"""Tests for the AIProvider async and streaming APIs, client pooling and availability caching."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from voyager.adapters.ai.ollama import OllamaProvider
+from voyager.adapters.ai.openrouter import OpenRouterProvider, iter_sse_deltas
+from voyager.adapters.base import ai_provider
+from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse, AIStreamChunk
+from voyager.adapters.base.client_pool import close_clients, get_http_client
+
+# Deltas the fake server streams, with a pause before each
+STREAM_DELTAS = ["Hello", ", ", "streaming", " world"]
+STREAM_DELAY_SECONDS = 0.05
+
+
+class FakeLLMServer(ThreadingHTTPServer):
+    """Minimal Ollama and OpenAI-style chat API server that records requests."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _LLMHandler)
+        self.paths: list[str] = []
+        self.ports: set[int] = set()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _LLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeLLMServer
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _reply(self, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, content_type: str, lines: list[str]) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for line in lines:
+            time.sleep(STREAM_DELAY_SECONDS)
+            data = line.encode()
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self) -> None:
+        self.server.paths.append(self.path)
+        self.server.ports.add(self.client_address[1])
+        self._reply({"models": []})
+
+    def do_POST(self) -> None:
+        self.server.paths.append(self.path)
+        self.server.ports.add(self.client_address[1])
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][-1]["content"]
+
+        if self.path == "/api/chat" and body.get("stream"):
+            lines = [json.dumps({"message": {"content": d}, "done": False}) + "\n" for d in STREAM_DELTAS]
+            self._stream(
+                "application/x-ndjson", [*lines, json.dumps({"message": {"content": ""}, "done": True}) + "\n"]
+            )
+        elif self.path == "/api/chat":
+            self._reply({"message": {"role": "assistant", "content": f"echo: {prompt}"}})
+        elif body.get("stream"):
+            events = [": keep-alive\n\n"]
+            events += [f"data: {json.dumps({'choices': [{'delta': {'content': d}}]})}\n\n" for d in STREAM_DELTAS]
+            events.append(f"data: {json.dumps({'choices': [], 'usage': {'total_tokens': 7}})}\n\n")
+            self._stream("text/event-stream", [*events, "data: [DONE]\n\n"])
+        else:
+            self._reply({"choices": [{"message": {"content": f"echo: {prompt}"}}], "usage": {}})
+
+
+@pytest.fixture
+def llm_server() -> Iterator[FakeLLMServer]:
+    """Run a fake LLM server on a free local port."""
+    server = FakeLLMServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    close_clients()
+    ai_provider._availability_cache.clear()
+
+
+class _SlowEcho(AIProvider):
+    """Synchronous provider that tracks how many calls overlap."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def call(self, request: AIRequest) -> AIResponse:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        if request.prompt == "boom":
+            raise RuntimeError("boom")
+        return AIResponse(success=True, output=request.prompt)
+
+    def is_available(self) -> bool:
+        return True
+
+
+class TestAcallMany:
+    """Tests for the default acall/acall_many implementation."""
+
+    def test_preserves_order_and_limits_concurrency(self) -> None:
+        """Responses should line up with requests and respect max_concurrency."""
+        provider = _SlowEcho()
+        requests = [AIRequest(prompt=str(i)) for i in range(6)]
+
+        responses = asyncio.run(provider.acall_many(requests, max_concurrency=2))
+
+        assert [r.output for r in responses] == [str(i) for i in range(6)]
+        assert provider.peak == 2
+
+    def test_failure_does_not_cancel_others(self) -> None:
+        """A raising request should become a failed response."""
+        provider = _SlowEcho()
+
+        responses = asyncio.run(provider.acall_many([AIRequest(prompt="boom"), AIRequest(prompt="ok")]))
+
+        assert responses[0].success is False
+        assert responses[0].error == "boom"
+        assert responses[1].output == "ok"
+
+
+class TestOllamaPooling:
+    """Tests for pooled clients and cached availability in OllamaProvider."""
+
+    def test_availability_probed_once(self, llm_server: FakeLLMServer) -> None:
+        """Repeated calls should not re-probe /api/tags within the TTL."""
+        provider = OllamaProvider(base_url=llm_server.base_url)
+
+        for i in range(3):
+            assert provider.call(AIRequest(prompt=f"q{i}")).output == f"echo: q{i}"
+
+        assert llm_server.paths.count("/api/tags") == 1
+        assert llm_server.paths.count("/api/chat") == 3
+
+    def test_reuses_connection(self, llm_server: FakeLLMServer) -> None:
+        """Sequential calls should share one keep-alive connection."""
+        provider = OllamaProvider(base_url=llm_server.base_url)
+
+        for _ in range(3):
+            provider.call(AIRequest(prompt="hi"))
+
+        assert len(llm_server.ports) == 1
+        assert get_http_client("ollama", llm_server.base_url) is get_http_client("ollama", llm_server.base_url)
+
+    def test_acall_many(self, llm_server: FakeLLMServer) -> None:
+        """The native async path should return responses in request order."""
+        provider = OllamaProvider(base_url=llm_server.base_url)
+        requests = [AIRequest(prompt=f"q{i}") for i in range(4)]
+
+        responses = asyncio.run(provider.acall_many(requests))
+
+        assert [r.output for r in responses] == [f"echo: q{i}" for i in range(4)]
+
+    def test_acall_probes_without_blocking(self, llm_server: FakeLLMServer, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A cold availability check in acall should use the async client, not the blocking probe."""
+
+        def blocking_probe(self: OllamaProvider) -> bool:
+            raise AssertionError("blocking probe on the event loop")
+
+        monkeypatch.setattr(OllamaProvider, "is_available", blocking_probe)
+        ai_provider._availability_cache.clear()
+        provider = OllamaProvider(base_url=llm_server.base_url)
+
+        responses = asyncio.run(provider.acall_many([AIRequest(prompt="q0"), AIRequest(prompt="q1")]))
+
+        assert [r.output for r in responses] == ["echo: q0", "echo: q1"]
+        assert llm_server.paths.count("/api/tags") >= 1
+        ai_provider._availability_cache.clear()
+
+    def test_unavailable_result_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A failed probe should be reused until the TTL expires."""
+        probes: list[bool] = []
+        monkeypatch.setattr(OllamaProvider, "is_available", lambda self: probes.append(False) or False)
+        provider = OllamaProvider(base_url="http://127.0.0.1:9")
+        ai_provider._availability_cache.clear()
+
+        responses = [provider.call(AIRequest(prompt="hi")) for _ in range(3)]
+
+        assert [r.success for r in responses] == [False] * 3
+        assert len(probes) == 1
+        assert provider.check_available(ttl_seconds=0) is False
+        assert len(probes) == 2
+        ai_provider._availability_cache.clear()
+
+
+def _collect(chunks: Iterator[AIStreamChunk]) -> tuple[list[str], AIStreamChunk]:
+    items = list(chunks)
+    assert [c.done for c in items].count(True) == 1
+    assert items[-1].done
+    return [c.delta for c in items[:-1]], items[-1]
+
+
+class TestStream:
+    """Tests for AIProvider.stream implementations."""
+
+    def test_default_yields_whole_output(self) -> None:
+        """Providers without a streaming API should yield one delta then done."""
+        deltas, final = _collect(_SlowEcho().stream(AIRequest(prompt="all at once")))
+
+        assert deltas == ["all at once"]
+        assert final.error == ""
+        assert final.metadata["chunks"] == 1
+
+    def test_ollama_streams_deltas(self, llm_server: FakeLLMServer) -> None:
+        """Ollama NDJSON chunks should arrive as separate deltas with TTFT before total."""
+        provider = OllamaProvider(base_url=llm_server.base_url)
+
+        deltas, final = _collect(provider.stream(AIRequest(prompt="hi")))
+
+        assert deltas == STREAM_DELTAS
+        assert final.error == ""
+        assert final.metadata["provider"] == "ollama"
+        assert final.metadata["chunks"] == len(STREAM_DELTAS)
+        assert 0 < final.metadata["ttft_ms"] < final.metadata["total_ms"]
+
+    def test_openrouter_streams_sse(self, llm_server: FakeLLMServer, monkeypatch: pytest.MonkeyPatch) -> None:
+        """OpenRouter server-sent events should be parsed into deltas and usage."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+        provider = OpenRouterProvider(base_url=llm_server.base_url)
+
+        deltas, final = _collect(provider.stream(AIRequest(prompt="hi")))
+
+        assert deltas == STREAM_DELTAS
+        assert final.error == ""
+        assert final.metadata["usage"] == {"total_tokens": 7}
+        assert final.metadata["ttft_ms"] < final.metadata["total_ms"]
+
+    def test_openai_compatible_streams(self, llm_server: FakeLLMServer) -> None:
+        """The OpenAI SDK path should stream from any compatible endpoint."""
+        pytest.importorskip("openai")
+        from voyager.adapters.ai.openai_compatible import OpenAICompatibleProvider
+
+        provider = OpenAICompatibleProvider(base_url=llm_server.base_url, api_key="test-key")
+
+        deltas, final = _collect(provider.stream(AIRequest(prompt="hi")))
+
+        assert deltas == STREAM_DELTAS
+        assert final.error == ""
+
+    def test_stream_error_ends_with_final_chunk(self) -> None:
+        """Connection failures should surface as the final chunk's error."""
+        provider = OllamaProvider(base_url="http://127.0.0.1:9")
+        ai_provider._availability_cache[(provider.get_name(), provider.pool_key())] = (time.monotonic(), True)
+
+        deltas, final = _collect(provider.stream(AIRequest(prompt="hi")))
+
+        assert deltas == []
+        assert final.error.startswith("HTTP error")
+        ai_provider._availability_cache.clear()
+
+    def test_sse_error_event_raises(self) -> None:
+        """Error events in the stream should not be silently dropped."""
+        lines = ['data: {"choices": [{"delta": {"content": "a"}}]}', 'data: {"error": {"message": "overloaded"}}']
+
+        with pytest.raises(RuntimeError, match="overloaded"):
+            list(iter_sse_deltas(lines))
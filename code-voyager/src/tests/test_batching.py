@@ -0,0 +1,148 @@
+"""Tests for voyager.batching and the batch call APIs."""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from claude_agent_sdk.types import ResultMessage
+
+from voyager import llm
+from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse
+from voyager.batching import build_batch_prompt, parse_batch_response, plan_batches
+from voyager.retrieval import analyzer
+
+TASK_RE = re.compile(r'<task id="(\d+)">\n(.*?)\n</task>', re.DOTALL)
+
+
+def answer_packed(prompt: str, *, bad: set[str] = frozenset()) -> str:
+    """Answer a packed prompt like a model would, echoing each task upper-cased."""
+    items = [
+        {"id": int(task_id), "result": "not json" if task in bad else {"echo": task.upper()}}
+        for task_id, task in TASK_RE.findall(prompt)
+    ]
+    return json.dumps(items)
+
+
+class EchoProvider(AIProvider):
+    """Provider answering packed prompts; single prompts get a JSON echo."""
+
+    def __init__(self, *, bad: set[str] = frozenset()) -> None:
+        self.bad = bad
+        self.prompts: list[str] = []
+
+    def call(self, request: AIRequest) -> AIResponse:
+        self.prompts.append(request.prompt)
+        if "<task id=" in request.prompt:
+            return AIResponse(success=True, output=answer_packed(request.prompt, bad=self.bad))
+        return AIResponse(success=True, output=json.dumps({"echo": request.prompt.upper(), "single": True}))
+
+    def is_available(self) -> bool:
+        return True
+
+
+class TestPacking:
+    """Tests for planning, building and parsing packed prompts."""
+
+    def test_plan_respects_item_and_token_limits(self) -> None:
+        """Groups should close at max_items, and big prompts go alone."""
+        prompts = ["a", "b", "c", "word " * 500, "d"]
+
+        assert plan_batches(prompts, max_items=2, max_tokens=100) == [[0, 1], [2], [3], [4]]
+
+    def test_round_trip(self) -> None:
+        """Answers should map back to task ids, with JSON results re-serialized."""
+        prompt = build_batch_prompt(["x", "y"])
+
+        assert parse_batch_response(answer_packed(prompt), 2) == {0: '{"echo": "X"}', 1: '{"echo": "Y"}'}
+
+    def test_parse_drops_bad_items(self) -> None:
+        """Unknown, duplicate and result-less items should be dropped for retry."""
+        text = 'Sure!\n```json\n[{"id": 0, "result": "a"}, {"id": 0, "result": "b"}, {"id": 1}, {"id": 9, "result": "z"}, {"id": 2, "result": "c"}]\n```'  # noqa: E501
+
+        assert parse_batch_response(text, 3) == {2: "c"}
+        assert parse_batch_response("no json here", 3) == {}
+
+
+class TestProviderCallBatch:
+    """Tests for AIProvider.call_batch."""
+
+    def test_packs_and_maps_results_in_order(self) -> None:
+        """Requests sharing options should go out in one call, answers in input order."""
+        provider = EchoProvider()
+
+        responses = provider.call_batch([AIRequest(prompt=p) for p in ["a", "b", "c"]])
+
+        assert len(provider.prompts) == 1
+        assert [json.loads(r.output)["echo"] for r in responses] == ["A", "B", "C"]
+        assert all(r.metadata["batched"] == "true" for r in responses)
+
+    def test_invalid_items_retried_alone(self) -> None:
+        """Items failing validation should be re-sent on their own."""
+        provider = EchoProvider(bad={"b"})
+
+        responses = provider.call_batch(
+            [AIRequest(prompt=p) for p in ["a", "b"]],
+            validate=lambda text: text.startswith("{"),
+        )
+
+        assert provider.prompts[1:] == ["b"]
+        assert json.loads(responses[1].output) == {"echo": "B", "single": True}
+
+    def test_different_options_not_packed_together(self) -> None:
+        """Requests with different system prompts need separate calls."""
+        provider = EchoProvider()
+
+        provider.call_batch([AIRequest(prompt="a", system_prompt="x"), AIRequest(prompt="b", system_prompt="y")])
+
+        assert provider.prompts == ["a", "b"]
+
+
+class TestLLMCallBatch:
+    """Tests for voyager.llm.call_batch and analyze_skills."""
+
+    @pytest.fixture
+    def agent_prompts(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Replace the agent query with an in-process answerer."""
+        prompts: list[str] = []
+
+        async def fake_query(*, prompt: str, options: object) -> AsyncIterator[ResultMessage]:
+            prompts.append(prompt)
+            output = answer_packed(prompt, bad={"bad"}) if "<task id=" in prompt else json.dumps({"purpose": prompt})
+            yield ResultMessage(
+                subtype="success",
+                duration_ms=1,
+                duration_api_ms=1,
+                is_error=False,
+                num_turns=1,
+                session_id="s",
+                result=output,
+            )
+
+        monkeypatch.setattr(llm, "query", fake_query)
+        return prompts
+
+    def test_call_batch(self, agent_prompts: list[str]) -> None:
+        """Prompts should be packed and malformed answers retried alone."""
+        results = llm.call_batch(["ok", "bad"], validate=lambda text: text.startswith("{"), cache=False)
+
+        assert [r.success for r in results] == [True, True]
+        assert json.loads(results[0].output) == {"echo": "OK"}
+        assert json.loads(results[1].output) == {"purpose": "bad"}
+        assert agent_prompts[1:] == ["bad"]
+
+    def test_analyze_skills(self, agent_prompts: list[str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Skills should be analyzed in one packed call; unreadable ones reported."""
+        monkeypatch.setattr(analyzer, "_extraction_prompt", lambda content: content.split("---")[-1].strip())
+        for name in ("alpha", "beta"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "SKILL.md").write_text(f"---\nname: {name}\n---\n{name}", encoding="utf-8")
+
+        outcomes = analyzer.analyze_skills([tmp_path / "alpha", tmp_path / "beta", tmp_path / "missing"])
+
+        assert len(agent_prompts) == 1
+        assert isinstance(outcomes[2], FileNotFoundError)
+        assert [o.name for o in outcomes[:2]] == ["alpha", "beta"]
@@ -0,0 +1,121 @@
+"""Tests for voyager.brain.coordinator module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from voyager.brain import coordinator
+from voyager.io import file_lock, read_json
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point Voyager at an isolated project directory."""
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def updates(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    """Replace the LLM-backed update with a recorder."""
+    calls: list[dict] = []
+    monkeypatch.setattr(coordinator, "_run_update", calls.append)
+    return calls
+
+
+def _pending(project: Path) -> dict:
+    return read_json(project / ".claude" / "voyager" / "brain.pending.json", default={})
+
+
+class TestFileLock:
+    """Tests for the file_lock helper used by the coordinator."""
+
+    def test_non_blocking_lock_is_exclusive(self, tmp_path: Path) -> None:
+        """A second non-blocking acquire should fail while the lock is held."""
+        lock = tmp_path / "x.lock"
+        with file_lock(lock) as first, file_lock(lock, blocking=False) as second:
+            assert first is True
+            assert second is False
+        with file_lock(lock, blocking=False) as again:
+            assert again is True
+
+
+class TestEnqueueUpdate:
+    """Tests for enqueue_update function."""
+
+    def test_merges_requests_per_session(self, project: Path) -> None:
+        """Repeated requests for one session should coalesce into one entry."""
+        transcript = project / "t.jsonl"
+        coordinator.enqueue_update("s1", transcript, "pre-compact")
+        coordinator.enqueue_update("s1", transcript, "session-end")
+        coordinator.enqueue_update("s2", None, "session-end")
+
+        pending = _pending(project)
+
+        assert set(pending) == {"s1", "s2"}
+        assert pending["s1"]["events"] == ["pre-compact", "session-end"]
+        assert pending["s1"]["transcript"] == str(transcript)
+
+
+class TestRunPendingUpdates:
+    """Tests for run_pending_updates function."""
+
+    def test_drains_queue(self, project: Path, updates: list[dict]) -> None:
+        """Each coalesced request should be run once and removed."""
+        coordinator.enqueue_update("s1", None, "pre-compact")
+        coordinator.enqueue_update("s1", None, "session-end")
+        coordinator.enqueue_update("s2", None, "session-end")
+
+        ran = coordinator.run_pending_updates(debounce_seconds=0)
+
+        assert ran == 2
+        assert [u["session_id"] for u in updates] == ["s1", "s2"]
+        assert _pending(project) == {}
+
+    def test_skips_while_another_worker_runs(self, project: Path, updates: list[dict]) -> None:
+        """A held update lock should make a second worker exit without updating."""
+        coordinator.enqueue_update("s1", None, "session-end")
+
+        with file_lock(coordinator._get_update_lock_path()):
+            ran = coordinator.run_pending_updates(debounce_seconds=0)
+
+        assert ran == 0
+        assert updates == []
+        assert "s1" in _pending(project)
+
+    def test_debounce_env_var(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The debounce window should be configurable and fall back on bad input."""
+        monkeypatch.setenv(coordinator.DEBOUNCE_ENV_VAR, "0.5")
+        assert coordinator.get_debounce_seconds() == 0.5
+
+        monkeypatch.setenv(coordinator.DEBOUNCE_ENV_VAR, "soon")
+        assert coordinator.get_debounce_seconds() == coordinator.DEFAULT_DEBOUNCE_SECONDS
+
+
+class TestRequestBrainUpdate:
+    """Tests for request_brain_update function."""
+
+    def test_returns_without_running_update(
+        self, project: Path, updates: list[dict], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Hooks should only enqueue and spawn a worker."""
+        spawned: list[bool] = []
+        monkeypatch.setattr(coordinator, "spawn_worker", lambda: spawned.append(True) or True)
+
+        coordinator.request_brain_update("s1", None, "session-end")
+
+        assert spawned == [True]
+        assert updates == []
+        assert "s1" in _pending(project)
+
+    def test_runs_inline_when_spawn_fails(
+        self, project: Path, updates: list[dict], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without a worker the queued update should still run."""
+        monkeypatch.setattr(coordinator, "spawn_worker", lambda: False)
+
+        coordinator.request_brain_update("s1", None, "session-end")
+
+        assert [u["session_id"] for u in updates] == ["s1"]
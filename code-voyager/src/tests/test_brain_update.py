@@ -0,0 +1,122 @@
+"""Tests for incremental brain updates in voyager.scripts.brain.update."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+from pathlib import Path
+
+import pytest
+import typer
+
+from voyager.brain.store import load_transcript_offset
+from voyager.llm import LLMResult
+from voyager.scripts.brain import update
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point Voyager at an isolated project with a permissive brain schema."""
+    schema = tmp_path / "skills" / "session-brain" / "schemas" / "brain.schema.json"
+    schema.parent.mkdir(parents=True)
+    schema.write_text('{"type": "object"}', encoding="utf-8")
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+    monkeypatch.setenv("CLAUDE_PLUGIN_ROOT", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def llm_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace call_claude with a fake that writes a brain and records prompts."""
+    prompts: list[str] = []
+
+    def fake_call_claude(prompt: str, *, cwd: Path, **kwargs: object) -> LLMResult:
+        prompts.append(prompt)
+        brain_path = Path(cwd) / "brain.json"
+        brain_path.parent.mkdir(parents=True, exist_ok=True)
+        brain_path.write_text(json.dumps({"version": 1, "signals": {}}), encoding="utf-8")
+        return LLMResult(success=True, files=[str(brain_path)])
+
+    monkeypatch.setattr(update, "call_claude", fake_call_claude)
+    return prompts
+
+
+def _append(transcript: Path, *entries: dict) -> None:
+    with transcript.open("a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _run(transcript: Path, **kwargs: object) -> None:
+    with contextlib.suppress(typer.Exit):
+        update.main(transcript=transcript, session_id="s1", snapshot_path=None, **kwargs)
+
+
+class TestIncrementalUpdate:
+    """Tests for offset-based transcript deltas."""
+
+    def test_sends_only_new_segment(self, project: Path, llm_calls: list[str]) -> None:
+        """Second update should only include entries appended after the first."""
+        transcript = project / "transcript.jsonl"
+        _append(transcript, {"type": "user", "message": "first question"})
+        _run(transcript)
+
+        _append(transcript, {"type": "user", "message": "second question"})
+        _run(transcript)
+
+        assert len(llm_calls) == 2
+        assert "first question" in llm_calls[0]
+        assert "first question" not in llm_calls[1]
+        assert "second question" in llm_calls[1]
+        assert "new since last update" in llm_calls[1]
+
+    def test_records_offset_after_success(self, project: Path, llm_calls: list[str]) -> None:
+        """The consumed byte offset should be saved per session."""
+        transcript = project / "transcript.jsonl"
+        _append(transcript, {"type": "user", "message": "hello"})
+
+        _run(transcript)
+
+        assert load_transcript_offset("s1", transcript) == transcript.stat().st_size
+
+    def test_skips_llm_without_new_content(self, project: Path, llm_calls: list[str]) -> None:
+        """Nothing appended since the last update should not call the LLM."""
+        transcript = project / "transcript.jsonl"
+        _append(transcript, {"type": "user", "message": "hello"})
+        _run(transcript)
+
+        _run(transcript)
+
+        assert len(llm_calls) == 1
+
+    def test_skips_llm_for_bookkeeping_entries(self, project: Path, llm_calls: list[str]) -> None:
+        """Appended entries with no conversational content should not call the LLM."""
+        transcript = project / "transcript.jsonl"
+        _append(transcript, {"type": "user", "message": "hello"})
+        _run(transcript)
+
+        _append(transcript, {"type": "summary", "summary": "compacted"})
+        _run(transcript)
+
+        assert len(llm_calls) == 1
+
+    def test_full_rereads_whole_transcript(self, project: Path, llm_calls: list[str]) -> None:
+        """--full should ignore the saved offset."""
+        transcript = project / "transcript.jsonl"
+        _append(transcript, {"type": "user", "message": "first question"})
+        _run(transcript)
+
+        _run(transcript, full=True)
+
+        assert len(llm_calls) == 2
+        assert "first question" in llm_calls[1]
+
+    def test_failed_update_keeps_offset(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A failed LLM call should leave the segment to be retried."""
+        transcript = project / "transcript.jsonl"
+        _append(transcript, {"type": "user", "message": "hello"})
+        monkeypatch.setattr(update, "call_claude", lambda *a, **k: LLMResult(success=False, error="boom"))
+
+        _run(transcript)
+
+        assert load_transcript_offset("s1", transcript) == 0
@@ -0,0 +1,85 @@
+"""Tests for CLI startup cost and lazy subcommand loading."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Modules that must not load just to answer a hook
+HEAVY_MODULES = {
+    "anyio",
+    "claude_agent_sdk",
+    "httpx",
+    "mcp",
+    "voyager.llm",
+    "voyager.retrieval",
+    "voyager.scripts.brain.update",
+}
+
+# Generous ceiling on cumulative `voyager.cli` import time; the point is to
+# catch an eager import of the agent SDK (over a second), not to benchmark
+IMPORT_BUDGET_US = 400_000
+
+
+def _run_cli(args: list[str], project_dir: Path, *extra_flags: str) -> subprocess.CompletedProcess[str]:
+    env = {key: value for key, value in os.environ.items() if key != "VOYAGER_FOR_CODE_INTERNAL"}
+    env["CLAUDE_PROJECT_DIR"] = str(project_dir)
+    return subprocess.run(
+        [sys.executable, *extra_flags, "-c", "from voyager.cli import main; main()", *args],
+        input="{}",
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=project_dir,
+        timeout=60,
+    )
+
+
+def _import_times(stderr: str) -> dict[str, int]:
+    """Parse `-X importtime` output into module -> cumulative microseconds."""
+    times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestHookStartup:
+    """Hooks should start without loading the LLM stack."""
+
+    @pytest.mark.parametrize("hook", ["post-tool-use", "session-start"])
+    def test_hook_avoids_heavy_imports(self, hook: str, tmp_path: Path) -> None:
+        """Only the modules a hook needs should be imported."""
+        result = _run_cli(["hook", hook], tmp_path, "-X", "importtime")
+
+        assert result.returncode == 0, result.stderr
+        times = _import_times(result.stderr)
+        assert "voyager.cli" in times
+        assert sorted(HEAVY_MODULES & times.keys()) == []
+        assert times["voyager.cli"] < IMPORT_BUDGET_US
+
+
+class TestLazySubcommands:
+    """Tests for the lazily loaded command groups."""
+
+    def test_help_lists_every_subcommand(self, tmp_path: Path) -> None:
+        """Top-level help should still show all groups."""
+        result = _run_cli(["--help"], tmp_path)
+
+        assert result.returncode == 0, result.stderr
+        for name in ("brain", "curriculum", "feedback", "factory", "hook", "repo", "skill"):
+            assert name in result.stdout
+
+    def test_single_command_group_keeps_its_name(self, tmp_path: Path) -> None:
+        """Groups with one command should not collapse into that command."""
+        result = _run_cli(["curriculum", "--help"], tmp_path)
+
+        assert result.returncode == 0, result.stderr
+        assert "plan" in result.stdout
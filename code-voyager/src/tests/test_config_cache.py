@@ -0,0 +1,81 @@
+"""Tests for the config snapshot in voyager.config.settings."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from voyager.config import settings
+from voyager.config.settings import CONFIG_CACHE_ENV_VAR, get_config_cache_path, load_config
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A project with a state dir and the config snapshot enabled."""
+    monkeypatch.setenv(CONFIG_CACHE_ENV_VAR, "1")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".claude" / "voyager").mkdir(parents=True)
+    return tmp_path
+
+
+def _write_user_config(project: Path, model: str) -> Path:
+    path = project / "voyager.toml"
+    path.write_text(f'[ai.ollama]\nmodel = "{model}"\n', encoding="utf-8")
+    return path
+
+
+class TestConfigSnapshot:
+    """Tests for loading config from the snapshot."""
+
+    def test_hit_skips_toml_parsing(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A second load with unchanged files should not parse TOML."""
+        _write_user_config(project, "first")
+        load_config(project_dir=project)
+        assert get_config_cache_path(project).exists()
+
+        def fail(path: Path) -> dict:
+            raise AssertionError(f"parsed {path}")
+
+        monkeypatch.setattr(settings, "_load_toml", fail)
+        config = load_config(project_dir=project)
+
+        assert config.get_ai_config("ollama").model == "first"
+        assert config.project_dir == project
+
+    def test_reloads_when_file_changes(self, project: Path) -> None:
+        """Editing a config file should invalidate the snapshot."""
+        path = _write_user_config(project, "first")
+        load_config(project_dir=project)
+
+        _write_user_config(project, "second-model")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config(project_dir=project).get_ai_config("ollama").model == "second-model"
+
+    def test_reloads_when_file_added(self, project: Path) -> None:
+        """Creating a config file where none existed should invalidate the snapshot."""
+        load_config(project_dir=project)
+
+        _write_user_config(project, "added")
+
+        assert load_config(project_dir=project).get_ai_config("ollama").model == "added"
+
+    def test_no_snapshot_without_state_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Loading config should not create a state directory."""
+        monkeypatch.setenv(CONFIG_CACHE_ENV_VAR, "1")
+        monkeypatch.chdir(tmp_path)
+
+        load_config(project_dir=tmp_path)
+
+        assert not (tmp_path / ".claude").exists()
+
+    def test_hit_does_not_import_tomllib(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Snapshot hits should not need tomllib at all."""
+        load_config(project_dir=project)
+        monkeypatch.setitem(sys.modules, "tomllib", None)
+
+        assert load_config(project_dir=project).ai_provider == "claude"
@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from voyager.io import (
     JsonlReadResult,
     ensure_parent_dir,
+    iter_jsonl,
+    iter_jsonl_reverse,
     read_file,
     read_json,
     read_jsonl,
+    read_jsonl_tail,
     safe_unlink,
     write_file,
     write_json,
@@ -239,6 +246,144 @@ class TestReadJsonl:
 
         assert result.items == [{"fallback": True}]
 
+    def test_reports_end_offset(self, tmp_path: Path) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text('{"a": 1}\n{"b": 2}\n', encoding="utf-8")
+
+        result = read_jsonl(file)
+
+        assert result.end_offset == file.stat().st_size
+
+    def test_resumes_from_offset(self, tmp_path: Path) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text('{"a": 1}\n', encoding="utf-8")
+        first = read_jsonl(file)
+
+        with file.open("a", encoding="utf-8") as f:
+            f.write('{"b": 2}\n{"c": 3}\n')
+        second = read_jsonl(file, offset=first.end_offset)
+
+        assert second.items == [{"b": 2}, {"c": 3}]
+        assert second.total_lines == 2
+        assert second.end_offset == file.stat().st_size
+
+    def test_does_not_consume_partial_trailing_line(self, tmp_path: Path) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text('{"a": 1}\n{"b": ', encoding="utf-8")
+
+        result = read_jsonl(file)
+
+        assert result.items == [{"a": 1}]
+        assert result.end_offset == len('{"a": 1}\n')
+
+    def test_offset_past_end_restarts(self, tmp_path: Path) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text('{"a": 1}\n', encoding="utf-8")
+
+        result = read_jsonl(file, offset=10_000)
+
+        assert result.items == [{"a": 1}]
+
+
+class TestIterJsonl:
+    """Tests for iter_jsonl function."""
+
+    def test_streams_from_offset(self, tmp_path: Path) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text('{"a": 1}\nnot-json\n{"b": 2}\n', encoding="utf-8")
+
+        assert list(iter_jsonl(file)) == [{"a": 1}, {"b": 2}]
+        assert list(iter_jsonl(file, offset=len('{"a": 1}\n'))) == [{"b": 2}]
+
+    def test_missing_file_yields_nothing(self, tmp_path: Path) -> None:
+        assert list(iter_jsonl(tmp_path / "missing.jsonl")) == []
+
+
+@pytest.fixture(params=["mmap", "blocks"])
+def reverse_mode(request: pytest.FixtureRequest) -> Iterator[dict[str, int]]:
+    """Run reverse-reader tests both memory-mapped and with tiny read blocks."""
+    if request.param == "mmap":
+        yield {}
+    else:
+        with patch("voyager.io.mmap.mmap", side_effect=OSError("no mmap")):
+            yield {"block_size": 7}
+
+
+class TestIterJsonlReverse:
+    """Tests for iter_jsonl_reverse function."""
+
+    def test_yields_most_recent_first(self, tmp_path: Path, reverse_mode: dict) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text('{"a": 1}\n\nbad\n{"b": 2}\n{"c": 3}', encoding="utf-8")
+
+        result = list(iter_jsonl_reverse(file, **reverse_mode))
+
+        assert result == [{"c": 3}, {"b": 2}, {"a": 1}]
+
+    def test_stops_at_offset(self, tmp_path: Path, reverse_mode: dict) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text('{"a": 1}\n{"b": 2}\n', encoding="utf-8")
+
+        result = list(iter_jsonl_reverse(file, offset=len('{"a": 1}\n'), **reverse_mode))
+
+        assert result == [{"b": 2}]
+
+    def test_missing_file_yields_nothing(self, tmp_path: Path) -> None:
+        assert list(iter_jsonl_reverse(tmp_path / "missing.jsonl")) == []
+
+
+class TestReadJsonlTail:
+    """Tests for read_jsonl_tail function."""
+
+    def test_returns_last_items_in_file_order(self, tmp_path: Path, reverse_mode: dict) -> None:
+        file = tmp_path / "data.jsonl"
+        write_jsonl(file, [{"i": i} for i in range(100)])
+
+        result = read_jsonl_tail(file, 3, **reverse_mode)
+
+        assert result.items == [{"i": 97}, {"i": 98}, {"i": 99}]
+        assert result.total_lines == 3
+        assert result.end_offset == file.stat().st_size
+
+    def test_respects_offset(self, tmp_path: Path, reverse_mode: dict) -> None:
+        file = tmp_path / "data.jsonl"
+        write_jsonl(file, [{"i": 0}, {"i": 1}])
+        first = read_jsonl(file)
+        write_jsonl(file, [{"i": 2}], append=True)
+
+        result = read_jsonl_tail(file, 10, offset=first.end_offset, **reverse_mode)
+
+        assert result.items == [{"i": 2}]
+
+    def test_excludes_partial_trailing_line(self, tmp_path: Path, reverse_mode: dict) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text('{"a": 1}\n{"b": ', encoding="utf-8")
+
+        result = read_jsonl_tail(file, 10, **reverse_mode)
+
+        assert result.items == [{"a": 1}]
+        assert result.invalid_lines == 1
+        assert result.end_offset == len('{"a": 1}\n')
+
+    def test_missing_file_returns_default(self, tmp_path: Path) -> None:
+        result = read_jsonl_tail(tmp_path / "missing.jsonl", 5, default=[{"fallback": True}])
+
+        assert result.items == [{"fallback": True}]
+
+    def test_multi_gigabyte_file_reads_only_tail(self, tmp_path: Path) -> None:
+        """A sparse 3 GiB transcript should be tailed without scanning the body."""
+        file = tmp_path / "huge.jsonl"
+        with file.open("wb") as f:
+            f.write(b'{"head": true}\n')
+            f.seek(3 * 1024**3)
+            f.write(b"\n" + b"".join(json.dumps({"i": i}).encode() + b"\n" for i in range(5)))
+
+        result = read_jsonl_tail(file, 2)
+
+        assert result.items == [{"i": 3}, {"i": 4}]
+        assert result.end_offset == file.stat().st_size
+        assert next(iter_jsonl_reverse(file)) == {"i": 4}
+
 
 class TestWriteJsonl:
     """Tests for write_jsonl function."""
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
-from voyager.jsonschema import validate, validate_hook_context
+from voyager.jsonschema import clear_validator_cache, get_validator, validate, validate_hook_context
 
 
 class TestValidate:
@@ -127,6 +128,35 @@ class TestValidate:
         assert valid is False
 
 
+class TestGetValidator:
+    """Tests for the compiled validator cache."""
+
+    def test_reuses_compiled_validator(self, tmp_path: Path) -> None:
+        """Repeated lookups of an unchanged schema should return the same validator."""
+        clear_validator_cache()
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text('{"type": "object"}', encoding="utf-8")
+
+        assert get_validator(schema_file) is get_validator(schema_file)
+
+    def test_recompiles_when_schema_changes(self, tmp_path: Path) -> None:
+        """Editing the schema file should invalidate the cached validator."""
+        clear_validator_cache()
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text('{"type": "object"}', encoding="utf-8")
+        assert validate({}, schema_file)[0] is True
+
+        schema_file.write_text('{"type": "array"}', encoding="utf-8")
+        stat = schema_file.stat()
+        os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert validate({}, schema_file)[0] is False
+
+    def test_missing_schema_returns_none(self, tmp_path: Path) -> None:
+        """Unreadable schema files should not be cached."""
+        assert get_validator(tmp_path / "missing.json") is None
+
+
 class TestValidateHookContext:
     """Tests for validate_hook_context function."""
 
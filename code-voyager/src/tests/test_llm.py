@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
+from collections.abc import AsyncIterator
 from unittest.mock import MagicMock, patch
 
+import pytest
+from claude_agent_sdk.types import ResultMessage
+
+from voyager import llm
 from voyager.llm import (
     RECURSION_GUARD_VAR,
     LLMResult,
     call_claude,
+    call_claude_async,
     is_internal_call,
+    reuse_agent_sessions,
 )
 
 
@@ -145,3 +154,132 @@ class TestCallClaude:
         assert result.success is True
         assert result.output == "Done!"
         assert "/tmp/test.txt" in result.files
+
+
+def _result(text: str) -> ResultMessage:
+    return ResultMessage(
+        subtype="success", duration_ms=1, duration_api_ms=1, is_error=False, num_turns=1, session_id="s", result=text
+    )
+
+
+class FakeSDKClient:
+    """Stand-in for ClaudeSDKClient that answers each prompt in-process."""
+
+    instances: list[FakeSDKClient] = []
+    connect_delay = 0.0
+
+    def __init__(self, options: object) -> None:
+        self.options = options
+        self.prompts: list[str] = []
+        self.disconnected = False
+        FakeSDKClient.instances.append(self)
+
+    async def connect(self) -> None:
+        await asyncio.sleep(self.connect_delay)
+
+    async def query(self, prompt: str) -> None:
+        self.prompts.append(prompt)
+
+    async def receive_response(self) -> AsyncIterator[ResultMessage]:
+        prompt = self.prompts[-1]
+        if prompt == "slow":
+            await asyncio.sleep(10)
+        yield _result("cleared" if prompt == "/clear" else f"answer: {prompt}")
+
+    async def disconnect(self) -> None:
+        self.disconnected = True
+
+
+@pytest.fixture
+def fake_sdk_client(monkeypatch: pytest.MonkeyPatch) -> type[FakeSDKClient]:
+    """Replace the SDK client used by agent sessions."""
+    FakeSDKClient.instances = []
+    monkeypatch.setattr(FakeSDKClient, "connect_delay", 0.0)
+    monkeypatch.setattr(llm, "ClaudeSDKClient", FakeSDKClient)
+    return FakeSDKClient
+
+
+class TestReuseAgentSessions:
+    """Tests for agent process reuse across calls."""
+
+    def test_calls_share_one_process(self, fake_sdk_client: type[FakeSDKClient]) -> None:
+        """Calls with the same options should reuse one process, cleared between calls."""
+        with reuse_agent_sessions():
+            first = call_claude("a", allowed_tools=[], max_turns=1, cache=False)
+            second = call_claude("b", allowed_tools=[], max_turns=1, cache=False)
+
+        assert (first.output, second.output) == ("answer: a", "answer: b")
+        assert len(fake_sdk_client.instances) == 1
+        assert fake_sdk_client.instances[0].prompts == ["a", "/clear", "b"]
+        assert fake_sdk_client.instances[0].disconnected is True
+
+    def test_different_options_get_separate_processes(self, fake_sdk_client: type[FakeSDKClient]) -> None:
+        """The process is bound to its options, so new options need a new one."""
+        with reuse_agent_sessions() as pool:
+            call_claude("a", max_turns=1, cache=False)
+            call_claude("b", max_turns=2, cache=False)
+
+        assert len(pool.sessions) == 2
+
+    def test_recycles_after_max_calls(self, fake_sdk_client: type[FakeSDKClient]) -> None:
+        """A session should be replaced after max_calls_per_session calls."""
+        with reuse_agent_sessions(max_calls_per_session=2):
+            for prompt in "abc":
+                call_claude(prompt, cache=False)
+
+        assert [c.prompts for c in fake_sdk_client.instances] == [["a", "/clear", "b"], ["c"]]
+
+    def test_timeout_discards_process(self, fake_sdk_client: type[FakeSDKClient]) -> None:
+        """A timed-out call should fail and leave the next call a fresh process."""
+        with reuse_agent_sessions():
+            slow = call_claude("slow", timeout_seconds=0.05, cache=False)
+            after = call_claude("fast", cache=False)
+
+        assert slow.success is False
+        assert "timed out" in slow.error
+        assert after.output == "answer: fast"
+        assert fake_sdk_client.instances[0].disconnected is True
+        assert len(fake_sdk_client.instances) == 2
+
+    def test_hung_startup_times_out(self, fake_sdk_client: type[FakeSDKClient]) -> None:
+        """An agent that never finishes connecting should time out, not block the caller."""
+        fake_sdk_client.connect_delay = 10.0
+
+        with reuse_agent_sessions():
+            started = time.perf_counter()
+            result = call_claude("a", timeout_seconds=0.05, cache=False)
+
+        assert result.success is False
+        assert "timed out" in result.error
+        assert time.perf_counter() - started < 5
+        assert fake_sdk_client.instances[0].disconnected is True
+
+
+class TestCallClaudeAsync:
+    """Tests for call_claude_async."""
+
+    def test_runs_inside_event_loop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should work from a running loop and pass the recursion guard to the agent."""
+        seen: list[object] = []
+
+        async def fake_query(*, prompt: str, options: object) -> AsyncIterator[ResultMessage]:
+            seen.append(options)
+            yield _result(f"answer: {prompt}")
+
+        monkeypatch.setattr(llm, "query", fake_query)
+
+        async def main() -> list[LLMResult]:
+            return list(await asyncio.gather(*(call_claude_async(p, cache=False) for p in "ab")))
+
+        results = asyncio.run(main())
+
+        assert [r.output for r in results] == ["answer: a", "answer: b"]
+        assert all(o.env[RECURSION_GUARD_VAR] == "1" for o in seen)
+
+    def test_uses_active_session_pool(self, fake_sdk_client: type[FakeSDKClient]) -> None:
+        """Inside reuse_agent_sessions the async call should use the pooled process."""
+        with reuse_agent_sessions():
+            result = asyncio.run(call_claude_async("a", cache=False))
+
+        assert result.output == "answer: a"
+        assert len(fake_sdk_client.instances) == 1
@@ -0,0 +1,183 @@
+"""Tests for voyager.llm_cache module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from voyager import llm, llm_cache
+from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse
+from voyager.llm import LLMResult, call_claude
+from voyager.llm_cache import CachedProvider, LLMCache, make_cache_key
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Enable the response cache with an isolated database."""
+    path = tmp_path / "llm_cache.sqlite"
+    monkeypatch.setenv(llm_cache.CACHE_ENV_VAR, "1")
+    monkeypatch.setenv(llm_cache.CACHE_PATH_ENV_VAR, str(path))
+    monkeypatch.setattr(llm_cache, "_caches", {})
+    return path
+
+
+class _Counting(AIProvider):
+    """Provider that counts calls and can be told to fail."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+
+    def call(self, request: AIRequest) -> AIResponse:
+        self.calls += 1
+        if self.fail:
+            return AIResponse(success=False, error="down")
+        return AIResponse(success=True, output=f"answer {self.calls}", metadata={"provider": "counting"})
+
+    def is_available(self) -> bool:
+        return True
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key function."""
+
+    def test_stable_and_sensitive(self) -> None:
+        """Keys should be deterministic and change with any input."""
+        base = {"provider": "p", "model": "m", "system_prompt": None, "prompt": "hi", "temperature": None}
+
+        assert make_cache_key(**base) == make_cache_key(**base)
+        assert make_cache_key(**base) != make_cache_key(**{**base, "temperature": 0.2})
+        assert make_cache_key(**base) != make_cache_key(**base, cwd="/elsewhere")
+
+
+class TestLLMCache:
+    """Tests for LLMCache storage and eviction."""
+
+    def test_round_trip_and_stats(self, tmp_path: Path) -> None:
+        """Stored values should be returned and counted as hits."""
+        cache = LLMCache(tmp_path / "c.sqlite")
+
+        assert cache.get("k") is None
+        cache.put("k", {"output": "v"})
+
+        assert cache.get("k") == {"output": "v"}
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.stores) == (1, 1, 1)
+        assert cache.summary()["entries"] == 1
+
+    def test_expired_entries_miss(self, tmp_path: Path) -> None:
+        """Entries older than the TTL should not be served."""
+        cache = LLMCache(tmp_path / "c.sqlite", ttl_seconds=-1)
+        cache.put("k", {"output": "v"})
+
+        assert cache.get("k") is None
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Exceeding the size budget should drop the least recently used entry."""
+        cache = LLMCache(tmp_path / "c.sqlite", max_bytes=100)
+        cache.put("a", {"output": "x" * 30})
+        cache.put("b", {"output": "y" * 30})
+        cache.get("a")
+
+        cache.put("c", {"output": "z" * 30})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats.evictions == 1
+
+
+class TestCachedProvider:
+    """Tests for the CachedProvider wrapper."""
+
+    def test_serves_repeats_from_cache(self, cache_path: Path) -> None:
+        """Identical requests should reach the provider once."""
+        inner = _Counting()
+        provider = CachedProvider(inner)
+
+        first = provider.call(AIRequest(prompt="q"))
+        second = provider.call(AIRequest(prompt="q"))
+
+        assert inner.calls == 1
+        assert second.output == first.output
+        assert second.metadata["cache"] == "hit"
+        assert provider.cache.stats.hits == 1
+
+    def test_agent_options_in_key(self, cache_path: Path, tmp_path: Path) -> None:
+        """Requests differing only in cwd or allowed tools should both miss."""
+        inner = _Counting()
+        provider = CachedProvider(inner)
+        provider.call(AIRequest(prompt="q", cwd=tmp_path / "a", allowed_tools=["Read"]))
+
+        provider.call(AIRequest(prompt="q", cwd=tmp_path / "b", allowed_tools=["Read"]))
+        provider.call(AIRequest(prompt="q", cwd=tmp_path / "a", allowed_tools=["Read", "Write"]))
+
+        assert inner.calls == 3
+
+    def test_opt_out_per_request(self, cache_path: Path) -> None:
+        """cache=False should bypass both lookup and store."""
+        inner = _Counting()
+        provider = CachedProvider(inner)
+        provider.call(AIRequest(prompt="q"))
+
+        provider.call(AIRequest(prompt="q", cache=False))
+
+        assert inner.calls == 2
+
+    def test_failures_not_cached(self, cache_path: Path) -> None:
+        """Failed responses should be retried on the next call."""
+        inner = _Counting(fail=True)
+        provider = CachedProvider(inner)
+
+        provider.call(AIRequest(prompt="q"))
+        provider.call(AIRequest(prompt="q"))
+
+        assert inner.calls == 2
+
+    def test_disabled_by_env(self, cache_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """VOYAGER_LLM_CACHE=0 should disable caching."""
+        monkeypatch.setenv(llm_cache.CACHE_ENV_VAR, "0")
+        inner = _Counting()
+        provider = CachedProvider(inner)
+
+        provider.call(AIRequest(prompt="q"))
+        provider.call(AIRequest(prompt="q"))
+
+        assert inner.calls == 2
+
+
+class TestCallClaudeCache:
+    """Tests for response caching in call_claude."""
+
+    @pytest.fixture
+    def agent_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Replace the agent with a fake that writes out.md in cwd."""
+        prompts: list[str] = []
+
+        def fake_agent(prompt: str, *, cwd: Path | str | None, **kwargs: object) -> LLMResult:
+            prompts.append(prompt)
+            out = Path(cwd) / "out.md"
+            out.write_text(f"written for {prompt}", encoding="utf-8")
+            return LLMResult(success=True, output="ok", files=[str(out)])
+
+        monkeypatch.setattr(llm, "_call_agent", fake_agent)
+        return prompts
+
+    def test_replays_output_and_files(self, cache_path: Path, tmp_path: Path, agent_calls: list[str]) -> None:
+        """A cache hit should rewrite the files the original call wrote."""
+        call_claude("plan", cwd=tmp_path)
+        (tmp_path / "out.md").unlink()
+
+        result = call_claude("plan", cwd=tmp_path)
+
+        assert agent_calls == ["plan"]
+        assert result.success is True
+        assert result.output == "ok"
+        assert (tmp_path / "out.md").read_text(encoding="utf-8") == "written for plan"
+
+    def test_opt_out(self, cache_path: Path, tmp_path: Path, agent_calls: list[str]) -> None:
+        """cache=False should always run the agent."""
+        call_claude("plan", cwd=tmp_path)
+        call_claude("plan", cwd=tmp_path, cache=False)
+
+        assert agent_calls == ["plan", "plan"]
@@ -0,0 +1,113 @@
+"""Tests for voyager.profiling and `voyager perf report`."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from voyager import profiling
+from voyager.cli import app
+from voyager.profiling import PROFILE_ENV_VAR, get_profile_path, load_traces, span, summarize, trace
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A project with profiling enabled."""
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+    monkeypatch.setenv(PROFILE_ENV_VAR, "1")
+    return tmp_path
+
+
+class TestTrace:
+    """Tests for recording traces."""
+
+    def test_disabled_records_nothing(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without the env var, spans should be the shared no-op and nothing written."""
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+
+        with trace("hook test"):
+            assert span("phase") is profiling._NULL_SPAN
+
+        assert not get_profile_path().exists()
+
+    def test_records_spans(self, project: Path) -> None:
+        """A traced run should append its total and summed phase times."""
+        with trace("hook test"):
+            for _ in range(2):
+                with span("phase"):
+                    pass
+
+        (record,) = load_traces()
+        assert record["command"] == "hook test"
+        assert record["ok"] is True
+        assert set(record["spans"]) == {"phase"}
+        assert record["ms"] >= record["spans"]["phase"]
+
+    def test_exit_codes_and_errors(self, project: Path) -> None:
+        """typer.Exit(0) is a normal return; other exits and errors fail the run."""
+
+        @trace("hook ok")
+        def ok() -> None:
+            raise typer.Exit(0)
+
+        @trace("hook broken")
+        def broken() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(typer.Exit):
+            ok()
+        with pytest.raises(ValueError):
+            broken()
+
+        assert [(r["command"], r["ok"]) for r in load_traces()] == [("hook ok", True), ("hook broken", False)]
+
+    def test_nested_trace_becomes_span(self, project: Path) -> None:
+        """A traced command called from another should be one of its phases."""
+        with trace("outer"), trace("inner"):
+            pass
+
+        (record,) = load_traces()
+        assert record["command"] == "outer"
+        assert "inner" in record["spans"]
+
+    def test_trims_large_file(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The trace file should be cut back to the newest records."""
+        monkeypatch.setattr(profiling, "PROFILE_MAX_BYTES", 100)
+        monkeypatch.setattr(profiling, "PROFILE_KEEP_RECORDS", 3)
+
+        for i in range(10):
+            profiling.append_trace({"command": f"run {i}", "ms": 1.0})
+
+        assert [r["command"] for r in load_traces()][-3:] == ["run 7", "run 8", "run 9"]
+        assert len(load_traces()) < 10
+
+
+class TestReport:
+    """Tests for summarizing traces."""
+
+    def test_percentiles_per_phase(self) -> None:
+        """Each command's total and phases should get their own percentiles."""
+        records = [{"command": "hook a", "ms": float(ms), "spans": {"io": ms / 10}} for ms in range(1, 101)]
+        records.append({"command": "hook a", "ms": 5.0, "spans": {}})
+
+        total, io = summarize(records)
+
+        assert (total.phase, total.samples, total.p50_ms, total.p99_ms) == ("total", 101, 49.0, 99.0)
+        assert (io.phase, io.samples, io.p95_ms) == ("io", 100, 9.5)
+
+    def test_cli_report(self, project: Path) -> None:
+        """`voyager perf report --json` should summarize recorded traces."""
+        with trace("hook test"), span("phase"):
+            pass
+
+        result = CliRunner().invoke(app, ["perf", "report", "--json"])
+
+        assert result.exit_code == 0, result.output
+        assert [(s["command"], s["phase"]) for s in json.loads(result.output)] == [
+            ("hook test", "total"),
+            ("hook test", "phase"),
+        ]
@@ -0,0 +1,214 @@
+"""Tests for voyager.ratelimit module."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from email.utils import formatdate
+from pathlib import Path
+
+import httpx
+import pytest
+
+from voyager import ratelimit
+from voyager.ratelimit import (
+    FileRateLimiter,
+    RateLimiter,
+    TokenBucket,
+    arun_with_rate_limit,
+    backoff_delay,
+    is_rate_limit_error,
+    parse_retry_after,
+    retry_after_from_error,
+    run_with_rate_limit,
+)
+
+
+def _http_error(status: int, retry_after: str | None = None) -> httpx.HTTPStatusError:
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    request = httpx.Request("POST", "http://llm.test/chat")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record sleeps instead of waiting."""
+    sleeps: list[float] = []
+    monkeypatch.setattr(ratelimit.time, "sleep", sleeps.append)
+    monkeypatch.setattr(ratelimit, "_limiters", {})
+    return sleeps
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket reservations."""
+
+    def test_overdraw_waits_for_refill(self) -> None:
+        """Reserving past empty should return the time to repay the debt."""
+        bucket = TokenBucket(60, level=1, updated_at=100.0)
+
+        assert bucket.reserve(1, 100.0) == 0.0
+        assert bucket.reserve(1, 100.0) == pytest.approx(1.0)
+        assert bucket.reserve(1, 100.0) == pytest.approx(2.0)
+
+    def test_refills_up_to_capacity(self) -> None:
+        """Idle time should refill the bucket but never above its rate."""
+        bucket = TokenBucket(60, level=0, updated_at=100.0)
+
+        assert bucket.reserve(1, 1000.0) == 0.0
+        assert bucket.level == pytest.approx(59)
+
+
+class TestRateLimiter:
+    """Tests for the in-process RateLimiter."""
+
+    def test_requests_per_minute(self, _no_sleep: list[float]) -> None:
+        """Calls past the request budget should sleep."""
+        limiter = RateLimiter("t", requests_per_minute=2)
+
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+
+        assert len(_no_sleep) == 1
+        assert _no_sleep[0] == pytest.approx(30, abs=0.5)
+
+    def test_tokens_per_minute(self) -> None:
+        """Token estimates should draw on the token budget."""
+        limiter = RateLimiter("t", tokens_per_minute=1000)
+
+        assert limiter.reserve(1000) == 0.0
+        assert limiter.reserve(500) == pytest.approx(30, abs=0.5)
+
+    def test_penalize_blocks_callers(self) -> None:
+        """A penalty should delay the next reservation even without limits."""
+        limiter = RateLimiter("t")
+        limiter.penalize(5)
+
+        assert limiter.reserve() == pytest.approx(5, abs=0.5)
+
+    def test_max_concurrency(self) -> None:
+        """No more than max_concurrency slots should be held at once."""
+        limiter = RateLimiter("t", max_concurrency=2)
+        running = peak = 0
+
+        async def work() -> None:
+            nonlocal running, peak
+            async with limiter.aslot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        async def main() -> None:
+            await asyncio.gather(*(work() for _ in range(6)))
+
+        asyncio.run(main())
+
+        assert peak == 2
+
+    def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Cancelling a task waiting in aslot should leave the slot free."""
+        limiter = RateLimiter("t", max_concurrency=1)
+
+        async def wait_for_slot() -> None:
+            async with limiter.aslot():
+                pass
+
+        async def main() -> None:
+            async with limiter.aslot():
+                waiter = asyncio.create_task(wait_for_slot())
+                await asyncio.sleep(0.02)
+                waiter.cancel()
+                await asyncio.gather(waiter, return_exceptions=True)
+            await asyncio.sleep(0.02)
+            await asyncio.wait_for(wait_for_slot(), timeout=1.0)
+
+        asyncio.run(main())
+
+
+class TestFileRateLimiter:
+    """Tests for the cross-process FileRateLimiter."""
+
+    def test_budget_shared_between_instances(self, tmp_path: Path) -> None:
+        """Separate limiters on one state file should share a budget."""
+        path = tmp_path / "shared.json"
+        first = FileRateLimiter("t", path, requests_per_minute=1)
+        second = FileRateLimiter("t", path, requests_per_minute=1)
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == pytest.approx(60, abs=0.5)
+
+    def test_penalty_shared_between_instances(self, tmp_path: Path) -> None:
+        """A 429 seen by one process should pause the others."""
+        path = tmp_path / "shared.json"
+        FileRateLimiter("t", path).penalize(10)
+
+        assert FileRateLimiter("t", path).reserve() == pytest.approx(10, abs=0.5)
+
+
+class TestRetryAfter:
+    """Tests for Retry-After parsing and backoff."""
+
+    def test_parse_seconds_and_dates(self) -> None:
+        """Both header forms should parse; junk should not."""
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(formatdate(time.time() + 30, usegmt=True)) == pytest.approx(30, abs=2)
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_reads_http_errors(self) -> None:
+        """429/503 should count as rate limits and expose Retry-After."""
+        assert is_rate_limit_error(_http_error(429))
+        assert is_rate_limit_error(_http_error(503))
+        assert not is_rate_limit_error(_http_error(400))
+        assert retry_after_from_error(_http_error(429, "3")) == 3.0
+        assert retry_after_from_error(ValueError()) is None
+
+    def test_backoff_is_jittered_and_bounded(self) -> None:
+        """Delays should stay within the exponential cap and above Retry-After."""
+        delays = [backoff_delay(3, base=1.0, cap=5.0) for _ in range(50)]
+
+        assert all(0 <= d <= 5.0 for d in delays)
+        assert len(set(delays)) > 1
+        assert 4.0 <= backoff_delay(0, retry_after=4.0, base=1.0) <= 5.0
+
+
+class TestRunWithRateLimit:
+    """Tests for run_with_rate_limit retries."""
+
+    def test_retries_rate_limits_after_retry_after(self, _no_sleep: list[float]) -> None:
+        """A 429 should be retried after at least the server's delay."""
+        limiter = RateLimiter("t")
+        attempts = iter([_http_error(429, "2"), "ok"])
+
+        def send() -> str:
+            result = next(attempts)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        assert run_with_rate_limit(limiter, send) == "ok"
+        assert _no_sleep and _no_sleep[0] >= 2.0
+
+    def test_other_errors_propagate(self) -> None:
+        """Non rate limit errors should not be retried."""
+        calls = 0
+
+        def send() -> str:
+            nonlocal calls
+            calls += 1
+            raise _http_error(400)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            run_with_rate_limit(RateLimiter("t"), send)
+        assert calls == 1
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        """Persistent 429s should raise the last error."""
+
+        async def send() -> str:
+            raise _http_error(429, "0")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(arun_with_rate_limit(RateLimiter("t"), send, max_attempts=2))
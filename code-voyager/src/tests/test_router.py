@@ -0,0 +1,186 @@
+"""Tests for voyager.adapters.ai.router module."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from voyager.adapters.ai.router import LatencyTracker, RouterProvider
+from voyager.adapters.base import ai_provider
+from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse
+
+
+class Stub(AIProvider):
+    """Local provider with a fixed delay and outcome."""
+
+    def __init__(self, name: str, *, delay: float = 0.0, fail: bool = False, available: bool = True) -> None:
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.available = available
+        self.started = 0
+        self.cancelled = 0
+
+    async def acall(self, request: AIRequest) -> AIResponse:
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            return AIResponse(success=False, error=f"{self.name} failed")
+        return AIResponse(success=True, output=self.name)
+
+    def call(self, request: AIRequest) -> AIResponse:
+        return asyncio.run(self.acall(request))
+
+    def is_available(self) -> bool:
+        return self.available
+
+    def get_name(self) -> str:
+        return self.name
+
+
+class ThreadStub(AIProvider):
+    """Blocking provider using the default thread-backed acall."""
+
+    def __init__(self, name: str, *, delay: float = 0.0) -> None:
+        self.name = name
+        self.delay = delay
+
+    def call(self, request: AIRequest) -> AIResponse:
+        time.sleep(self.delay)
+        return AIResponse(success=True, output=self.name)
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_name(self) -> str:
+        return self.name
+
+
+@pytest.fixture(autouse=True)
+def _clear_availability() -> None:
+    ai_provider._availability_cache.clear()
+
+
+class TestLatencyTracker:
+    """Tests for LatencyTracker statistics."""
+
+    def test_percentiles_and_error_rate(self) -> None:
+        """p50/p95 should come from successful calls; errors count separately."""
+        tracker = LatencyTracker()
+        for ms in range(1, 21):
+            tracker.record("p", "m", ms / 1000, True)
+        tracker.record("p", "m", 0.0, False)
+
+        stats = tracker.stats("p", "m")
+
+        assert stats.samples == 21
+        assert stats.p50_ms == pytest.approx(10)
+        assert stats.p95_ms == pytest.approx(19)
+        assert stats.error_rate == pytest.approx(1 / 21)
+
+    def test_window_is_rolling(self) -> None:
+        """Only the most recent calls should count."""
+        tracker = LatencyTracker(window=2)
+        tracker.record("p", "", 1.0, False)
+        tracker.record("p", "", 0.1, True)
+        tracker.record("p", "", 0.1, True)
+
+        assert tracker.stats("p", "").error_rate == 0.0
+
+
+class TestRouting:
+    """Tests for provider selection and fallback."""
+
+    def test_prefers_fastest_measured_provider(self) -> None:
+        """After measuring both, requests should go to the lower-p50 provider."""
+        slow, fast = Stub("slow", delay=0.05), Stub("fast", delay=0.0)
+        router = RouterProvider([slow, fast])
+        router.tracker.record("slow", "", 0.05, True)
+        router.tracker.record("fast", "", 0.001, True)
+
+        response = router.call(AIRequest(prompt="q"))
+
+        assert response.output == "fast"
+        assert response.metadata["routed_to"] == "fast"
+        assert slow.started == 0
+
+    def test_falls_back_on_failure(self) -> None:
+        """A failing provider should not fail the request."""
+        router = RouterProvider([Stub("broken", fail=True), Stub("backup")])
+
+        response = router.call(AIRequest(prompt="q"))
+
+        assert response.success is True
+        assert response.output == "backup"
+        assert router.stats(router._providers[0]).error_rate == 1.0
+
+    def test_skips_unavailable_and_demotes_unhealthy(self) -> None:
+        """Unavailable providers are skipped; error-prone ones go last."""
+        flaky, down, good = Stub("flaky"), Stub("down", available=False), Stub("good")
+        router = RouterProvider([flaky, down, good])
+        for _ in range(3):
+            router.tracker.record("flaky", "", 0.001, False)
+        router.tracker.record("good", "", 0.5, True)
+
+        assert [p.get_name() for p in router.rank(AIRequest(prompt="q"))] == ["good", "flaky"]
+
+    def test_all_failures_are_reported(self) -> None:
+        """If every provider fails, the error should name each one."""
+        router = RouterProvider([Stub("a", fail=True), Stub("b", fail=True)])
+
+        response = router.call(AIRequest(prompt="q"))
+
+        assert response.success is False
+        assert "a: a failed" in response.error
+        assert "b: b failed" in response.error
+
+
+class TestHedging:
+    """Tests for hedged requests."""
+
+    def test_hedge_wins_and_loser_is_cancelled(self) -> None:
+        """A slow primary should be raced and cancelled once the hedge succeeds."""
+        primary, hedge = Stub("primary", delay=1.0), Stub("hedge", delay=0.0)
+        router = RouterProvider([primary, hedge], hedge_after_seconds=0.05)
+
+        response = router.call(AIRequest(prompt="q"))
+
+        assert response.output == "hedge"
+        assert response.metadata["hedged"] == "true"
+        assert primary.cancelled == 1
+
+    def test_no_hedge_when_primary_is_fast(self) -> None:
+        """The hedge should not fire before the threshold."""
+        primary, hedge = Stub("primary"), Stub("hedge")
+        router = RouterProvider([primary, hedge], hedge_after_seconds=0.5)
+
+        response = router.call(AIRequest(prompt="q"))
+
+        assert response.output == "primary"
+        assert response.metadata["hedged"] == "false"
+        assert hedge.started == 0
+
+    def test_thread_backed_loser_does_not_delay_winner(self) -> None:
+        """The winner should return without waiting for a blocking loser's thread."""
+        router = RouterProvider([ThreadStub("slow", delay=2.0), ThreadStub("fast")], hedge_after_seconds=0.05)
+
+        started = time.perf_counter()
+        response = router.call(AIRequest(prompt="q"))
+
+        assert response.output == "fast"
+        assert time.perf_counter() - started < 1.0
+
+    def test_call_inside_running_loop(self) -> None:
+        """call() should work when an event loop is already running."""
+        router = RouterProvider([Stub("only")])
+
+        async def main() -> AIResponse:
+            return router.call(AIRequest(prompt="q"))
+
+        assert asyncio.run(main()).output == "only"
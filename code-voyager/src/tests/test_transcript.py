@@ -0,0 +1,134 @@
+"""Tests for voyager.transcript module."""
+
+from __future__ import annotations
+
+from voyager.transcript import (
+    compress_transcript,
+    estimate_tokens,
+    truncate_to_tokens,
+)
+
+
+def _user(text: str) -> dict:
+    return {"type": "user", "message": {"role": "user", "content": text}}
+
+
+def _tool_call(name: str, tool_input: dict, tool_use_id: str = "") -> dict:
+    return {
+        "type": "assistant",
+        "message": {"content": [{"type": "tool_use", "id": tool_use_id, "name": name, "input": tool_input}]},
+    }
+
+
+def _tool_result(text: str, tool_use_id: str = "") -> dict:
+    return {
+        "type": "user",
+        "message": {"content": [{"type": "tool_result", "tool_use_id": tool_use_id, "content": text}]},
+    }
+
+
+class TestEstimateTokens:
+    """Tests for estimate_tokens function."""
+
+    def test_empty_text(self) -> None:
+        assert estimate_tokens("") == 0
+
+    def test_counts_words_and_punctuation(self) -> None:
+        assert estimate_tokens("hello, world!") == 4
+
+    def test_long_words_cost_more(self) -> None:
+        assert estimate_tokens("internationalization") > estimate_tokens("word")
+
+
+class TestTruncateToTokens:
+    """Tests for truncate_to_tokens function."""
+
+    def test_keeps_text_within_budget(self) -> None:
+        assert truncate_to_tokens("short text", 100) == "short text"
+
+    def test_truncates_to_budget(self) -> None:
+        text = "word " * 1000
+
+        result = truncate_to_tokens(text, 50)
+
+        assert result.endswith("(truncated)")
+        assert estimate_tokens(result) <= 50 + estimate_tokens("\n... (truncated)")
+
+
+class TestCompressTranscript:
+    """Tests for compress_transcript function."""
+
+    def test_empty_transcript(self) -> None:
+        result = compress_transcript([])
+
+        assert result.text == "(empty transcript)"
+        assert result.kept_lines == 0
+
+    def test_renders_flat_and_block_formats(self) -> None:
+        entries = [
+            {"type": "user", "message": "flat question"},
+            _tool_call("Read", {"file_path": "a.py"}),
+            {"type": "tool_result", "tool": "Bash"},
+        ]
+
+        text = compress_transcript(entries).text
+
+        assert "USER: flat question" in text
+        assert 'TOOL: Read {"file_path": "a.py"}' in text
+        assert "RESULT: Bash completed" in text
+
+    def test_collapses_repeated_call_result_pairs(self) -> None:
+        entries = []
+        for i in range(5):
+            entries += [_tool_call("Bash", {"command": "pytest"}, f"t{i}"), _tool_result("all tests passed", f"t{i}")]
+
+        result = compress_transcript(entries)
+
+        assert result.total_lines == 2
+        assert result.text.splitlines() == [
+            'TOOL: Bash {"command": "pytest"} (x5)',
+            "RESULT: all tests passed (x5)",
+        ]
+
+    def test_keeps_changed_results_of_repeated_call(self) -> None:
+        entries = [
+            _tool_call("Bash", {"command": "pytest"}, "t1"),
+            _tool_result("1 failed", "t1"),
+            _tool_call("Bash", {"command": "pytest"}, "t2"),
+            _tool_result("all tests passed", "t2"),
+        ]
+
+        lines = compress_transcript(entries).text.splitlines()
+
+        assert lines == ["RESULT: 1 failed", 'TOOL: Bash {"command": "pytest"} (x2)', "RESULT: all tests passed"]
+
+    def test_deduplicates_repeated_tool_calls(self) -> None:
+        entries = [
+            _tool_call("Read", {"file_path": "a.py"}),
+            _user("between"),
+            _tool_call("Read", {"file_path": "a.py"}),
+        ]
+
+        result = compress_transcript(entries)
+        lines = result.text.splitlines()
+
+        assert sum("TOOL: Read" in line for line in lines) == 1
+        assert lines[-1].endswith("(x2)")
+        assert lines[0] == "USER: between"
+
+    def test_prefers_user_turns_over_tool_noise(self) -> None:
+        entries = [_user("the important goal")]
+        entries += [_tool_result(f"noisy output {i} " + "x" * 150) for i in range(50)]
+
+        result = compress_transcript(entries, budget_tokens=100)
+
+        assert "the important goal" in result.text
+        assert result.kept_lines < result.total_lines
+        assert result.estimated_tokens <= 100
+
+    def test_keeps_original_order(self) -> None:
+        entries = [_user(f"message {i}") for i in range(5)]
+
+        lines = compress_transcript(entries).text.splitlines()
+
+        assert lines == [f"USER: message {i}" for i in range(5)]
@@ -4,13 +4,14 @@ This module provides abstractions for integrating Voyager with different
 IDEs and AI providers, making it IDE and AI-agnostic.
 """
 
-from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse
+from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse, AIStreamChunk
 from voyager.adapters.base.ide_adapter import IDEAdapter, IDEContext, IDEEvent
 
 __all__ = [
     "AIProvider",
     "AIRequest",
     "AIResponse",
+    "AIStreamChunk",
     "IDEAdapter",
     "IDEContext",
     "IDEEvent",
@@ -7,6 +7,7 @@ from voyager.adapters.ai.ollama import OllamaProvider
 from voyager.adapters.ai.openai_compatible import OpenAICompatibleProvider
 from voyager.adapters.ai.openai_provider import OpenAIProvider
 from voyager.adapters.ai.openrouter import OpenRouterProvider
+from voyager.adapters.ai.router import RouterProvider
 
 __all__ = [
     "ClaudeProvider",
@@ -16,4 +17,5 @@ __all__ = [
     "OpenAICompatibleProvider",
     "OpenAIProvider",
     "OpenRouterProvider",
+    "RouterProvider",
 ]
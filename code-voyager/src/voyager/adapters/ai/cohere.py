@@ -9,6 +9,7 @@ from __future__ import annotations
 import os
 
 from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse
+from voyager.adapters.base.client_pool import get_sdk_client
 from voyager.config import get_config
 from voyager.logging import get_logger
 
@@ -53,7 +54,7 @@ class CohereProvider(AIProvider):
         Returns:
             AIResponse with the result.
         """
-        if not self.is_available():
+        if not self.check_available():
             return AIResponse(
                 success=False,
                 error="Cohere provider not available. Install 'cohere' package and set COHERE_API_KEY.",
@@ -75,8 +76,8 @@ class CohereProvider(AIProvider):
                     metadata={"provider": "cohere"},
                 )
 
-            # Create client
-            client = cohere.Client(api_key)
+            # Reuse the pooled client for this key
+            client = get_sdk_client(("cohere", api_key), lambda: cohere.Client(api_key))
 
             # Get model
             model = request.model or ai_config.model
@@ -9,6 +9,7 @@ from __future__ import annotations
 import os
 
 from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse
+from voyager.adapters.base.client_pool import get_sdk_client
 from voyager.config import get_config
 from voyager.logging import get_logger
 
@@ -53,7 +54,7 @@ class GeminiProvider(AIProvider):
         Returns:
             AIResponse with the result.
         """
-        if not self.is_available():
+        if not self.check_available():
             return AIResponse(
                 success=False,
                 error="Gemini provider not available. Install 'google-generativeai' package and set GOOGLE_API_KEY.",
@@ -78,9 +79,9 @@ class GeminiProvider(AIProvider):
             # Configure API
             genai.configure(api_key=api_key)
 
-            # Get model
+            # Reuse the pooled model client
             model_name = request.model or ai_config.model
-            model = genai.GenerativeModel(model_name)
+            model = get_sdk_client(("gemini", api_key, model_name), lambda: genai.GenerativeModel(model_name))
 
             # Build prompt with system instruction if available
             if request.system_prompt:
@@ -6,11 +6,23 @@ This provider integrates with Ollama for running local language models
 
 from __future__ import annotations
 
+import json
+from collections.abc import Iterator
+from typing import Any
+
 import httpx
 
-from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse
+from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse, AIStreamChunk, StreamTimer
+from voyager.adapters.base.client_pool import get_async_http_client, get_http_client
 from voyager.config import get_config
 from voyager.logging import get_logger
+from voyager.ratelimit import (
+    arun_with_rate_limit,
+    estimate_request_tokens,
+    limiter_for_provider,
+    penalize_if_rate_limited,
+    run_with_rate_limit,
+)
 
 _logger = get_logger("provider.ollama")
 
@@ -30,6 +42,69 @@ class OllamaProvider(AIProvider):
         """
         self._base_url = base_url
 
+    def _get_base_url(self) -> str:
+        """Resolve the Ollama base URL from the constructor or config."""
+        ai_config = get_config().get_ai_config("ollama")
+        return self._base_url or ai_config.base_url or "http://localhost:11434"
+
+    def pool_key(self) -> str:
+        """Pool clients and availability per Ollama base URL."""
+        return self._get_base_url()
+
+    def _build_body(self, request: AIRequest) -> dict[str, Any]:
+        """Build the /api/chat request body."""
+        ai_config = get_config().get_ai_config("ollama")
+
+        # Build messages
+        messages = []
+        if request.system_prompt:
+            messages.append({"role": "system", "content": request.system_prompt})
+        messages.append({"role": "user", "content": request.prompt})
+
+        return {
+            "model": request.model or ai_config.model,
+            "messages": messages,
+            "stream": False,
+        }
+
+    def _unavailable(self) -> AIResponse:
+        return AIResponse(
+            success=False,
+            error="Ollama provider not available. Is Ollama running?",
+            metadata={"provider": "ollama"},
+        )
+
+    def _to_response(self, data: dict[str, Any], body: dict[str, Any], base_url: str) -> AIResponse:
+        """Convert an /api/chat reply to an AIResponse."""
+        return AIResponse(
+            success=True,
+            output=data.get("message", {}).get("content", ""),
+            files=[],
+            metadata={
+                "provider": "ollama",
+                "model": body["model"],
+                "base_url": base_url,
+            },
+        )
+
+    def _to_error(self, error: Exception) -> AIResponse:
+        """Convert an exception to a failed AIResponse."""
+        if isinstance(error, httpx.HTTPError):
+            _logger.error("Ollama HTTP error: %s", error)
+            if isinstance(error, httpx.TransportError):
+                self.invalidate_availability()
+            return AIResponse(
+                success=False,
+                error=f"HTTP error: {error}",
+                metadata={"provider": "ollama"},
+            )
+        _logger.error("Ollama call failed: %s", error)
+        return AIResponse(
+            success=False,
+            error=str(error),
+            metadata={"provider": "ollama"},
+        )
+
     def call(self, request: AIRequest) -> AIResponse:
         """Make a call to Ollama.
 
@@ -39,80 +114,132 @@ class OllamaProvider(AIProvider):
         Returns:
             AIResponse with the result.
         """
-        if not self.is_available():
-            return AIResponse(
-                success=False,
-                error="Ollama provider not available. Is Ollama running?",
-                metadata={"provider": "ollama"},
-            )
+        if not self.check_available():
+            return self._unavailable()
 
         try:
-            config = get_config()
-            ai_config = config.get_ai_config("ollama")
-
-            base_url = self._base_url or ai_config.base_url or "http://localhost:11434"
-            model = request.model or ai_config.model
-
-            # Build messages
-            messages = []
-            if request.system_prompt:
-                messages.append({"role": "system", "content": request.system_prompt})
-            messages.append({"role": "user", "content": request.prompt})
-
-            # Make the API call
-            with httpx.Client(timeout=request.timeout_seconds) as client:
-                response = client.post(
-                    f"{base_url}/api/chat",
-                    json={
-                        "model": model,
-                        "messages": messages,
-                        "stream": False,
-                    },
-                )
+            base_url = self._get_base_url()
+            body = self._build_body(request)
+
+            # Make the API call on the pooled keep-alive client
+            client = get_http_client("ollama", base_url)
+
+            def send() -> httpx.Response:
+                response = client.post(f"{base_url}/api/chat", json=body, timeout=request.timeout_seconds)
                 response.raise_for_status()
-                data = response.json()
+                return response
 
-            output = data.get("message", {}).get("content", "")
+            tokens = estimate_request_tokens(request.system_prompt, request.prompt)
+            response = run_with_rate_limit(limiter_for_provider("ollama"), send, tokens=tokens)
+            return self._to_response(response.json(), body, base_url)
 
-            return AIResponse(
-                success=True,
-                output=output,
-                files=[],
-                metadata={
-                    "provider": "ollama",
-                    "model": model,
-                    "base_url": base_url,
-                },
-            )
+        except Exception as e:
+            return self._to_error(e)
+
+    def stream(self, request: AIRequest) -> Iterator[AIStreamChunk]:
+        """Stream a chat completion from Ollama.
+
+        Ollama streams newline-delimited JSON objects, each carrying a
+        message.content delta, until one arrives with done=true.
+
+        Args:
+            request: The AI request.
+
+        Yields:
+            AIStreamChunk deltas, then a final chunk with timing metadata.
+        """
+        timer = StreamTimer()
+        limiter = limiter_for_provider("ollama")
+        if not self.check_available():
+            failed = self._unavailable()
+            yield timer.finish(failed.metadata, error=failed.error)
+            return
+
+        try:
+            base_url = self._get_base_url()
+            body = {**self._build_body(request), "stream": True}
+
+            client = get_http_client("ollama", base_url)
+            tokens = estimate_request_tokens(request.system_prompt, request.prompt)
+            with (
+                limiter.slot(tokens),
+                client.stream("POST", f"{base_url}/api/chat", json=body, timeout=request.timeout_seconds) as response,
+            ):
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line.strip():
+                        continue
+                    data = json.loads(line)
+                    if "error" in data:
+                        raise RuntimeError(data["error"])
+                    delta = data.get("message", {}).get("content", "")
+                    if delta:
+                        yield timer.chunk(delta)
+                    if data.get("done"):
+                        break
+
+            yield timer.finish({"provider": "ollama", "model": body["model"], "base_url": base_url})
 
-        except httpx.HTTPError as e:
-            _logger.error("Ollama HTTP error: %s", e)
-            return AIResponse(
-                success=False,
-                error=f"HTTP error: {e}",
-                metadata={"provider": "ollama"},
-            )
         except Exception as e:
-            _logger.error("Ollama call failed: %s", e)
-            return AIResponse(
-                success=False,
-                error=str(e),
-                metadata={"provider": "ollama"},
-            )
+            penalize_if_rate_limited(limiter, e)
+            failed = self._to_error(e)
+            yield timer.finish(failed.metadata, error=failed.error)
+
+    async def acall(self, request: AIRequest) -> AIResponse:
+        """Make a call to Ollama on the pooled async client.
+
+        Args:
+            request: The AI request.
+
+        Returns:
+            AIResponse with the result.
+        """
+        if not await self.acheck_available():
+            return self._unavailable()
+
+        try:
+            base_url = self._get_base_url()
+            body = self._build_body(request)
+
+            client = get_async_http_client("ollama", base_url)
+
+            async def send() -> httpx.Response:
+                response = await client.post(f"{base_url}/api/chat", json=body, timeout=request.timeout_seconds)
+                response.raise_for_status()
+                return response
+
+            tokens = estimate_request_tokens(request.system_prompt, request.prompt)
+            response = await arun_with_rate_limit(limiter_for_provider("ollama"), send, tokens=tokens)
+            return self._to_response(response.json(), body, base_url)
+
+        except Exception as e:
+            return self._to_error(e)
 
     def is_available(self) -> bool:
         """Check if Ollama provider is available.
 
+        Probes /api/tags. Callers on the request path use check_available(),
+        which caches this result for a short TTL.
+
         Returns:
             True if Ollama is running and responding.
         """
         try:
-            config = get_config()
-            ai_config = config.get_ai_config("ollama")
-            base_url = self._base_url or ai_config.base_url or "http://localhost:11434"
+            base_url = self._get_base_url()
+            response = get_http_client("ollama", base_url).get(f"{base_url}/api/tags", timeout=2.0)
+            return response.status_code == 200
+        except Exception:
+            return False
 
-            with httpx.Client(timeout=2.0) as client:
-                response = client.get(f"{base_url}/api/tags")
-                return response.status_code == 200
+    async def ais_available(self) -> bool:
+        """Probe /api/tags on the pooled async client.
+
+        Returns:
+            True if Ollama is running and responding.
+        """
+        try:
+            base_url = self._get_base_url()
+            response = await get_async_http_client("ollama", base_url).get(f"{base_url}/api/tags", timeout=2.0)
+            return response.status_code == 200
         except Exception:
             return False
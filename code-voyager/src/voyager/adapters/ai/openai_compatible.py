@@ -7,10 +7,19 @@ Supports: Azure OpenAI, LocalAI, Together AI, Anyscale, Fireworks AI, and more.
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from typing import Any
 
-from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse
+from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse, AIStreamChunk, StreamTimer
+from voyager.adapters.base.client_pool import get_sdk_client
 from voyager.config import get_config
 from voyager.logging import get_logger
+from voyager.ratelimit import (
+    estimate_request_tokens,
+    limiter_for_provider,
+    penalize_if_rate_limited,
+    run_with_rate_limit,
+)
 
 _logger = get_logger("provider.openai_compatible")
 
@@ -44,6 +53,60 @@ class OpenAICompatibleProvider(AIProvider):
         self._base_url = base_url
         self._api_key = api_key
 
+    def _unavailable(self) -> AIResponse:
+        return AIResponse(
+            success=False,
+            error="OpenAI-compatible provider not available. Install 'openai' package and configure base_url.",
+            metadata={"provider": "openai_compatible"},
+        )
+
+    def _prepare(self, request: AIRequest) -> tuple[Any, dict[str, Any], str] | AIResponse:
+        """Get the pooled client and completion kwargs, or a failed response if misconfigured."""
+        from openai import OpenAI
+
+        config = get_config()
+        ai_config = config.get_ai_config("openai_compatible")
+
+        # Get base URL
+        base_url = self._base_url or ai_config.base_url
+        if not base_url:
+            return AIResponse(
+                success=False,
+                error="base_url not configured for openai_compatible provider",
+                metadata={"provider": "openai_compatible"},
+            )
+
+        # Get API key
+        api_key = self._api_key
+        if not api_key:
+            api_key_env = ai_config.api_key_env or "OPENAI_API_KEY"
+            api_key = os.environ.get(api_key_env)
+
+        # Reuse the pooled client for this endpoint
+        client = get_sdk_client(
+            ("openai_compatible", base_url, api_key),
+            lambda: OpenAI(
+                base_url=base_url,
+                api_key=api_key or "not-needed",  # Some providers don't need keys
+                max_retries=0,  # run_with_rate_limit owns retries and backoff
+            ),
+        )
+
+        # Build messages
+        messages = []
+        if request.system_prompt:
+            messages.append({"role": "system", "content": request.system_prompt})
+        messages.append({"role": "user", "content": request.prompt})
+
+        kwargs = {
+            "model": request.model or ai_config.model,
+            "messages": messages,
+            "temperature": request.temperature or ai_config.extra.get("temperature", 0.7),
+            "max_tokens": ai_config.extra.get("max_tokens"),
+            "timeout": request.timeout_seconds,
+        }
+        return client, kwargs, base_url
+
     def call(self, request: AIRequest) -> AIResponse:
         """Make a call to the OpenAI-compatible API.
 
@@ -53,53 +116,21 @@ class OpenAICompatibleProvider(AIProvider):
         Returns:
             AIResponse with the result.
         """
-        if not self.is_available():
-            return AIResponse(
-                success=False,
-                error="OpenAI-compatible provider not available. Install 'openai' package and configure base_url.",
-                metadata={"provider": "openai_compatible"},
-            )
+        if not self.check_available():
+            return self._unavailable()
 
         try:
-            from openai import OpenAI
-
-            config = get_config()
-            ai_config = config.get_ai_config("openai_compatible")
-
-            # Get base URL
-            base_url = self._base_url or ai_config.base_url
-            if not base_url:
-                return AIResponse(
-                    success=False,
-                    error="base_url not configured for openai_compatible provider",
-                    metadata={"provider": "openai_compatible"},
-                )
-
-            # Get API key
-            api_key = self._api_key
-            if not api_key:
-                api_key_env = ai_config.api_key_env or "OPENAI_API_KEY"
-                api_key = os.environ.get(api_key_env)
-
-            # Create client
-            client = OpenAI(
-                base_url=base_url,
-                api_key=api_key or "not-needed",  # Some providers don't need keys
-            )
-
-            # Build messages
-            messages = []
-            if request.system_prompt:
-                messages.append({"role": "system", "content": request.system_prompt})
-            messages.append({"role": "user", "content": request.prompt})
-
-            # Make the API call
-            model = request.model or ai_config.model
-            response = client.chat.completions.create(
-                model=model,
-                messages=messages,
-                temperature=request.temperature or ai_config.extra.get("temperature", 0.7),
-                max_tokens=ai_config.extra.get("max_tokens"),
+            prepared = self._prepare(request)
+            if isinstance(prepared, AIResponse):
+                return prepared
+            client, kwargs, base_url = prepared
+
+            # Make the API call within the configured rate limits
+            tokens = estimate_request_tokens(request.system_prompt, request.prompt)
+            response = run_with_rate_limit(
+                limiter_for_provider("openai_compatible"),
+                lambda: client.chat.completions.create(**kwargs),
+                tokens=tokens,
             )
 
             output = response.choices[0].message.content or ""
@@ -111,7 +142,7 @@ class OpenAICompatibleProvider(AIProvider):
                 metadata={
                     "provider": "openai_compatible",
                     "base_url": base_url,
-                    "model": model,
+                    "model": kwargs["model"],
                     "usage": {
                         "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
                         "completion_tokens": response.usage.completion_tokens if response.usage else 0,
@@ -128,6 +159,46 @@ class OpenAICompatibleProvider(AIProvider):
                 metadata={"provider": "openai_compatible"},
             )
 
+    def stream(self, request: AIRequest) -> Iterator[AIStreamChunk]:
+        """Stream a chat completion from the OpenAI-compatible API.
+
+        Args:
+            request: The AI request.
+
+        Yields:
+            AIStreamChunk deltas, then a final chunk with timing metadata.
+        """
+        timer = StreamTimer()
+        limiter = limiter_for_provider("openai_compatible")
+        if not self.check_available():
+            failed = self._unavailable()
+            yield timer.finish(failed.metadata, error=failed.error)
+            return
+
+        try:
+            prepared = self._prepare(request)
+            if isinstance(prepared, AIResponse):
+                yield timer.finish(prepared.metadata, error=prepared.error)
+                return
+            client, kwargs, base_url = prepared
+
+            with limiter.slot(estimate_request_tokens(request.system_prompt, request.prompt)):
+                for chunk in client.chat.completions.create(**kwargs, stream=True):
+                    for choice in chunk.choices:
+                        if choice.delta and choice.delta.content:
+                            yield timer.chunk(choice.delta.content)
+
+            yield timer.finish({"provider": "openai_compatible", "base_url": base_url, "model": kwargs["model"]})
+
+        except Exception as e:
+            penalize_if_rate_limited(limiter, e)
+            _logger.error("OpenAI-compatible stream failed: %s", e)
+            yield timer.finish({"provider": "openai_compatible"}, error=str(e))
+
+    def pool_key(self) -> str:
+        """Pool availability per configured base URL."""
+        return self._base_url or get_config().get_ai_config("openai_compatible").base_url or ""
+
     def is_available(self) -> bool:
         """Check if OpenAI-compatible provider is available.
 
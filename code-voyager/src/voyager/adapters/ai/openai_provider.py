@@ -10,8 +10,10 @@ import os
 from pathlib import Path
 
 from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse
+from voyager.adapters.base.client_pool import get_sdk_client
 from voyager.config import get_config
 from voyager.logging import get_logger
+from voyager.ratelimit import estimate_request_tokens, limiter_for_provider, run_with_rate_limit
 
 _logger = get_logger("provider.openai")
 
@@ -36,7 +38,7 @@ class OpenAIProvider(AIProvider):
         Returns:
             AIResponse with the result.
         """
-        if not self.is_available():
+        if not self.check_available():
             return AIResponse(
                 success=False,
                 error="OpenAI provider not available. Install 'openai' package and set OPENAI_API_KEY.",
@@ -46,7 +48,7 @@ class OpenAIProvider(AIProvider):
         try:
             from openai import OpenAI
 
-            client = OpenAI(api_key=self._api_key)
+            client = get_sdk_client(("openai", self._api_key), lambda: OpenAI(api_key=self._api_key, max_retries=0))
             config = get_config()
             ai_config = config.get_ai_config("openai")
 
@@ -56,12 +58,16 @@ class OpenAIProvider(AIProvider):
                 messages.append({"role": "system", "content": request.system_prompt})
             messages.append({"role": "user", "content": request.prompt})
 
-            # Make the API call
+            # Make the API call within the configured rate limits
             model = request.model or ai_config.model
-            response = client.chat.completions.create(
-                model=model,
-                messages=messages,
-                temperature=request.temperature or 0.7,
+            response = run_with_rate_limit(
+                limiter_for_provider("openai"),
+                lambda: client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=request.temperature or 0.7,
+                ),
+                tokens=estimate_request_tokens(request.system_prompt, request.prompt),
             )
 
             output = response.choices[0].message.content or ""
@@ -6,14 +6,58 @@ through a single API. Great for accessing the latest models without managing mul
 
 from __future__ import annotations
 
+import json
 import os
+from collections.abc import Iterable, Iterator
+from typing import Any
 
-from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse
+from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse, AIStreamChunk, StreamTimer
+from voyager.adapters.base.client_pool import get_async_http_client, get_http_client
 from voyager.config import get_config
 from voyager.logging import get_logger
+from voyager.ratelimit import (
+    arun_with_rate_limit,
+    estimate_request_tokens,
+    limiter_for_provider,
+    penalize_if_rate_limited,
+    run_with_rate_limit,
+)
 
 _logger = get_logger("provider.openrouter")
 
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+
+def iter_sse_deltas(lines: Iterable[str], usage: dict[str, Any] | None = None) -> Iterator[str]:
+    """Extract content deltas from an OpenAI-style chat completion event stream.
+
+    Args:
+        lines: Raw event stream lines ("data: {...}", comments, blanks).
+        usage: If given, updated with the usage block when the stream sends one.
+
+    Yields:
+        Non-empty choices[0].delta.content strings, until "data: [DONE]".
+
+    Raises:
+        RuntimeError: If the stream reports an error event.
+    """
+    for line in lines:
+        if not line.startswith("data:"):
+            continue  # Blank separators and ": keep-alive" comments
+        payload = line[len("data:") :].strip()
+        if payload == "[DONE]":
+            return
+        data = json.loads(payload)
+        if "error" in data:
+            error = data["error"]
+            raise RuntimeError(error.get("message", str(error)) if isinstance(error, dict) else str(error))
+        if usage is not None and data.get("usage"):
+            usage.update(data["usage"])
+        for choice in data.get("choices") or []:
+            delta = (choice.get("delta") or {}).get("content")
+            if delta:
+                yield delta
+
 
 class OpenRouterProvider(AIProvider):
     """AI provider for OpenRouter (https://openrouter.ai/).
@@ -40,17 +84,144 @@ class OpenRouterProvider(AIProvider):
         # or "meta-llama/llama-3.1-70b-instruct"
     """
 
-    def __init__(self, api_key: str | None = None, site_url: str | None = None, app_name: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        site_url: str | None = None,
+        app_name: str | None = None,
+        base_url: str | None = None,
+    ):
         """Initialize the OpenRouter provider.
 
         Args:
             api_key: OpenRouter API key. If None, reads from OPENROUTER_API_KEY.
             site_url: Your site URL (optional, for rankings).
             app_name: Your app name (optional, for rankings).
+            base_url: API base URL. If None, uses config or the public endpoint.
         """
         self._api_key = api_key
         self._site_url = site_url
         self._app_name = app_name
+        self._base_url = base_url
+
+    def _get_base_url(self) -> str:
+        """Resolve the API base URL from the constructor or config."""
+        ai_config = get_config().get_ai_config("openrouter")
+        return self._base_url or ai_config.base_url or OPENROUTER_BASE_URL
+
+    def pool_key(self) -> str:
+        """Pool clients and availability per base URL."""
+        return self._get_base_url()
+
+    def _unavailable(self) -> AIResponse:
+        return AIResponse(
+            success=False,
+            error="OpenRouter provider not available. Install 'httpx' package and set OPENROUTER_API_KEY.",
+            metadata={"provider": "openrouter"},
+        )
+
+    def _prepare(self, request: AIRequest) -> tuple[dict[str, str], dict[str, Any]] | AIResponse:
+        """Build request headers and body, or a failed response if misconfigured."""
+        ai_config = get_config().get_ai_config("openrouter")
+
+        # Get API key
+        api_key = self._api_key or os.environ.get("OPENROUTER_API_KEY")
+        if not api_key:
+            return AIResponse(
+                success=False,
+                error="OPENROUTER_API_KEY environment variable not set",
+                metadata={"provider": "openrouter"},
+            )
+
+        # Build headers
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+
+        # Optional: Add site URL and app name for OpenRouter rankings
+        site_url = self._site_url or ai_config.extra.get("site_url")
+        app_name = self._app_name or ai_config.extra.get("app_name", "code-voyager")
+        if site_url:
+            headers["HTTP-Referer"] = site_url
+        if app_name:
+            headers["X-Title"] = app_name
+
+        # Build messages
+        messages = []
+        if request.system_prompt:
+            messages.append({"role": "system", "content": request.system_prompt})
+        messages.append({"role": "user", "content": request.prompt})
+
+        # Prepare request body
+        body: dict[str, Any] = {
+            "model": request.model or ai_config.model,
+            "messages": messages,
+        }
+
+        # Optional parameters
+        if request.temperature is not None:
+            body["temperature"] = request.temperature
+        elif "temperature" in ai_config.extra:
+            body["temperature"] = ai_config.extra["temperature"]
+
+        if "max_tokens" in ai_config.extra:
+            body["max_tokens"] = ai_config.extra["max_tokens"]
+
+        return headers, body
+
+    def _to_response(self, data: dict[str, Any], model: str) -> AIResponse:
+        """Convert a chat completions reply to an AIResponse."""
+        # Extract response
+        if "error" in data:
+            return AIResponse(
+                success=False,
+                error=data["error"].get("message", str(data["error"])),
+                metadata={"provider": "openrouter"},
+            )
+
+        output = data["choices"][0]["message"]["content"]
+
+        # Extract usage and cost information
+        usage = data.get("usage", {})
+        metadata = {
+            "provider": "openrouter",
+            "model": model,
+            "usage": {
+                "prompt_tokens": usage.get("prompt_tokens", 0),
+                "completion_tokens": usage.get("completion_tokens", 0),
+                "total_tokens": usage.get("total_tokens", 0),
+            },
+        }
+
+        # OpenRouter provides cost information
+        if "total_cost" in usage:
+            metadata["cost_usd"] = usage["total_cost"]
+
+        return AIResponse(
+            success=True,
+            output=output,
+            files=[],
+            metadata=metadata,
+        )
+
+    def _to_error(self, error: Exception) -> AIResponse:
+        """Convert an exception to a failed AIResponse."""
+        import httpx
+
+        if isinstance(error, httpx.HTTPError):
+            _logger.error("OpenRouter HTTP error: %s", error)
+            return AIResponse(
+                success=False,
+                error=f"HTTP error: {error}",
+                metadata={"provider": "openrouter"},
+            )
+        _logger.error("OpenRouter call failed: %s", error)
+        return AIResponse(
+            success=False,
+            error=str(error),
+            metadata={"provider": "openrouter"},
+        )
 
     def call(self, request: AIRequest) -> AIResponse:
         """Make a call to OpenRouter.
@@ -61,121 +232,127 @@ class OpenRouterProvider(AIProvider):
         Returns:
             AIResponse with the result.
         """
-        if not self.is_available():
-            return AIResponse(
-                success=False,
-                error="OpenRouter provider not available. Install 'httpx' package and set OPENROUTER_API_KEY.",
-                metadata={"provider": "openrouter"},
-            )
+        if not self.check_available():
+            return self._unavailable()
 
         try:
-            import httpx
+            prepared = self._prepare(request)
+            if isinstance(prepared, AIResponse):
+                return prepared
+            headers, body = prepared
 
-            config = get_config()
-            ai_config = config.get_ai_config("openrouter")
+            # Make the API call on the pooled keep-alive client
+            base_url = self._get_base_url()
+            client = get_http_client("openrouter", base_url)
 
-            # Get API key
-            api_key = self._api_key or os.environ.get("OPENROUTER_API_KEY")
-            if not api_key:
-                return AIResponse(
-                    success=False,
-                    error="OPENROUTER_API_KEY environment variable not set",
-                    metadata={"provider": "openrouter"},
-                )
-
-            # Build headers
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            }
-
-            # Optional: Add site URL and app name for OpenRouter rankings
-            site_url = self._site_url or ai_config.extra.get("site_url")
-            app_name = self._app_name or ai_config.extra.get("app_name", "code-voyager")
-            if site_url:
-                headers["HTTP-Referer"] = site_url
-            if app_name:
-                headers["X-Title"] = app_name
-
-            # Build messages
-            messages = []
-            if request.system_prompt:
-                messages.append({"role": "system", "content": request.system_prompt})
-            messages.append({"role": "user", "content": request.prompt})
-
-            # Prepare request body
-            model = request.model or ai_config.model
-            body = {
-                "model": model,
-                "messages": messages,
-            }
-
-            # Optional parameters
-            if request.temperature is not None:
-                body["temperature"] = request.temperature
-            elif "temperature" in ai_config.extra:
-                body["temperature"] = ai_config.extra["temperature"]
-
-            if "max_tokens" in ai_config.extra:
-                body["max_tokens"] = ai_config.extra["max_tokens"]
-
-            # Make the API call
-            with httpx.Client(timeout=request.timeout_seconds) as client:
+            def send() -> Any:
                 response = client.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
+                    f"{base_url}/chat/completions",
                     headers=headers,
                     json=body,
+                    timeout=request.timeout_seconds,
                 )
                 response.raise_for_status()
-                data = response.json()
-
-            # Extract response
-            if "error" in data:
-                return AIResponse(
-                    success=False,
-                    error=data["error"].get("message", str(data["error"])),
-                    metadata={"provider": "openrouter"},
-                )
+                return response
 
-            output = data["choices"][0]["message"]["content"]
+            tokens = estimate_request_tokens(request.system_prompt, request.prompt)
+            response = run_with_rate_limit(limiter_for_provider("openrouter"), send, tokens=tokens)
+            return self._to_response(response.json(), body["model"])
 
-            # Extract usage and cost information
-            usage = data.get("usage", {})
-            metadata = {
-                "provider": "openrouter",
-                "model": model,
-                "usage": {
-                    "prompt_tokens": usage.get("prompt_tokens", 0),
-                    "completion_tokens": usage.get("completion_tokens", 0),
-                    "total_tokens": usage.get("total_tokens", 0),
-                },
-            }
+        except Exception as e:
+            return self._to_error(e)
 
-            # OpenRouter provides cost information
-            if "total_cost" in usage:
-                metadata["cost_usd"] = usage["total_cost"]
+    def stream(self, request: AIRequest) -> Iterator[AIStreamChunk]:
+        """Stream a chat completion from OpenRouter.
 
-            return AIResponse(
-                success=True,
-                output=output,
-                files=[],
-                metadata=metadata,
-            )
+        OpenRouter sends OpenAI-style server-sent events; see iter_sse_deltas.
+
+        Args:
+            request: The AI request.
+
+        Yields:
+            AIStreamChunk deltas, then a final chunk with timing metadata.
+        """
+        timer = StreamTimer()
+        limiter = limiter_for_provider("openrouter")
+        if not self.check_available():
+            failed = self._unavailable()
+            yield timer.finish(failed.metadata, error=failed.error)
+            return
+
+        try:
+            prepared = self._prepare(request)
+            if isinstance(prepared, AIResponse):
+                yield timer.finish(prepared.metadata, error=prepared.error)
+                return
+            headers, body = prepared
+            body["stream"] = True
+
+            base_url = self._get_base_url()
+            client = get_http_client("openrouter", base_url)
+            usage: dict[str, Any] = {}
+            tokens = estimate_request_tokens(request.system_prompt, request.prompt)
+            with (
+                limiter.slot(tokens),
+                client.stream(
+                    "POST",
+                    f"{base_url}/chat/completions",
+                    headers=headers,
+                    json=body,
+                    timeout=request.timeout_seconds,
+                ) as response,
+            ):
+                response.raise_for_status()
+                for delta in iter_sse_deltas(response.iter_lines(), usage):
+                    yield timer.chunk(delta)
+
+            metadata: dict[str, Any] = {"provider": "openrouter", "model": body["model"]}
+            if usage:
+                metadata["usage"] = usage
+            yield timer.finish(metadata)
 
-        except httpx.HTTPError as e:
-            _logger.error("OpenRouter HTTP error: %s", e)
-            return AIResponse(
-                success=False,
-                error=f"HTTP error: {e}",
-                metadata={"provider": "openrouter"},
-            )
         except Exception as e:
-            _logger.error("OpenRouter call failed: %s", e)
-            return AIResponse(
-                success=False,
-                error=str(e),
-                metadata={"provider": "openrouter"},
-            )
+            penalize_if_rate_limited(limiter, e)
+            failed = self._to_error(e)
+            yield timer.finish(failed.metadata, error=failed.error)
+
+    async def acall(self, request: AIRequest) -> AIResponse:
+        """Make a call to OpenRouter on the pooled async client.
+
+        Args:
+            request: The AI request.
+
+        Returns:
+            AIResponse with the result.
+        """
+        if not await self.acheck_available():
+            return self._unavailable()
+
+        try:
+            prepared = self._prepare(request)
+            if isinstance(prepared, AIResponse):
+                return prepared
+            headers, body = prepared
+
+            base_url = self._get_base_url()
+            client = get_async_http_client("openrouter", base_url)
+
+            async def send() -> Any:
+                response = await client.post(
+                    f"{base_url}/chat/completions",
+                    headers=headers,
+                    json=body,
+                    timeout=request.timeout_seconds,
+                )
+                response.raise_for_status()
+                return response
+
+            tokens = estimate_request_tokens(request.system_prompt, request.prompt)
+            response = await arun_with_rate_limit(limiter_for_provider("openrouter"), send, tokens=tokens)
+            return self._to_response(response.json(), body["model"])
+
+        except Exception as e:
+            return self._to_error(e)
 
     def is_available(self) -> bool:
         """Check if OpenRouter provider is available.
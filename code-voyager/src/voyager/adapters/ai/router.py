@@ -0,0 +1,322 @@
+"""Routing AI provider with latency-aware fallback and hedged requests.
+
+Wraps several AIProviders and sends each request to the fastest healthy
+one, based on rolling per-provider, per-model latency (p50/p95) and error
+rate. If that provider fails, the next candidate is tried. With hedging
+enabled, a duplicate request goes to the next candidate once the first has
+been running longer than the hedge threshold; the first success wins and
+the slower request is cancelled.
+
+Configuration example:
+    [ai.router]
+    providers = ["ollama", "openrouter"]
+    hedge_after_seconds = 5.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse
+from voyager.config import get_config
+from voyager.logging import get_logger
+
+_logger = get_logger("provider.router")
+
+# Number of recent calls per provider/model used for latency and error stats
+DEFAULT_WINDOW = 50
+
+# Providers failing more often than this are only used as a last resort
+DEFAULT_MAX_ERROR_RATE = 0.5
+
+# Fewest samples before a provider's error rate can mark it unhealthy
+MIN_SAMPLES_FOR_HEALTH = 3
+
+
+@dataclasses.dataclass(frozen=True)
+class ProviderStats:
+    """Rolling latency and error statistics for one provider and model."""
+
+    samples: int
+    p50_ms: float
+    p95_ms: float
+    error_rate: float
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LatencyTracker:
+    """Thread-safe rolling window of call latencies and outcomes."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self._window = window
+        self._calls: dict[tuple[str, str], deque[tuple[float, bool]]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, model: str, latency_seconds: float, ok: bool) -> None:
+        """Record one completed call."""
+        with self._lock:
+            calls = self._calls.setdefault((provider, model), deque(maxlen=self._window))
+            calls.append((latency_seconds, ok))
+
+    def stats(self, provider: str, model: str) -> ProviderStats:
+        """Get statistics for a provider and model.
+
+        Latency percentiles only count successful calls, since failures are
+        often fast and would make a broken provider look attractive.
+        """
+        with self._lock:
+            calls = list(self._calls.get((provider, model), ()))
+        if not calls:
+            return ProviderStats(samples=0, p50_ms=0.0, p95_ms=0.0, error_rate=0.0)
+        latencies = sorted(latency * 1000 for latency, ok in calls if ok)
+        errors = sum(1 for _, ok in calls if not ok)
+        return ProviderStats(
+            samples=len(calls),
+            p50_ms=_percentile(latencies, 0.5),
+            p95_ms=_percentile(latencies, 0.95),
+            error_rate=errors / len(calls),
+        )
+
+
+def _run_on_private_loop(make_coro: Callable[[], Coroutine[Any, Any, AIResponse]]) -> AIResponse:
+    """Run a coroutine to completion without waiting for leftover thread work.
+
+    asyncio.run() joins the default executor on exit, so a cancelled hedge
+    loser running in a worker thread (the default acall) would delay the
+    winner's result until the loser finished. Here the executor is shut
+    down without waiting; the abandoned call finishes in the background.
+    """
+    loop = asyncio.new_event_loop()
+    executor = ThreadPoolExecutor(thread_name_prefix="voyager-router")
+    loop.set_default_executor(executor)
+    try:
+        return loop.run_until_complete(make_coro())
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            loop.close()
+
+
+def create_provider(name: str) -> AIProvider:
+    """Create a provider by its config name.
+
+    Args:
+        name: Provider name as used in [ai.<name>] config sections.
+
+    Returns:
+        A new provider instance.
+
+    Raises:
+        KeyError: If the name is unknown.
+    """
+    from voyager.adapters.ai import (
+        ClaudeProvider,
+        CohereProvider,
+        GeminiProvider,
+        OllamaProvider,
+        OpenAICompatibleProvider,
+        OpenAIProvider,
+        OpenRouterProvider,
+    )
+
+    classes: dict[str, type[AIProvider]] = {
+        "claude": ClaudeProvider,
+        "cohere": CohereProvider,
+        "gemini": GeminiProvider,
+        "ollama": OllamaProvider,
+        "openai": OpenAIProvider,
+        "openai_compatible": OpenAICompatibleProvider,
+        "openrouter": OpenRouterProvider,
+    }
+    if name not in classes:
+        raise KeyError(f"Unknown AI provider '{name}'")
+    return classes[name]()
+
+
+class RouterProvider(AIProvider):
+    """AI provider that routes each request across several providers."""
+
+    def __init__(
+        self,
+        providers: Sequence[AIProvider],
+        *,
+        hedge_after_seconds: float | None = None,
+        max_error_rate: float = DEFAULT_MAX_ERROR_RATE,
+        tracker: LatencyTracker | None = None,
+    ):
+        """Initialize the router.
+
+        Args:
+            providers: Providers to route between, in preference order for ties.
+            hedge_after_seconds: Send a duplicate request to the next candidate
+                after this long. None disables hedging.
+            max_error_rate: Rolling error rate above which a provider is
+                demoted to last-resort fallback.
+            tracker: Latency tracker (a fresh one by default).
+        """
+        self._providers = list(providers)
+        self.hedge_after_seconds = hedge_after_seconds
+        self.max_error_rate = max_error_rate
+        self.tracker = tracker or LatencyTracker()
+
+    @classmethod
+    def from_config(cls) -> RouterProvider:
+        """Build a router from the [ai.router] config section."""
+        extra: dict[str, Any] = get_config().get_ai_config("router").extra
+        return cls(
+            [create_provider(name) for name in extra.get("providers", [])],
+            hedge_after_seconds=extra.get("hedge_after_seconds"),
+            max_error_rate=extra.get("max_error_rate", DEFAULT_MAX_ERROR_RATE),
+        )
+
+    def stats(self, provider: AIProvider, model: str | None = None) -> ProviderStats:
+        """Get rolling statistics for a wrapped provider."""
+        return self.tracker.stats(provider.get_name(), model or "")
+
+    def rank(self, request: AIRequest) -> list[AIProvider]:
+        """Order available providers for a request.
+
+        Healthy providers come first, fastest p50 first; providers without
+        samples yet sort as fastest so they get measured. Unhealthy providers
+        follow as last-resort fallbacks.
+
+        Args:
+            request: The request to route.
+
+        Returns:
+            Candidate providers, best first.
+        """
+        return self._order(request, [provider.check_available() for provider in self._providers])
+
+    async def arank(self, request: AIRequest) -> list[AIProvider]:
+        """Async variant of rank; availability probes run concurrently off the event loop."""
+        available = await asyncio.gather(*(provider.acheck_available() for provider in self._providers))
+        return self._order(request, list(available))
+
+    def _order(self, request: AIRequest, available: list[bool]) -> list[AIProvider]:
+        healthy: list[tuple[float, int, AIProvider]] = []
+        unhealthy: list[tuple[float, int, AIProvider]] = []
+        for order, (provider, ok) in enumerate(zip(self._providers, available, strict=True)):
+            if not ok:
+                continue
+            stats = self.stats(provider, request.model)
+            entry = (stats.p50_ms, order, provider)
+            if stats.samples >= MIN_SAMPLES_FOR_HEALTH and stats.error_rate > self.max_error_rate:
+                unhealthy.append(entry)
+            else:
+                healthy.append(entry)
+        return [p for _, _, p in sorted(healthy)] + [p for _, _, p in sorted(unhealthy)]
+
+    async def _timed_call(self, provider: AIProvider, request: AIRequest) -> AIResponse:
+        """Call a provider and record its latency and outcome."""
+        started = time.perf_counter()
+        try:
+            response = await provider.acall(request)
+        except Exception as e:
+            response = AIResponse(success=False, error=str(e), metadata={"provider": provider.get_name()})
+        self.tracker.record(provider.get_name(), request.model or "", time.perf_counter() - started, response.success)
+        return response
+
+    async def acall(self, request: AIRequest) -> AIResponse:
+        """Route a request, falling back and hedging as configured.
+
+        Args:
+            request: The AI request.
+
+        Returns:
+            The first successful response, or a failure listing every
+            provider's error.
+        """
+        remaining = await self.arank(request)
+        if not remaining:
+            return AIResponse(success=False, error="No AI providers available", metadata={"provider": "router"})
+
+        running: dict[asyncio.Task[AIResponse], AIProvider] = {}
+        errors: list[str] = []
+        hedged = False
+
+        def launch() -> None:
+            provider = remaining.pop(0)
+            running[asyncio.create_task(self._timed_call(provider, request))] = provider
+
+        launch()
+        try:
+            while running:
+                timeout = None
+                if self.hedge_after_seconds is not None and not hedged and remaining:
+                    timeout = self.hedge_after_seconds
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    _logger.debug("Hedging request after %.2fs", self.hedge_after_seconds)
+                    hedged = True
+                    launch()
+                    continue
+
+                for task in done:
+                    provider = running.pop(task)
+                    response = task.result()
+                    if response.success:
+                        response.metadata = {
+                            **response.metadata,
+                            "routed_to": provider.get_name(),
+                            "hedged": str(hedged).lower(),
+                        }
+                        return response
+                    errors.append(f"{provider.get_name()}: {response.error}")
+                    _logger.warning("Provider %s failed: %s", provider.get_name(), response.error)
+
+                if not running and remaining:
+                    launch()
+        finally:
+            # Cancel the losing request(s)
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return AIResponse(success=False, error="; ".join(errors), metadata={"provider": "router"})
+
+    def call(self, request: AIRequest) -> AIResponse:
+        """Route a request synchronously.
+
+        Returns as soon as a provider answers, without waiting for a
+        cancelled hedge loser. Safe to call from inside a running event
+        loop (the routing then runs on its own loop in a helper thread).
+
+        Args:
+            request: The AI request.
+
+        Returns:
+            AIResponse from the provider that answered first.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return _run_on_private_loop(lambda: self.acall(request))
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="voyager-router") as pool:
+            return pool.submit(_run_on_private_loop, lambda: self.acall(request)).result()
+
+    def is_available(self) -> bool:
+        """Check if any wrapped provider is available."""
+        return any(provider.check_available() for provider in self._providers)
+
+    def pool_key(self) -> str:
+        """Identify the router by the providers it wraps."""
+        return ",".join(f"{p.get_name()}@{p.pool_key()}" for p in self._providers)
@@ -6,9 +6,26 @@ allowing Voyager to work with different AI models (Claude, OpenAI, Ollama, etc.)
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import Any, cast
+
+from voyager.batching import DEFAULT_MAX_ITEMS_PER_CALL, ItemValidator, run_batched
+
+# How long an availability check result is trusted before probing again
+AVAILABILITY_TTL_SECONDS = 30.0
+
+# Default number of concurrent requests in acall_many
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Cached availability keyed by (provider name, pool key) -> (checked_at, available)
+_availability_cache: dict[tuple[str, str], tuple[float, bool]] = {}
+_availability_lock = threading.Lock()
 
 
 @dataclass
@@ -24,6 +41,7 @@ class AIRequest:
         timeout_seconds: Timeout for the request.
         model: Optional model override.
         temperature: Optional temperature for generation.
+        cache: Whether a caching wrapper may serve or store this request.
     """
 
     prompt: str
@@ -34,6 +52,7 @@ class AIRequest:
     timeout_seconds: int = 60
     model: str | None = None
     temperature: float | None = None
+    cache: bool = True
 
 
 @dataclass
@@ -55,6 +74,57 @@ class AIResponse:
     metadata: dict[str, str] = field(default_factory=dict)
 
 
+@dataclass
+class AIStreamChunk:
+    """One increment of a streamed AI response.
+
+    Attributes:
+        delta: Text added by this chunk (empty on the final chunk).
+        done: True on the final chunk, which closes every stream.
+        error: Error message if the stream failed (final chunk only).
+        metadata: On the final chunk, provider metadata plus timing:
+            ttft_ms (time to first token), total_ms and chunks.
+    """
+
+    delta: str = ""
+    done: bool = False
+    error: str = ""
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+class StreamTimer:
+    """Time a streamed response and build its chunks.
+
+    Example:
+        timer = StreamTimer()
+        for delta in deltas:
+            yield timer.chunk(delta)
+        yield timer.finish({"provider": "ollama"})
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.first_token_at: float | None = None
+        self.chunks = 0
+
+    def chunk(self, delta: str) -> AIStreamChunk:
+        """Record a delta and wrap it in a chunk."""
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.chunks += 1
+        return AIStreamChunk(delta=delta)
+
+    def finish(self, metadata: dict[str, Any] | None = None, *, error: str = "") -> AIStreamChunk:
+        """Build the final chunk with timing metadata."""
+        total_ms = (time.perf_counter() - self.started_at) * 1000
+        ttft_ms = (self.first_token_at - self.started_at) * 1000 if self.first_token_at is not None else None
+        return AIStreamChunk(
+            done=True,
+            error=error,
+            metadata={**(metadata or {}), "ttft_ms": ttft_ms, "total_ms": total_ms, "chunks": self.chunks},
+        )
+
+
 class AIProvider(ABC):
     """Abstract base class for AI providers.
 
@@ -70,6 +140,10 @@ class AIProvider(ABC):
 
             def is_available(self) -> bool:
                 return True  # Check if API key exists, etc.
+
+    Providers only need the synchronous `call`. `acall` runs it in a worker
+    thread unless a provider overrides it with a native async client, and
+    `acall_many` fans requests out concurrently on top of `acall`.
     """
 
     @abstractmethod
@@ -98,6 +172,224 @@ class AIProvider(ABC):
         """
         pass
 
+    def stream(self, request: AIRequest) -> Iterator[AIStreamChunk]:
+        """Stream the response as text deltas.
+
+        Yields zero or more delta chunks followed by exactly one chunk with
+        done=True carrying timing metadata and any error. Never raises.
+
+        The default makes a normal call and yields the whole output as one
+        delta. Providers with a streaming API override this.
+
+        Args:
+            request: The AI request containing prompt and configuration.
+
+        Yields:
+            AIStreamChunk deltas, then the final chunk.
+        """
+        timer = StreamTimer()
+        try:
+            response = self.call(request)
+        except Exception as e:
+            yield timer.finish({"provider": self.get_name()}, error=str(e))
+            return
+        if response.output:
+            yield timer.chunk(response.output)
+        yield timer.finish(response.metadata, error="" if response.success else response.error)
+
+    async def acall(self, request: AIRequest) -> AIResponse:
+        """Make a call to the AI provider without blocking the event loop.
+
+        The default runs `call` in a worker thread. Providers with an async
+        client override this.
+
+        Args:
+            request: The AI request containing prompt and configuration.
+
+        Returns:
+            AIResponse with the result of the call.
+        """
+        return await asyncio.to_thread(self.call, request)
+
+    async def acall_many(
+        self,
+        requests: Sequence[AIRequest],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[AIResponse]:
+        """Make several calls concurrently.
+
+        Args:
+            requests: Requests to send.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            Responses in the same order as requests. A request that raises
+            yields a failed AIResponse instead of cancelling the others.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(request: AIRequest) -> AIResponse:
+            async with semaphore:
+                try:
+                    return await self.acall(request)
+                except Exception as e:
+                    return AIResponse(success=False, error=str(e), metadata={"provider": self.get_name()})
+
+        return list(await asyncio.gather(*(run(r) for r in requests)))
+
+    async def acall_batch(
+        self,
+        requests: Sequence[AIRequest],
+        *,
+        validate: ItemValidator | None = None,
+        max_items_per_call: int = DEFAULT_MAX_ITEMS_PER_CALL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[AIResponse]:
+        """Answer many small independent requests with as few calls as possible.
+
+        Requests that differ only in their prompt are packed into one prompt
+        asking for a JSON array of answers (see voyager.batching). Answers
+        that are missing or fail validate are retried as individual calls,
+        as are requests too large to pack.
+
+        Args:
+            requests: Text-only requests (no tools or file output).
+            validate: Optional check on each packed answer's text.
+            max_items_per_call: Most requests packed together (1 disables packing).
+            max_concurrency: Maximum number of calls in flight at once.
+
+        Returns:
+            Responses in the same order as requests. Packed answers carry
+            metadata["batched"] = "true".
+        """
+        groups: dict[tuple[Any, ...], list[int]] = {}
+        for index, request in enumerate(requests):
+            key = (request.system_prompt, request.model, request.temperature, request.timeout_seconds, request.cache)
+            groups.setdefault(key, []).append(index)
+
+        responses: list[AIResponse | None] = [None] * len(requests)
+
+        async def run_group(indices: list[int]) -> None:
+            base = requests[indices[0]]
+            metadata: dict[str, Any] = {}
+
+            async def send_packed(prompt: str, count: int) -> str | None:
+                packed = replace(base, prompt=prompt, timeout_seconds=base.timeout_seconds * count)
+                response = (await self.acall_many([packed]))[0]
+                metadata.update(response.metadata)
+                return response.output if response.success else None
+
+            async def send_single(i: int) -> AIResponse:
+                return (await self.acall_many([requests[indices[i]]]))[0]
+
+            def wrap(i: int, answer: str) -> AIResponse:
+                return AIResponse(success=True, output=answer, metadata={**metadata, "batched": "true"})
+
+            results = await run_batched(
+                [requests[i].prompt for i in indices],
+                send_packed=send_packed,
+                send_single=send_single,
+                wrap=wrap,
+                validate=validate,
+                max_items=max_items_per_call,
+                max_concurrency=max_concurrency,
+            )
+            for index, response in zip(indices, results, strict=True):
+                responses[index] = response
+
+        await asyncio.gather(*(run_group(indices) for indices in groups.values()))
+        return cast(list[AIResponse], responses)
+
+    def call_batch(
+        self,
+        requests: Sequence[AIRequest],
+        *,
+        validate: ItemValidator | None = None,
+        max_items_per_call: int = DEFAULT_MAX_ITEMS_PER_CALL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[AIResponse]:
+        """Synchronous variant of acall_batch."""
+        return asyncio.run(
+            self.acall_batch(
+                requests,
+                validate=validate,
+                max_items_per_call=max_items_per_call,
+                max_concurrency=max_concurrency,
+            )
+        )
+
+    def pool_key(self) -> str:
+        """Get the key identifying this provider's endpoint.
+
+        Availability results and pooled clients are shared between provider
+        instances with the same name and pool key. Providers that talk to a
+        configurable endpoint return its base URL.
+
+        Returns:
+            Endpoint identifier (empty by default).
+        """
+        return ""
+
+    def check_available(self, *, ttl_seconds: float = AVAILABILITY_TTL_SECONDS) -> bool:
+        """Check availability, reusing a recent result instead of probing.
+
+        Args:
+            ttl_seconds: How long a previous result stays valid.
+
+        Returns:
+            Cached or freshly computed is_available() result.
+        """
+        cached = self._cached_availability(ttl_seconds)
+        if cached is not None:
+            return cached
+        available = self.is_available()
+        self._store_availability(available)
+        return available
+
+    async def acheck_available(self, *, ttl_seconds: float = AVAILABILITY_TTL_SECONDS) -> bool:
+        """Async variant of check_available; a fresh probe never blocks the event loop.
+
+        Args:
+            ttl_seconds: How long a previous result stays valid.
+
+        Returns:
+            Cached or freshly computed ais_available() result.
+        """
+        cached = self._cached_availability(ttl_seconds)
+        if cached is not None:
+            return cached
+        available = await self.ais_available()
+        self._store_availability(available)
+        return available
+
+    async def ais_available(self) -> bool:
+        """Check availability without blocking the event loop.
+
+        The default runs `is_available` in a worker thread. Providers that
+        probe over the network with an async client override this.
+
+        Returns:
+            True if the provider can be used, False otherwise.
+        """
+        return await asyncio.to_thread(self.is_available)
+
+    def _cached_availability(self, ttl_seconds: float) -> bool | None:
+        with _availability_lock:
+            cached = _availability_cache.get((self.get_name(), self.pool_key()))
+        if cached is not None and time.monotonic() - cached[0] < ttl_seconds:
+            return cached[1]
+        return None
+
+    def _store_availability(self, available: bool) -> None:
+        with _availability_lock:
+            _availability_cache[(self.get_name(), self.pool_key())] = (time.monotonic(), available)
+
+    def invalidate_availability(self) -> None:
+        """Forget the cached availability result, e.g. after a connection error."""
+        with _availability_lock:
+            _availability_cache.pop((self.get_name(), self.pool_key()), None)
+
     def get_name(self) -> str:
         """Get the name of this AI provider.
 
@@ -0,0 +1,133 @@
+"""Process-wide pools of keep-alive clients for AI providers.
+
+Creating an HTTP or SDK client per request throws away the connection (and
+TLS session) every time. Providers fetch clients from here instead, keyed by
+provider name and base URL, so repeated calls reuse open connections.
+
+Async httpx clients are bound to the event loop that created them, so they
+are pooled per running loop and dropped when the loop is garbage collected.
+
+Usage:
+    from voyager.adapters.base.client_pool import get_http_client
+
+    client = get_http_client("ollama", base_url)
+    response = client.post(f"{base_url}/api/chat", json=body, timeout=30)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any
+
+from voyager.logging import get_logger
+
+if TYPE_CHECKING:
+    import httpx
+
+_logger = get_logger("client_pool")
+
+# Keep-alive connections kept open per pooled HTTP client
+MAX_KEEPALIVE_CONNECTIONS = 10
+
+_lock = threading.Lock()
+_http_clients: dict[tuple[str, str], httpx.Client] = {}
+_async_http_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str], httpx.AsyncClient]] = (
+    weakref.WeakKeyDictionary()
+)
+_sdk_clients: dict[Hashable, Any] = {}
+
+
+def _limits() -> httpx.Limits:
+    import httpx
+
+    return httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS)
+
+
+def get_http_client(provider: str, base_url: str) -> httpx.Client:
+    """Get the shared keep-alive httpx client for a provider and base URL.
+
+    Pass timeouts per request; the pooled client has none of its own.
+
+    Args:
+        provider: Provider name (e.g., "ollama").
+        base_url: Base URL the client talks to.
+
+    Returns:
+        Shared httpx.Client.
+    """
+    import httpx
+
+    key = (provider, base_url)
+    with _lock:
+        client = _http_clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client(limits=_limits(), timeout=None)
+            _http_clients[key] = client
+            _logger.debug("Opened HTTP client for %s at %s", provider, base_url)
+        return client
+
+
+def get_async_http_client(provider: str, base_url: str) -> httpx.AsyncClient:
+    """Get the shared async httpx client for the running event loop.
+
+    Args:
+        provider: Provider name (e.g., "ollama").
+        base_url: Base URL the client talks to.
+
+    Returns:
+        httpx.AsyncClient shared by callers on the current loop.
+    """
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    key = (provider, base_url)
+    with _lock:
+        clients = _async_http_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=_limits(), timeout=None)
+            clients[key] = client
+            _logger.debug("Opened async HTTP client for %s at %s", provider, base_url)
+        return client
+
+
+def get_sdk_client[T](key: Hashable, factory: Callable[[], T]) -> T:
+    """Get a shared SDK client, creating it with factory on first use.
+
+    Args:
+        key: Hashable key identifying the client, typically
+            (provider, base_url, api_key).
+        factory: Zero-argument callable building the client.
+
+    Returns:
+        The pooled client.
+    """
+    with _lock:
+        client = _sdk_clients.get(key)
+        if client is None:
+            client = factory()
+            _sdk_clients[key] = client
+        return client
+
+
+def close_clients() -> None:
+    """Close and forget all pooled synchronous clients."""
+    with _lock:
+        clients = [*_http_clients.values(), *_sdk_clients.values()]
+        _http_clients.clear()
+        _sdk_clients.clear()
+        _async_http_clients.clear()
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                _logger.debug("Error closing pooled client: %s", e)
+
+
+atexit.register(close_clients)
@@ -10,9 +10,9 @@ import os
 from pathlib import Path
 
 from voyager.adapters.base.ide_adapter import IDEAdapter, IDEContext, IDEEvent
+from voyager.brain.coordinator import request_brain_update
 from voyager.logging import get_logger
 from voyager.scripts.brain.inject import inject_brain_context
-from voyager.scripts.brain.update import main as brain_update_main
 
 _logger = get_logger("adapter.claude_code")
 
@@ -98,7 +98,7 @@ class ClaudeCodeAdapter(IDEAdapter):
         pass
 
     def _update_brain(self, event: IDEEvent) -> None:
-        """Update brain state from transcript.
+        """Queue a brain state update from the transcript.
 
         Args:
             event: The event containing transcript path.
@@ -119,12 +119,6 @@ class ClaudeCodeAdapter(IDEAdapter):
             return
 
         try:
-            brain_update_main(
-                transcript=transcript,
-                session_id=event.session_id,
-                snapshot_path=None,
-                dry_run=False,
-                skip_llm=False,
-            )
+            request_brain_update(event.session_id, transcript, event.event_type)
         except Exception as e:
             _logger.warning("Failed to update brain: %s", e)
@@ -0,0 +1,209 @@
+"""Packing many small LLM tasks into one prompt.
+
+Commands like skill indexing send one short extraction prompt per item, so
+per-call overhead dominates. Independent tasks can instead be packed into a
+single prompt that asks for a JSON array with one answer per task id. The
+answers are mapped back to their inputs; any task whose answer is missing
+or malformed is retried on its own by the caller.
+
+Used by voyager.llm.call_batch and AIProvider.call_batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, cast
+
+from voyager.logging import get_logger
+from voyager.transcript import estimate_tokens
+
+_logger = get_logger("batching")
+
+# Most tasks packed into one prompt
+DEFAULT_MAX_ITEMS_PER_CALL = 8
+
+# Estimated prompt tokens per packed call; larger tasks are sent alone
+DEFAULT_MAX_PACKED_TOKENS = 12000
+
+# Most packed or single calls in flight at once
+DEFAULT_BATCH_CONCURRENCY = 4
+
+BATCH_INSTRUCTIONS = """\
+Complete each of the {count} independent tasks below. Treat every task on
+its own; do not let one task's content affect another's answer.
+
+Return ONLY a JSON array with exactly one object per task, in any order:
+[{{"id": <task id>, "result": <the answer the task asks for>}}, ...]
+
+If a task asks for JSON, put that JSON value in "result" directly (not as a
+string). Otherwise "result" is a string. No markdown formatting or code blocks.
+"""
+
+# Validator for a single item's output; returns False to retry the item alone
+ItemValidator = Callable[[str], bool]
+
+
+def plan_batches(
+    prompts: Sequence[str],
+    *,
+    max_items: int = DEFAULT_MAX_ITEMS_PER_CALL,
+    max_tokens: int = DEFAULT_MAX_PACKED_TOKENS,
+) -> list[list[int]]:
+    """Group prompt indices into packed calls.
+
+    Prompts are kept in order. A group closes when it reaches max_items or
+    the next prompt would push it over max_tokens. A prompt too large to
+    share a call ends up in a group of its own.
+
+    Args:
+        prompts: Task prompts.
+        max_items: Most prompts per group.
+        max_tokens: Estimated token budget per group.
+
+    Returns:
+        Lists of indices into prompts.
+    """
+    groups: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    for index, prompt in enumerate(prompts):
+        tokens = estimate_tokens(prompt)
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+def build_batch_prompt(prompts: Sequence[str]) -> str:
+    """Pack task prompts into one prompt asking for a JSON array of answers.
+
+    Task ids are the positions in prompts.
+    """
+    parts = [BATCH_INSTRUCTIONS.format(count=len(prompts))]
+    for task_id, prompt in enumerate(prompts):
+        parts.append(f'<task id="{task_id}">\n{prompt}\n</task>')
+    return "\n\n".join(parts)
+
+
+def _load_array(text: str) -> list[Any] | None:
+    """Find the JSON array in a response, tolerating code fences and prose."""
+    candidates = [text.strip()]
+    fenced = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
+    if fenced:
+        candidates.append(fenced.group(1))
+    start, end = text.find("["), text.rfind("]")
+    if 0 <= start < end:
+        candidates.append(text[start : end + 1])
+
+    for candidate in candidates:
+        try:
+            value = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(value, list):
+            return value
+    return None
+
+
+def parse_batch_response(text: str, count: int) -> dict[int, str]:
+    """Map a packed response back to task ids.
+
+    JSON results are re-serialized so every answer is the text a single
+    call would have returned. Items with unknown ids, duplicate ids or no
+    result are dropped, so the caller retries them.
+
+    Args:
+        text: Raw response to a build_batch_prompt prompt.
+        count: Number of tasks in the prompt.
+
+    Returns:
+        Mapping of task id to answer text (possibly incomplete).
+    """
+    items = _load_array(text)
+    if items is None:
+        return {}
+
+    answers: dict[int, str] = {}
+    duplicates: set[int] = set()
+    for item in items:
+        if not isinstance(item, dict) or "result" not in item:
+            continue
+        try:
+            task_id = int(item.get("id"))
+        except (TypeError, ValueError):
+            continue
+        if not 0 <= task_id < count:
+            continue
+        if task_id in answers:
+            duplicates.add(task_id)
+        result = item["result"]
+        answers[task_id] = result if isinstance(result, str) else json.dumps(result, ensure_ascii=False)
+    for task_id in duplicates:
+        del answers[task_id]
+    return answers
+
+
+async def run_batched[R](
+    prompts: Sequence[str],
+    *,
+    send_packed: Callable[[str, int], Awaitable[str | None]],
+    send_single: Callable[[int], Awaitable[R]],
+    wrap: Callable[[int, str], R],
+    validate: ItemValidator | None = None,
+    max_items: int = DEFAULT_MAX_ITEMS_PER_CALL,
+    max_tokens: int = DEFAULT_MAX_PACKED_TOKENS,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> list[R]:
+    """Run tasks packed where possible, retrying bad items individually.
+
+    Args:
+        prompts: Task prompts.
+        send_packed: Send a packed prompt for n tasks; returns the response
+            text, or None if the call failed.
+        send_single: Send task i on its own and return its result.
+        wrap: Build a successful result for task i from its answer text.
+        validate: Optional check on each packed answer; items that fail it
+            are retried with send_single.
+        max_items: Most tasks per packed call (1 disables packing).
+        max_tokens: Estimated token budget per packed call.
+        max_concurrency: Most calls in flight at once.
+
+    Returns:
+        Results in the same order as prompts.
+    """
+    results: list[R | None] = [None] * len(prompts)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def single(index: int) -> None:
+        async with semaphore:
+            results[index] = await send_single(index)
+
+    async def packed(group: list[int]) -> None:
+        if len(group) == 1:
+            await single(group[0])
+            return
+        async with semaphore:
+            text = await send_packed(build_batch_prompt([prompts[i] for i in group]), len(group))
+        answers = parse_batch_response(text, len(group)) if text is not None else {}
+
+        retry = []
+        for task_id, index in enumerate(group):
+            answer = answers.get(task_id)
+            if answer is not None and (validate is None or validate(answer)):
+                results[index] = wrap(index, answer)
+            else:
+                retry.append(index)
+        if retry:
+            _logger.debug("Retrying %d of %d packed items individually", len(retry), len(group))
+        await asyncio.gather(*(single(index) for index in retry))
+
+    await asyncio.gather(*(packed(g) for g in plan_batches(prompts, max_items=max_items, max_tokens=max_tokens)))
+    # Every index is filled by wrap or send_single
+    return cast(list[R], results)
@@ -0,0 +1,212 @@
+"""Debounced, coalesced brain updates for hooks.
+
+PreCompact and SessionEnd both want a brain update, often within seconds of
+each other, and several sessions can end at once in a shared project.
+Running each update inline makes the hook slow and lets concurrent LLM
+updates race on brain.json.
+
+Instead, hooks call `request_brain_update`, which records the request in a
+per-project pending queue (one entry per session, so repeated requests
+merge) and starts a detached worker. The worker holds the project's update
+lock, waits until no new request has arrived for the debounce window, then
+drains the queue one update at a time. At most one worker per project runs
+LLM updates; extra workers exit immediately.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from voyager.config import get_project_dir, get_voyager_state_dir
+from voyager.io import file_lock, read_json, write_json
+from voyager.logging import get_logger
+
+_logger = get_logger("brain.coordinator")
+
+# Seconds without new requests before the worker starts updating
+DEFAULT_DEBOUNCE_SECONDS = 5.0
+
+# Environment variable overriding the debounce window
+DEBOUNCE_ENV_VAR = "VOYAGER_BRAIN_DEBOUNCE_SECONDS"
+
+
+def _get_pending_path() -> Path:
+    """Get the path to the pending brain update queue."""
+    return get_voyager_state_dir() / "brain.pending.json"
+
+
+def _get_queue_lock_path() -> Path:
+    """Get the lock file guarding the pending queue."""
+    return get_voyager_state_dir() / "brain.pending.lock"
+
+
+def _get_update_lock_path() -> Path:
+    """Get the lock file held while a worker runs updates."""
+    return get_voyager_state_dir() / "brain.update.lock"
+
+
+def get_debounce_seconds() -> float:
+    """Get the debounce window from VOYAGER_BRAIN_DEBOUNCE_SECONDS or the default."""
+    try:
+        return max(0.0, float(os.environ.get(DEBOUNCE_ENV_VAR, DEFAULT_DEBOUNCE_SECONDS)))
+    except ValueError:
+        return DEFAULT_DEBOUNCE_SECONDS
+
+
+def _load_pending() -> dict[str, Any]:
+    pending = read_json(_get_pending_path(), default={})
+    return pending if isinstance(pending, dict) else {}
+
+
+def enqueue_update(session_id: str, transcript: Path | None, event: str) -> dict[str, Any]:
+    """Record a brain update request, merging with any pending one.
+
+    Requests are keyed by session: a second request for the same session
+    refreshes the timestamp and transcript path instead of adding work.
+
+    Args:
+        session_id: Session identifier.
+        transcript: Transcript path, if known.
+        event: Name of the hook event that asked for the update.
+
+    Returns:
+        The merged pending request.
+    """
+    key = session_id or str(transcript or "")
+    with file_lock(_get_queue_lock_path()):
+        pending = _load_pending()
+        request = pending.get(key) or {"session_id": session_id, "events": []}
+        if transcript is not None:
+            request["transcript"] = str(transcript)
+        if event not in request["events"]:
+            request["events"].append(event)
+        request["requested_at"] = time.time()
+        pending[key] = request
+        write_json(_get_pending_path(), pending)
+    _logger.debug("Queued brain update for %s (%s)", key, ", ".join(request["events"]))
+    return request
+
+
+def _take_pending() -> dict[str, Any]:
+    """Atomically remove and return all pending requests."""
+    with file_lock(_get_queue_lock_path()):
+        pending = _load_pending()
+        if pending:
+            write_json(_get_pending_path(), {})
+        return pending
+
+
+def _run_update(request: dict[str, Any]) -> None:
+    """Run one brain update for a pending request."""
+    import typer
+
+    from voyager.scripts.brain.update import main as brain_update_main
+
+    transcript = request.get("transcript")
+    try:
+        brain_update_main(
+            transcript=Path(transcript) if transcript else None,
+            session_id=request.get("session_id", ""),
+            snapshot_path=None,
+            dry_run=False,
+            skip_llm=False,
+        )
+    except typer.Exit:
+        pass  # Normal exit from typer command
+    except Exception as e:
+        _logger.warning("Brain update failed for %s: %s", request.get("session_id"), e)
+
+
+def run_pending_updates(debounce_seconds: float | None = None) -> int:
+    """Drain the pending queue, one brain update at a time.
+
+    Returns immediately if another worker holds the update lock; that worker
+    will pick up anything queued meanwhile. After releasing the lock the
+    queue is checked again, so a request queued while this worker was
+    finishing is never stranded.
+
+    Args:
+        debounce_seconds: Quiet period to wait for before updating.
+            Defaults to get_debounce_seconds().
+
+    Returns:
+        Number of updates run.
+    """
+    if debounce_seconds is None:
+        debounce_seconds = get_debounce_seconds()
+
+    ran = 0
+    while True:
+        with file_lock(_get_update_lock_path(), blocking=False) as acquired:
+            if not acquired:
+                _logger.debug("Another brain update worker is running")
+                return ran
+            while True:
+                pending = _load_pending()
+                if not pending:
+                    break
+                newest = max(float(r.get("requested_at", 0)) for r in pending.values())
+                wait = newest + debounce_seconds - time.time()
+                if wait > 0:
+                    time.sleep(wait)
+                    continue
+                for request in _take_pending().values():
+                    _run_update(request)
+                    ran += 1
+        if not _load_pending():
+            return ran
+
+
+def spawn_worker() -> bool:
+    """Start a detached worker process that runs pending updates.
+
+    Worker output is appended to brain.worker.log in the state dir.
+
+    Returns:
+        True if the worker was started.
+    """
+    state_dir = get_voyager_state_dir()
+    state_dir.mkdir(parents=True, exist_ok=True)
+    env = os.environ.copy()
+    env.setdefault("CLAUDE_PROJECT_DIR", str(get_project_dir()))
+    try:
+        with (state_dir / "brain.worker.log").open("a", encoding="utf-8") as log:
+            log.write(f"--- worker started {datetime.now(UTC).isoformat()}\n")
+            log.flush()
+            subprocess.Popen(
+                [sys.executable, "-m", "voyager.brain.coordinator"],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=log,
+                env=env,
+                start_new_session=True,
+            )
+        return True
+    except OSError as e:
+        _logger.warning("Failed to start brain update worker: %s", e)
+        return False
+
+
+def request_brain_update(session_id: str, transcript: Path | None, event: str) -> None:
+    """Queue a brain update and return without waiting for it.
+
+    Falls back to running the queue inline if no worker can be started.
+
+    Args:
+        session_id: Session identifier.
+        transcript: Transcript path, if known.
+        event: Name of the hook event that asked for the update.
+    """
+    enqueue_update(session_id, transcript, event)
+    if not spawn_worker():
+        run_pending_updates(debounce_seconds=0)
+
+
+if __name__ == "__main__":
+    run_pending_updates()
@@ -25,6 +25,9 @@ _logger = get_logger("brain.store")
 # Path to the brain schema relative to plugin root
 BRAIN_SCHEMA_REL_PATH = "skills/session-brain/schemas/brain.schema.json"
 
+# Number of sessions whose transcript offsets are remembered
+MAX_TRACKED_OFFSETS = 50
+
 
 def get_brain_schema_path() -> Path:
     """Get the path to the brain JSON schema."""
@@ -216,3 +219,62 @@ def save_last_update(
         data["error"] = error
 
     return write_json(last_update_path, data)
+
+
+def _get_offsets_path() -> Path:
+    """Get the path to the per-session transcript offsets file."""
+    return get_voyager_state_dir() / "brain.offsets.json"
+
+
+def load_transcript_offset(session_id: str, transcript: Path | str) -> int:
+    """Load the transcript byte offset consumed by the last successful update.
+
+    Args:
+        session_id: Session identifier.
+        transcript: Transcript path the offset must belong to.
+
+    Returns:
+        Byte offset to resume from, or 0 if this session/transcript is unknown.
+    """
+    offsets = read_json(_get_offsets_path(), default={})
+    if not isinstance(offsets, dict):
+        return 0
+
+    record = offsets.get(session_id)
+    if not isinstance(record, dict) or record.get("transcript") != str(transcript):
+        return 0
+
+    offset = record.get("offset", 0)
+    return offset if isinstance(offset, int) and offset > 0 else 0
+
+
+def save_transcript_offset(session_id: str, transcript: Path | str, offset: int) -> bool:
+    """Record how far into a transcript the brain has been updated.
+
+    Only the most recent MAX_TRACKED_OFFSETS sessions are kept.
+
+    Args:
+        session_id: Session identifier.
+        transcript: Transcript path the offset belongs to.
+        offset: Byte offset just past the last transcript line consumed.
+
+    Returns:
+        True if save succeeded.
+    """
+    path = _get_offsets_path()
+    offsets = read_json(path, default={})
+    if not isinstance(offsets, dict):
+        offsets = {}
+
+    offsets.pop(session_id, None)
+    offsets[session_id] = {
+        "transcript": str(transcript),
+        "offset": offset,
+        "updated_at": datetime.now(UTC).isoformat(),
+    }
+
+    # Dicts keep insertion order, so the oldest sessions come first
+    while len(offsets) > MAX_TRACKED_OFFSETS:
+        offsets.pop(next(iter(offsets)))
+
+    return write_json(path, offsets)
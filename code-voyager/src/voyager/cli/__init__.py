@@ -16,25 +16,56 @@ Provides a single entry point with subcommands organized by domain:
     voyager hook session-end      # Claude Code SessionEnd hook
     voyager hook pre-compact      # Claude Code PreCompact hook
     voyager hook post-tool-use    # Claude Code PostToolUse hook
+    voyager perf report           # Hook timing percentiles
 """
 
+import importlib
+from typing import Any
+
 import typer
+from typer.core import TyperGroup
+
+# Subcommand name -> module defining its Typer `app`. Modules are imported
+# only when their subcommand runs, so `voyager hook ...` does not pay for
+# the LLM, retrieval or factory dependencies of the other commands.
+SUBCOMMANDS = {
+    "brain": "voyager.cli.brain",
+    "curriculum": "voyager.cli.curriculum",
+    "feedback": "voyager.cli.feedback",
+    "factory": "voyager.cli.factory",
+    "hook": "voyager.cli.hook",
+    "perf": "voyager.cli.perf",
+    "repo": "voyager.cli.repo",
+    "skill": "voyager.cli.skill",
+}
+
+
+class LazyGroup(TyperGroup):
+    """Command group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        return [*SUBCOMMANDS, *(name for name in super().list_commands(ctx) if name not in SUBCOMMANDS)]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in SUBCOMMANDS:
+            module = importlib.import_module(SUBCOMMANDS[cmd_name])
+            command = typer.main.get_group(module.app)
+            self.add_command(command, cmd_name)
+        return command
 
-from voyager.cli import brain, curriculum, factory, feedback, hook, repo, skill
 
 app = typer.Typer(
     name="voyager",
     help="Voyager: Meta-skills for Coding Agents",
     no_args_is_help=True,
+    cls=LazyGroup,
 )
 
-app.add_typer(brain.app)
-app.add_typer(curriculum.app)
-app.add_typer(feedback.app)
-app.add_typer(factory.app)
-app.add_typer(hook.app)
-app.add_typer(repo.app)
-app.add_typer(skill.app)
+
+@app.callback()
+def _root() -> None:
+    """Voyager: Meta-skills for Coding Agents."""
 
 
 def main() -> None:
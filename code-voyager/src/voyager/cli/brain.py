@@ -37,6 +37,10 @@ def update(
         bool,
         typer.Option("--skip-llm", help="Skip LLM call, just update timestamps"),
     ] = False,
+    full: Annotated[
+        bool,
+        typer.Option("--full", help="Re-read the whole transcript, ignoring the saved offset"),
+    ] = False,
 ) -> None:
     """Update the Session Brain from a transcript."""
     update_main(
@@ -45,6 +49,7 @@ def update(
         snapshot_path=snapshot_path,
         dry_run=dry_run,
         skip_llm=skip_llm,
+        full=full,
     )
 
 
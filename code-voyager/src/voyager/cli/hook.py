@@ -15,9 +15,10 @@ from pathlib import Path
 
 import typer
 
-from voyager.llm import is_internal_call
-from voyager.scripts.brain.inject import inject_from_stdin
-from voyager.scripts.brain.update import main as brain_update_main
+# Hooks run on every session event and tool call, so anything heavier than
+# the recursion guard is imported inside the handler that needs it.
+from voyager.guard import is_internal_call
+from voyager.profiling import span, trace
 
 app = typer.Typer(
     name="hook",
@@ -27,6 +28,7 @@ app = typer.Typer(
 
 
 @app.command("session-start")
+@trace("hook session-start")
 def session_start() -> None:
     """Handle SessionStart hook - injects brain context.
 
@@ -39,6 +41,8 @@ def session_start() -> None:
         raise typer.Exit(0)
 
     try:
+        from voyager.scripts.brain.inject import inject_from_stdin
+
         output = inject_from_stdin()
         typer.echo(json.dumps(output))
     except Exception as e:
@@ -51,10 +55,11 @@ def session_start() -> None:
 
 
 @app.command("session-end")
+@trace("hook session-end")
 def session_end() -> None:
     """Handle SessionEnd hook - persists session memory.
 
-    Reads hook input JSON from stdin and updates the brain state
+    Reads hook input JSON from stdin and queues a brain state update
     from the transcript when the session ends.
     """
     # Recursion guard
@@ -80,16 +85,12 @@ def session_end() -> None:
             tp = Path(cwd) / tp
         transcript = tp
 
+    # Queue the update; a background worker debounces and runs it
     try:
-        brain_update_main(
-            transcript=transcript,
-            session_id=session_id,
-            snapshot_path=None,
-            dry_run=False,
-            skip_llm=False,
-        )
-    except typer.Exit:
-        pass  # Normal exit from typer command
+        from voyager.brain.coordinator import request_brain_update
+
+        with span("enqueue"):
+            request_brain_update(session_id, transcript, "session-end")
     except Exception as e:
         print(f"session-end error: {e}", file=sys.stderr)
 
@@ -98,10 +99,11 @@ def session_end() -> None:
 
 
 @app.command("pre-compact")
+@trace("hook pre-compact")
 def pre_compact() -> None:
     """Handle PreCompact hook - persists session memory before compaction.
 
-    Reads hook input JSON from stdin and updates the brain state
+    Reads hook input JSON from stdin and queues a brain state update
     from the transcript before context compaction occurs.
     """
     # Recursion guard
@@ -127,16 +129,12 @@ def pre_compact() -> None:
             tp = Path(cwd) / tp
         transcript = tp
 
+    # Queue the update; a background worker debounces and runs it
     try:
-        brain_update_main(
-            transcript=transcript,
-            session_id=session_id,
-            snapshot_path=None,
-            dry_run=False,
-            skip_llm=False,
-        )
-    except typer.Exit:
-        pass  # Normal exit from typer command
+        from voyager.brain.coordinator import request_brain_update
+
+        with span("enqueue"):
+            request_brain_update(session_id, transcript, "pre-compact")
     except Exception as e:
         print(f"pre-compact error: {e}", file=sys.stderr)
 
@@ -145,6 +143,7 @@ def pre_compact() -> None:
 
 
 @app.command("post-tool-use")
+@trace("hook post-tool-use")
 def post_tool_use() -> None:
     """Handle PostToolUse hook - collects feedback for skill refinement.
 
@@ -192,8 +191,9 @@ def post_tool_use() -> None:
     try:
         from voyager.refinement.detector import SkillDetector
 
-        detector = SkillDetector(use_llm=True, llm_timeout=30)
-        skill_used = detector.detect(tool_name, tool_input, transcript_path)
+        with span("detect"):
+            detector = SkillDetector(use_llm=True, llm_timeout=30)
+            skill_used = detector.detect(tool_name, tool_input, transcript_path)
     except Exception:
         pass  # Skill detection is best-effort
 
@@ -203,20 +203,21 @@ def post_tool_use() -> None:
 
         from voyager.refinement.store import FeedbackStore, ToolExecution
 
-        store = FeedbackStore()
-        store.log_tool_execution(
-            ToolExecution(
-                session_id=session_id,
-                tool_name=tool_name,
-                tool_input=tool_input,
-                tool_response=tool_response if isinstance(tool_response, dict) else {"output": tool_response},
-                success=success,
-                error_message=error_message,
-                duration_ms=None,
-                skill_used=skill_used,
-                timestamp=datetime.now(UTC).isoformat(),
+        with span("store"):
+            store = FeedbackStore()
+            store.log_tool_execution(
+                ToolExecution(
+                    session_id=session_id,
+                    tool_name=tool_name,
+                    tool_input=tool_input,
+                    tool_response=tool_response if isinstance(tool_response, dict) else {"output": tool_response},
+                    success=success,
+                    error_message=error_message,
+                    duration_ms=None,
+                    skill_used=skill_used,
+                    timestamp=datetime.now(UTC).isoformat(),
+                )
             )
-        )
     except Exception as e:
         print(f"Feedback logging error: {e}", file=sys.stderr)
 
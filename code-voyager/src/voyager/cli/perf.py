@@ -0,0 +1,37 @@
+"""Performance tracing commands."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from voyager.scripts.perf.report import main as report_main
+
+app = typer.Typer(
+    name="perf",
+    help="Hook and brain update timings",
+    no_args_is_help=True,
+)
+
+
+@app.command("report")
+def report(
+    path: Annotated[
+        Path | None,
+        typer.Option("--path", help="Path to the trace file"),
+    ] = None,
+    last: Annotated[
+        int,
+        typer.Option("--last", "-n", help="Number of most recent runs to include"),
+    ] = 1000,
+    command: Annotated[
+        str | None,
+        typer.Option("--command", "-c", help="Only include commands starting with this prefix"),
+    ] = None,
+    json_output: Annotated[
+        bool,
+        typer.Option("--json", help="Output results as JSON"),
+    ] = False,
+) -> None:
+    """Show p50/p95/p99 per phase for traced runs (VOYAGER_PROFILE=1)."""
+    report_main(path=path, last=last, command=command, json_output=json_output)
@@ -1,5 +1,41 @@
 """Configuration system for Voyager."""
 
+from voyager.config.paths import (
+    ensure_voyager_dirs,
+    get_brain_json_path,
+    get_brain_md_path,
+    get_curriculum_json_path,
+    get_curriculum_md_path,
+    get_episodes_dir,
+    get_feedback_db_path,
+    get_generated_skills_dir,
+    get_generated_skills_index_path,
+    get_local_skills_dir,
+    get_plugin_root,
+    get_plugin_skills_dir,
+    get_project_dir,
+    get_skill_index_dir,
+    get_voyager_state_dir,
+)
 from voyager.config.settings import VoyagerConfig, get_config, load_config
 
-__all__ = ["VoyagerConfig", "get_config", "load_config"]
+__all__ = [
+    "VoyagerConfig",
+    "ensure_voyager_dirs",
+    "get_brain_json_path",
+    "get_brain_md_path",
+    "get_config",
+    "get_curriculum_json_path",
+    "get_curriculum_md_path",
+    "get_episodes_dir",
+    "get_feedback_db_path",
+    "get_generated_skills_dir",
+    "get_generated_skills_index_path",
+    "get_local_skills_dir",
+    "get_plugin_root",
+    "get_plugin_skills_dir",
+    "get_project_dir",
+    "get_skill_index_dir",
+    "get_voyager_state_dir",
+    "load_config",
+]
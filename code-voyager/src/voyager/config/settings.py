@@ -1,6 +1,13 @@
 """Configuration loader and settings management.
 
 This module handles loading and managing Voyager configuration from TOML files.
+
+Hooks start a fresh process for every event, so the merged configuration is
+also kept as a JSON snapshot in the project's state directory, keyed by the
+mtime and size of defaults.toml and every candidate config file. A snapshot
+hit skips TOML parsing (and importing tomllib) entirely; editing, adding or
+removing any config file changes the key and triggers a reload. Set
+VOYAGER_CONFIG_CACHE=0 to always parse the TOML files.
 """
 
 from __future__ import annotations
@@ -10,15 +17,22 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib  # type: ignore
-
+from voyager.io import read_json, write_json
 from voyager.logging import get_logger
 
 _logger = get_logger("config")
 
+# Environment variable that disables the config snapshot when set to "0"/"false"/"no"
+CONFIG_CACHE_ENV_VAR = "VOYAGER_CONFIG_CACHE"
+
+# Snapshot file name inside <project>/.claude/voyager/
+CONFIG_CACHE_FILENAME = "config_cache.json"
+
+# Bump when the snapshot layout changes
+CONFIG_CACHE_VERSION = 1
+
+DEFAULTS_PATH = Path(__file__).parent / "defaults.toml"
+
 # Global config instance
 _config: VoyagerConfig | None = None
 
@@ -110,11 +124,85 @@ class VoyagerConfig:
         return self.ide_configs[adapter_name]
 
 
+def _load_toml(path: Path) -> dict[str, Any]:
+    """Parse a TOML file (tomllib is imported only when parsing is needed)."""
+    try:
+        import tomllib
+    except ImportError:
+        import tomli as tomllib  # type: ignore
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def load_defaults() -> dict[str, Any]:
     """Load default configuration from defaults.toml."""
-    defaults_path = Path(__file__).parent / "defaults.toml"
-    with open(defaults_path, "rb") as f:
-        return tomllib.load(f)
+    return _load_toml(DEFAULTS_PATH)
+
+
+def is_config_cache_enabled() -> bool:
+    """Check whether the config snapshot is enabled (VOYAGER_CONFIG_CACHE)."""
+    return os.environ.get(CONFIG_CACHE_ENV_VAR, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def get_config_cache_path(project_dir: Path) -> Path:
+    """Get the path of the config snapshot for a project."""
+    return project_dir / ".claude" / "voyager" / CONFIG_CACHE_FILENAME
+
+
+def _fingerprint(paths: list[Path]) -> list[list[Any]]:
+    """Identify the current version of each source file by mtime and size."""
+    entries: list[list[Any]] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            entries.append([str(path), stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            entries.append([str(path), None, None])
+    return entries
+
+
+def _read_snapshot(cache_path: Path, fingerprint: list[list[Any]]) -> dict[str, Any] | None:
+    """Return the cached merged config if it was built from the same files."""
+    snapshot = read_json(cache_path)
+    if (
+        isinstance(snapshot, dict)
+        and snapshot.get("version") == CONFIG_CACHE_VERSION
+        and snapshot.get("sources") == fingerprint
+        and isinstance(snapshot.get("data"), dict)
+    ):
+        return snapshot["data"]
+    return None
+
+
+def _write_snapshot(cache_path: Path, fingerprint: list[list[Any]], data: dict[str, Any]) -> None:
+    """Save the merged config, if the project already has a state directory.
+
+    Configs that do not round-trip through JSON (TOML dates) are not cached.
+    """
+    if not cache_path.parent.is_dir():
+        return
+    if not write_json(cache_path, {"version": CONFIG_CACHE_VERSION, "sources": fingerprint, "data": data}, indent=0):
+        _logger.debug("Could not write config snapshot %s", cache_path)
+
+
+def _load_config_data(config_path: Path | None, search_paths: list[Path]) -> dict[str, Any]:
+    """Parse defaults.toml merged with the first config file found."""
+    config_data = load_defaults()
+
+    if config_path and config_path.exists():
+        _logger.debug("Loading config from %s", config_path)
+        _merge_config(config_data, _load_toml(config_path))
+    else:
+        for path in search_paths:
+            if path.exists():
+                _logger.debug("Loading config from %s", path)
+                _merge_config(config_data, _load_toml(path))
+                break
+        else:
+            _logger.debug("No config file found, using defaults")
+
+    return config_data
 
 
 def load_config(config_path: Path | None = None, project_dir: Path | None = None) -> VoyagerConfig:
@@ -128,6 +216,9 @@ def load_config(config_path: Path | None = None, project_dir: Path | None = None
     5. voyager.toml in current directory
     6. Default configuration
 
+    The merged result is served from the config snapshot when none of these
+    files changed since it was written.
+
     Args:
         config_path: Explicit path to config file.
         project_dir: Project root directory.
@@ -138,32 +229,25 @@ def load_config(config_path: Path | None = None, project_dir: Path | None = None
     # Determine project directory
     proj_dir = project_dir or _get_project_dir()
 
-    # Find config file
-    config_data = load_defaults()
-
-    if config_path and config_path.exists():
-        _logger.debug("Loading config from %s", config_path)
-        with open(config_path, "rb") as f:
-            user_config = tomllib.load(f)
-            _merge_config(config_data, user_config)
-    else:
-        # Search for config file
-        search_paths = [
-            proj_dir / ".voyager" / "config.toml",
-            proj_dir / "voyager.toml",
-            Path.cwd() / ".voyager" / "config.toml",
-            Path.cwd() / "voyager.toml",
-        ]
-
-        for path in search_paths:
-            if path.exists():
-                _logger.debug("Loading config from %s", path)
-                with open(path, "rb") as f:
-                    user_config = tomllib.load(f)
-                    _merge_config(config_data, user_config)
-                break
+    search_paths = [
+        proj_dir / ".voyager" / "config.toml",
+        proj_dir / "voyager.toml",
+        Path.cwd() / ".voyager" / "config.toml",
+        Path.cwd() / "voyager.toml",
+    ]
+
+    # Reuse the snapshot if no source file changed since it was written
+    if is_config_cache_enabled():
+        cache_path = get_config_cache_path(proj_dir)
+        fingerprint = _fingerprint([DEFAULTS_PATH, *([config_path] if config_path else []), *search_paths])
+        config_data = _read_snapshot(cache_path, fingerprint)
+        if config_data is None:
+            config_data = _load_config_data(config_path, search_paths)
+            _write_snapshot(cache_path, fingerprint, config_data)
         else:
-            _logger.debug("No config file found, using defaults")
+            _logger.debug("Loaded config from snapshot %s", cache_path)
+    else:
+        config_data = _load_config_data(config_path, search_paths)
 
     # Parse configuration
     voyager_section = config_data.get("voyager", {})
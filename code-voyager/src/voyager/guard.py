@@ -0,0 +1,21 @@
+"""Recursion guard for LLM calls made by Voyager itself.
+
+Voyager runs Claude Code as an agent, and that agent fires the same hooks
+that started it. The guard variable is set in the agent's environment so
+hooks and commands can recognise internal calls and do nothing.
+
+This module has no heavy dependencies so hooks can check the guard before
+importing anything else.
+"""
+
+from __future__ import annotations
+
+import os
+
+# Environment variable for recursion guard
+RECURSION_GUARD_VAR = "VOYAGER_FOR_CODE_INTERNAL"
+
+
+def is_internal_call() -> bool:
+    """Check if we're in an internal LLM call (recursion guard is set)."""
+    return os.environ.get(RECURSION_GUARD_VAR) == "1"
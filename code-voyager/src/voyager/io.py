@@ -10,12 +10,21 @@ from __future__ import annotations
 import contextlib
 import dataclasses
 import json
+import mmap
 import os
 import tempfile
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Block size for reverse JSONL reads when the file cannot be memory-mapped
+REVERSE_READ_BLOCK_SIZE = 64 * 1024
+
 
 def ensure_parent_dir(path: Path | str) -> Path:
     """Ensure the parent directory of a path exists.
@@ -131,11 +140,16 @@ def write_json(
 
 @dataclasses.dataclass(frozen=True)
 class JsonlReadResult:
-    """Result of reading a JSONL file."""
+    """Result of reading a JSONL file.
+
+    ``end_offset`` is the byte offset just past the last consumed line, so a
+    later read can resume from it with ``read_jsonl(path, offset=end_offset)``.
+    """
 
     items: list[Any]
     total_lines: int
     invalid_lines: int
+    end_offset: int = 0
 
 
 def read_jsonl(
@@ -143,15 +157,20 @@ def read_jsonl(
     *,
     max_lines: int | None = None,
     default: list[Any] | None = None,
+    offset: int = 0,
 ) -> JsonlReadResult:
     """Read and parse a JSON Lines (JSONL) file.
 
-    Never raises. Invalid JSON lines are skipped and counted.
+    Never raises. Invalid JSON lines are skipped and counted. A trailing line
+    without a newline that fails to parse is treated as still being written:
+    it is counted as invalid but not consumed, so ``end_offset`` stops before it.
 
     Args:
         path: Path to the JSONL file.
         max_lines: Optional maximum number of *valid* items to return.
         default: Default items to return if file is missing/unreadable.
+        offset: Byte offset to start reading from. Offsets past the end of
+            the file (e.g. after the file was truncated) restart from 0.
 
     Returns:
         JsonlReadResult with parsed items and basic stats.
@@ -163,25 +182,208 @@ def read_jsonl(
     invalid_lines = 0
 
     try:
-        with path.open("r", encoding="utf-8") as f:
+        with path.open("rb") as f:
+            if offset > 0:
+                if offset > os.fstat(f.fileno()).st_size:
+                    offset = 0
+                f.seek(offset)
+            position = offset
             for line in f:
                 total_lines += 1
                 if not line.strip():
+                    position += len(line)
                     continue
                 try:
                     items.append(json.loads(line))
                 except (json.JSONDecodeError, ValueError):
                     invalid_lines += 1
+                    if not line.endswith(b"\n"):
+                        break
+                    position += len(line)
                     continue
+                position += len(line)
                 if max_lines is not None and len(items) >= max_lines:
                     break
     except (FileNotFoundError, PermissionError, OSError):
-        return JsonlReadResult(items=default or [], total_lines=0, invalid_lines=0)
+        return JsonlReadResult(items=default or [], total_lines=0, invalid_lines=0, end_offset=offset)
+
+    return JsonlReadResult(
+        items=items,
+        total_lines=total_lines,
+        invalid_lines=invalid_lines,
+        end_offset=position,
+    )
+
+
+def iter_jsonl(path: Path | str, *, offset: int = 0) -> Iterator[Any]:
+    """Stream valid JSONL records forward, starting at a byte offset.
+
+    Unlike read_jsonl, nothing is materialized: records are parsed one line
+    at a time. Invalid lines are skipped; a missing or unreadable file
+    yields nothing.
+
+    Args:
+        path: Path to the JSONL file.
+        offset: Byte offset to start reading from (must be a line boundary,
+            e.g. a previous JsonlReadResult.end_offset).
+
+    Yields:
+        Parsed JSON values in file order.
+    """
+    try:
+        with Path(path).open("rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except (json.JSONDecodeError, ValueError):
+                    continue
+    except (FileNotFoundError, PermissionError, OSError):
+        return
+
+
+def _iter_lines_reverse(path: Path, offset: int, block_size: int) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(start_offset, line)`` pairs from EOF back to ``offset``.
+
+    Lines keep their trailing newline, if any. The file is memory-mapped when
+    possible so only the lines actually visited are touched; otherwise it is
+    read backwards in ``block_size`` chunks. Either way memory stays bounded
+    by the longest line rather than the file size.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= offset:
+            return
+
+        try:
+            view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            view = None
+
+        if view is not None:
+            with view:
+                end = size
+                while end > offset:
+                    newline = view.rfind(b"\n", offset, end - 1)
+                    start = newline + 1 if newline >= 0 else offset
+                    yield start, view[start:end]
+                    end = start
+            return
+
+        # Fallback: read blocks backwards, carrying the unfinished line over
+        pos = size
+        buf = b""
+        while True:
+            cut = len(buf)
+            while cut > 0:
+                newline = buf.rfind(b"\n", 0, cut - 1)
+                if newline < 0:
+                    break
+                yield pos + newline + 1, buf[newline + 1 : cut]
+                cut = newline + 1
+            buf = buf[:cut]
+            if pos <= offset:
+                if buf:
+                    yield pos, buf
+                return
+            read_start = max(offset, pos - block_size)
+            f.seek(read_start)
+            buf = f.read(pos - read_start) + buf
+            pos = read_start
+
+
+def iter_jsonl_reverse(
+    path: Path | str,
+    *,
+    offset: int = 0,
+    block_size: int = REVERSE_READ_BLOCK_SIZE,
+) -> Iterator[Any]:
+    """Stream valid JSONL records backwards from the end of the file.
+
+    Only the lines consumed by the caller are read and parsed, so taking the
+    first few records from this iterator is cheap even for very large files.
+    Invalid lines are skipped; a missing or unreadable file yields nothing.
+
+    Args:
+        path: Path to the JSONL file.
+        offset: Byte offset (a line boundary) before which nothing is read.
+        block_size: Read size used when the file cannot be memory-mapped.
+
+    Yields:
+        Parsed JSON values, most recent first.
+    """
+    try:
+        for _, line in _iter_lines_reverse(Path(path), offset, block_size):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except (json.JSONDecodeError, ValueError):
+                continue
+    except (FileNotFoundError, PermissionError, OSError):
+        return
+
 
+def read_jsonl_tail(
+    path: Path | str,
+    max_lines: int,
+    *,
+    offset: int = 0,
+    default: list[Any] | None = None,
+    block_size: int = REVERSE_READ_BLOCK_SIZE,
+) -> JsonlReadResult:
+    """Read the last ``max_lines`` valid records of a JSONL file.
+
+    Reads backwards from EOF and stops as soon as enough records are found,
+    without parsing the rest of the file. Never raises.
+
+    Args:
+        path: Path to the JSONL file.
+        max_lines: Maximum number of *valid* items to return.
+        offset: Byte offset (a line boundary) before which nothing is read,
+            e.g. the end_offset of a previous read.
+        default: Default items to return if file is missing/unreadable.
+        block_size: Read size used when the file cannot be memory-mapped.
+
+    Returns:
+        JsonlReadResult with items in file order. ``end_offset`` excludes a
+        trailing line that is still being written, as with read_jsonl.
+    """
+    items: list[Any] = []
+    total_lines = 0
+    invalid_lines = 0
+    end_offset: int | None = None
+
+    try:
+        for start, line in _iter_lines_reverse(Path(path), offset, block_size):
+            if len(items) >= max_lines:
+                break
+            total_lines += 1
+            if end_offset is None:
+                end_offset = start + len(line)
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except (json.JSONDecodeError, ValueError):
+                invalid_lines += 1
+                if not line.endswith(b"\n") and start + len(line) == end_offset:
+                    # Partial last line: leave it for the next read
+                    end_offset = start
+    except (FileNotFoundError, PermissionError, OSError):
+        return JsonlReadResult(items=default or [], total_lines=0, invalid_lines=0, end_offset=offset)
+
+    items.reverse()
     return JsonlReadResult(
         items=items,
         total_lines=total_lines,
         invalid_lines=invalid_lines,
+        end_offset=offset if end_offset is None else end_offset,
     )
 
 
@@ -236,3 +438,38 @@ def safe_unlink(path: Path | str) -> bool:
         return True
     except (OSError, PermissionError, ValueError):
         return False
+
+
+@contextlib.contextmanager
+def file_lock(path: Path | str, *, blocking: bool = True) -> Iterator[bool]:
+    """Hold an exclusive advisory lock on a lock file.
+
+    Uses flock(2), so the lock is released automatically if the holding
+    process dies. On platforms without fcntl the lock is a no-op that always
+    succeeds.
+
+    Args:
+        path: Lock file path (created if missing).
+        blocking: Wait for the lock if True; otherwise give up immediately.
+
+    Yields:
+        True if the lock is held, False if it was busy (non-blocking only).
+    """
+    path = ensure_parent_dir(path)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is None:
+            yield True
+            return
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(fd, flags)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
@@ -2,10 +2,14 @@
 
 Provides schema validation with a safe API that never raises exceptions
 in normal operation - returns validation results instead.
+
+Schema files are compiled once per process: validators are cached by
+resolved path and invalidated when the file's mtime or size changes.
 """
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -16,10 +20,54 @@ from voyager.logging import get_logger
 
 _logger = get_logger("jsonschema")
 
+# Compiled validators keyed by resolved schema path -> (mtime_ns, size, validator)
+_validator_cache: dict[Path, tuple[int, int, Draft202012Validator]] = {}
+_validator_cache_lock = threading.Lock()
+
+
+def get_validator(schema_path: Path | str) -> Draft202012Validator | None:
+    """Get a compiled validator for a schema file, reusing cached ones.
+
+    Args:
+        schema_path: Path to a JSON schema file.
+
+    Returns:
+        Cached or newly compiled validator, or None if the schema
+        cannot be read.
+    """
+    path = Path(schema_path).resolve()
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    with _validator_cache_lock:
+        cached = _validator_cache.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    schema = read_json(path)
+    if schema is None:
+        return None
+    validator = Draft202012Validator(schema)
+    with _validator_cache_lock:
+        _validator_cache[path] = (stat.st_mtime_ns, stat.st_size, validator)
+    _logger.debug("Compiled schema %s", path)
+    return validator
+
+
+def clear_validator_cache() -> None:
+    """Drop all cached validators."""
+    with _validator_cache_lock:
+        _validator_cache.clear()
+
 
 def validate(data: Any, schema: dict[str, Any] | Path | str) -> tuple[bool, list[str]]:
     """Validate data against a JSON Schema.
 
+    Schema files are compiled once and cached (see get_validator). Valid
+    data takes a fast path that skips collecting errors.
+
     Args:
         data: The data to validate.
         schema: Schema dict, or path to a JSON schema file.
@@ -29,14 +77,17 @@ def validate(data: Any, schema: dict[str, Any] | Path | str) -> tuple[bool, list
         Never raises - returns (False, [error]) on any failure.
     """
     try:
-        # Load schema if it's a path
+        # Use the cached validator if schema is a path
         if isinstance(schema, (Path, str)):
-            loaded = read_json(schema)
-            if loaded is None:
+            validator = get_validator(schema)
+            if validator is None:
                 return False, [f"Could not load schema from {schema}"]
-            schema = loaded
+        else:
+            validator = Draft202012Validator(schema)
+
+        if validator.is_valid(data):
+            return True, []
 
-        validator = Draft202012Validator(schema)
         errors = list(validator.iter_errors(data))
 
         if errors:
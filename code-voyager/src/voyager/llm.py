@@ -3,34 +3,66 @@
 Provides a way to run Claude Code as an agent that can read/write files
 directly, with proper error handling and timeout support.
 
+Each call normally starts a fresh Claude Code process. Batch workloads can
+wrap their loop in reuse_agent_sessions() so calls with the same options
+share one long-lived process instead (see AgentSessionPool).
+
 Usage:
-    from voyager.llm import call_claude
+    from voyager.llm import call_claude, reuse_agent_sessions
 
     result = call_claude("Create a README.md file with project info")
     if result.success:
         print(f"Created files: {result.files}")
+
+    with reuse_agent_sessions():
+        for prompt in prompts:
+            call_claude(prompt, allowed_tools=[], max_turns=1)
+
+    # Inside an event loop
+    result = await call_claude_async("Summarize the changes")
+
+    # Many small extraction tasks, packed into few calls
+    results = call_batch([f"Summarize: {doc}" for doc in docs])
 """
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
 import os
+import threading
+from collections.abc import AsyncIterator, Coroutine, Iterator, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 import anyio
-from claude_agent_sdk import ClaudeAgentOptions, query
-from claude_agent_sdk.types import AssistantMessage, ResultMessage, ToolUseBlock
-
+from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient, query
+from claude_agent_sdk.types import AssistantMessage, Message, ResultMessage, ToolUseBlock
+
+from voyager.batching import DEFAULT_BATCH_CONCURRENCY, DEFAULT_MAX_ITEMS_PER_CALL, ItemValidator, run_batched
+from voyager.guard import RECURSION_GUARD_VAR as RECURSION_GUARD_VAR
+from voyager.guard import is_internal_call as is_internal_call
+from voyager.io import read_file, write_file
+from voyager.llm_cache import get_llm_cache, is_cache_enabled, make_cache_key
 from voyager.logging import get_logger
 
 _logger = get_logger("llm")
 
-# Environment variable for recursion guard
-RECURSION_GUARD_VAR = "VOYAGER_FOR_CODE_INTERNAL"
-
 # Default timeout for claude calls (60 seconds)
 DEFAULT_TIMEOUT_SECONDS = 60
 
+# Calls served by one agent process before it is replaced
+DEFAULT_SESSION_MAX_CALLS = 50
+
+# Agent processes kept per option set, so concurrent calls do not queue
+DEFAULT_SESSIONS_PER_OPTIONS = 4
+
+# How long to wait for a reused session to clear its conversation
+SESSION_CLEAR_TIMEOUT_SECONDS = 10
+
 
 @dataclass
 class LLMResult:
@@ -49,9 +81,63 @@ class LLMResult:
     error: str = ""
 
 
-def is_internal_call() -> bool:
-    """Check if we're in an internal LLM call (recursion guard is set)."""
-    return os.environ.get(RECURSION_GUARD_VAR) == "1"
+@dataclass(frozen=True)
+class AgentOptions:
+    """Options that fix an agent process; calls with equal options can share one."""
+
+    cwd: str | None = None
+    system_prompt: str | None = None
+    allowed_tools: tuple[str, ...] | None = None
+    max_turns: int = 10
+    model: str | None = None
+
+    def to_sdk(self) -> ClaudeAgentOptions:
+        """Build the SDK options, with the recursion guard set for the agent."""
+        return ClaudeAgentOptions(
+            cwd=self.cwd,
+            system_prompt=self.system_prompt,
+            allowed_tools=list(self.allowed_tools or ("Read", "Write", "Glob")),
+            permission_mode="acceptEdits",
+            max_turns=self.max_turns,
+            model=self.model,
+            env={RECURSION_GUARD_VAR: "1"},
+        )
+
+
+def _agent_options(
+    *,
+    cwd: Path | str | None,
+    system_prompt: str | None,
+    allowed_tools: list[str] | None,
+    max_turns: int,
+    model: str | None = None,
+) -> AgentOptions:
+    return AgentOptions(
+        cwd=str(cwd) if cwd else None,
+        system_prompt=system_prompt,
+        allowed_tools=tuple(allowed_tools) if allowed_tools else None,
+        max_turns=max_turns,
+        model=model,
+    )
+
+
+async def _collect(messages: AsyncIterator[Message]) -> tuple[str, list[str]]:
+    """Collect the final output and written files from an agent message stream."""
+    output = ""
+    files_written: list[str] = []
+
+    async for message in messages:
+        if isinstance(message, ResultMessage):
+            output = message.result or ""
+        elif isinstance(message, AssistantMessage):
+            # Track file writes from tool use blocks
+            for block in message.content:
+                if isinstance(block, ToolUseBlock) and block.name == "Write":
+                    file_path = block.input.get("file_path", "")
+                    if file_path:
+                        files_written.append(file_path)
+
+    return output, files_written
 
 
 async def _run_agent(
@@ -63,7 +149,7 @@ async def _run_agent(
     allowed_tools: list[str] | None = None,
     max_turns: int = 10,
 ) -> tuple[str, list[str]]:
-    """Run Claude Code agent and collect results.
+    """Run Claude Code agent in a fresh process and collect results.
 
     Args:
         prompt: The prompt/instructions to send to Claude.
@@ -75,30 +161,268 @@ async def _run_agent(
     Returns:
         Tuple of (output_text, list_of_files_written).
     """
-    options = ClaudeAgentOptions(
-        cwd=str(cwd) if cwd else None,
+    options = _agent_options(
+        cwd=cwd, system_prompt=system_prompt, allowed_tools=allowed_tools, max_turns=max_turns, model=model
+    )
+    return await _collect(query(prompt=prompt, options=options.to_sdk()))
+
+
+class AgentSession:
+    """One long-lived Claude Code process serving sequential calls.
+
+    The conversation is cleared (/clear) between calls so each prompt is
+    answered independently, and the process is replaced after max_calls
+    calls, after a timeout or error, or if clearing fails.
+    """
+
+    def __init__(self, options: AgentOptions, *, max_calls: int = DEFAULT_SESSION_MAX_CALLS):
+        self.options = options
+        self.max_calls = max_calls
+        self.calls = 0
+        self.starts = 0
+        self._client: ClaudeSDKClient | None = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> ClaudeSDKClient:
+        client = ClaudeSDKClient(self.options.to_sdk())
+        try:
+            await client.connect()
+        except BaseException:
+            # A failed or timed-out start may have left a process behind
+            await _disconnect(client)
+            raise
+        self.starts += 1
+        self.calls = 0
+        return client
+
+    async def _clear(self, client: ClaudeSDKClient) -> bool:
+        """Reset the conversation; False if the agent did not respond in time.
+
+        If clearing times out, the session falls back to one call per
+        process rather than paying the timeout on every call.
+        """
+        with anyio.move_on_after(SESSION_CLEAR_TIMEOUT_SECONDS) as scope:
+            await client.query("/clear")
+            await _collect(client.receive_response())
+        if scope.cancelled_caught:
+            _logger.warning("Agent session did not clear its conversation; using a new process per call")
+            self.max_calls = 1
+            return False
+        return True
+
+    async def run(self, prompt: str, *, timeout_seconds: float) -> tuple[str, list[str]]:
+        """Send one prompt and collect its result.
+
+        Args:
+            prompt: The prompt to send.
+            timeout_seconds: Maximum time for the call.
+
+        Returns:
+            Tuple of (output_text, list_of_files_written).
+        """
+        async with self._lock:
+            if self._client is not None and (self.calls >= self.max_calls or not await self._clear(self._client)):
+                await self.close()
+            try:
+                with anyio.fail_after(timeout_seconds):
+                    if self._client is None:
+                        self._client = await self._connect()
+                    await self._client.query(prompt)
+                    result = await _collect(self._client.receive_response())
+                self.calls += 1
+                return result
+            except BaseException:
+                # The agent may still be working on the prompt; start over next time
+                await self.close()
+                raise
+
+    @property
+    def busy(self) -> bool:
+        """Whether a call is running or queued on this session."""
+        return self._lock.locked()
+
+    async def close(self) -> None:
+        """Stop the agent process."""
+        client, self._client = self._client, None
+        if client is not None:
+            await _disconnect(client)
+
+
+async def _disconnect(client: ClaudeSDKClient) -> None:
+    """Stop an agent process, even from a cancelled task, waiting a bounded time."""
+    with anyio.move_on_after(SESSION_CLEAR_TIMEOUT_SECONDS, shield=True):
+        try:
+            await client.disconnect()
+        except Exception as e:
+            _logger.debug("Agent session disconnect failed: %s", e)
+
+
+class AgentSessionPool:
+    """Agent sessions keyed by options, driven by a private event loop thread.
+
+    Clients from the SDK are bound to the event loop they connected on, so
+    the pool owns one loop for its whole lifetime. Synchronous callers block
+    on it, and async callers from any other loop await it. Up to
+    sessions_per_options processes serve each option set concurrently.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_calls_per_session: int = DEFAULT_SESSION_MAX_CALLS,
+        sessions_per_options: int = DEFAULT_SESSIONS_PER_OPTIONS,
+    ):
+        self.max_calls_per_session = max_calls_per_session
+        self.sessions_per_options = sessions_per_options
+        self._sessions: dict[AgentOptions, list[AgentSession]] = {}
+        self._next = 0
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="voyager-agent-sessions", daemon=True)
+        self._thread.start()
+
+    def _submit[T](self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _run(self, prompt: str, options: AgentOptions, timeout_seconds: float) -> tuple[str, list[str]]:
+        sessions = self._sessions.setdefault(options, [])
+        session = next((s for s in sessions if not s.busy), None)
+        if session is None and len(sessions) < max(1, self.sessions_per_options):
+            session = AgentSession(options, max_calls=self.max_calls_per_session)
+            sessions.append(session)
+        elif session is None:
+            # All busy: queue on the sessions in turn
+            self._next += 1
+            session = sessions[self._next % len(sessions)]
+        # Bounds waiting behind queued calls and clearing the previous
+        # conversation; session.run bounds startup and the call itself
+        with anyio.fail_after(timeout_seconds + SESSION_CLEAR_TIMEOUT_SECONDS):
+            return await session.run(prompt, timeout_seconds=timeout_seconds)
+
+    def run(self, prompt: str, options: AgentOptions, *, timeout_seconds: float) -> tuple[str, list[str]]:
+        """Run a prompt on the session for options, blocking until done.
+
+        Raises:
+            TimeoutError: If the call does not finish within timeout_seconds
+                plus the time allowed for clearing and closing sessions.
+        """
+        future = self._submit(self._run(prompt, options, timeout_seconds))
+        try:
+            return future.result(timeout=timeout_seconds + 2 * SESSION_CLEAR_TIMEOUT_SECONDS)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    async def arun(self, prompt: str, options: AgentOptions, *, timeout_seconds: float) -> tuple[str, list[str]]:
+        """Run a prompt on the session for options from any event loop."""
+        return await asyncio.wrap_future(self._submit(self._run(prompt, options, timeout_seconds)))
+
+    @property
+    def sessions(self) -> list[AgentSession]:
+        """Sessions started so far."""
+        return [session for sessions in self._sessions.values() for session in sessions]
+
+    def close(self) -> None:
+        """Stop every agent process and the pool's event loop."""
+
+        async def close_all() -> None:
+            for session in self.sessions:
+                await session.close()
+
+        try:
+            self._submit(close_all()).result(timeout=SESSION_CLEAR_TIMEOUT_SECONDS)
+        except Exception as e:
+            _logger.debug("Closing agent sessions failed: %s", e)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+_session_pool: AgentSessionPool | None = None
+
+
+@contextlib.contextmanager
+def reuse_agent_sessions(*, max_calls_per_session: int = DEFAULT_SESSION_MAX_CALLS) -> Iterator[AgentSessionPool]:
+    """Reuse agent processes for call_claude calls made inside the block.
+
+    Worth it for loops of short calls (skill analysis with max_turns=1),
+    where process startup dominates. Nested blocks share the outer pool.
+
+    Args:
+        max_calls_per_session: Calls served by a process before replacing it.
+
+    Yields:
+        The active session pool.
+    """
+    global _session_pool
+    if _session_pool is not None:
+        yield _session_pool
+        return
+
+    pool = AgentSessionPool(max_calls_per_session=max_calls_per_session)
+    _session_pool = pool
+    try:
+        yield pool
+    finally:
+        _session_pool = None
+        pool.close()
+
+
+def _cache_key(
+    prompt: str,
+    *,
+    cwd: Path | str | None,
+    system_prompt: str | None,
+    allowed_tools: list[str] | None,
+    max_turns: int,
+) -> str:
+    """Build the response cache key for a call_claude invocation."""
+    return make_cache_key(
+        provider="claude",
+        model=None,
         system_prompt=system_prompt,
-        allowed_tools=allowed_tools or ["Read", "Write", "Glob"],
-        permission_mode="acceptEdits",
+        prompt=prompt,
+        temperature=None,
+        cwd=str(Path(cwd).resolve()) if cwd else None,
+        allowed_tools=allowed_tools,
         max_turns=max_turns,
-        model=model,
     )
 
-    output = ""
-    files_written: list[str] = []
 
-    async for message in query(prompt=prompt, options=options):
-        if isinstance(message, ResultMessage):
-            output = message.result
-        elif isinstance(message, AssistantMessage):
-            # Track file writes from tool use blocks
-            for block in message.content:
-                if isinstance(block, ToolUseBlock) and block.name == "Write":
-                    file_path = block.input.get("file_path", "")
-                    if file_path:
-                        files_written.append(file_path)
+def _replay_cached(key: str, base_dir: Path) -> LLMResult | None:
+    """Serve a cached result, rewriting the files the original call wrote."""
+    cached = get_llm_cache().get(key)
+    if cached is None:
+        return None
 
-    return output, files_written
+    files = []
+    for entry in cached.get("files", []):
+        path = base_dir / entry["path"]
+        if not write_file(path, entry["content"]):
+            _logger.warning("Could not replay cached file %s; calling agent", path)
+            return None
+        files.append(str(path))
+    _logger.debug("Served agent call from cache. Files replayed: %s", files)
+    return LLMResult(success=True, output=cached.get("output", ""), files=files)
+
+
+def _store_result(key: str, result: LLMResult, base_dir: Path) -> None:
+    """Cache a successful result with the contents of the files it wrote.
+
+    Results that wrote files outside base_dir, or files that can no longer
+    be read, are not cached since they could not be replayed faithfully.
+    """
+    files = []
+    for file_path in result.files:
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = base_dir / path
+        path = path.resolve()
+        content = read_file(path)
+        if content is None or not path.is_relative_to(base_dir):
+            _logger.debug("Not caching agent call that wrote %s", path)
+            return
+        files.append({"path": str(path.relative_to(base_dir)), "content": content})
+    get_llm_cache().put(key, {"output": result.output, "files": files})
 
 
 def call_claude(
@@ -109,12 +433,17 @@ def call_claude(
     timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
     allowed_tools: list[str] | None = None,
     max_turns: int = 10,
+    cache: bool = True,
 ) -> LLMResult:
     """Run Claude Code agent with file operation permissions.
 
     Claude Code will execute as an agent that can read/write files directly.
     The agent is limited to file operations by default (Read, Write, Glob).
 
+    Identical calls are served from the LLM response cache (see
+    voyager.llm_cache): the cached output is returned and the files the
+    original call wrote are rewritten with the same contents.
+
     Args:
         prompt: The prompt/instructions to send to Claude.
         cwd: Working directory for the agent.
@@ -122,15 +451,193 @@ def call_claude(
         timeout_seconds: Maximum time to wait for response.
         allowed_tools: List of allowed tools. Defaults to ["Read", "Write", "Glob"].
         max_turns: Maximum number of conversation turns.
+        cache: Set False to bypass the response cache for this call.
 
     Returns:
         LLMResult with success status, output text, and list of files written.
     """
+    key = None
+    base_dir = Path(cwd).resolve() if cwd else Path.cwd().resolve()
+    if cache and is_cache_enabled():
+        key = _cache_key(prompt, cwd=cwd, system_prompt=system_prompt, allowed_tools=allowed_tools, max_turns=max_turns)
+        cached = _replay_cached(key, base_dir)
+        if cached is not None:
+            return cached
+
+    result = _call_agent(
+        prompt,
+        cwd=cwd,
+        system_prompt=system_prompt,
+        timeout_seconds=timeout_seconds,
+        allowed_tools=allowed_tools,
+        max_turns=max_turns,
+    )
+    if key is not None and result.success:
+        _store_result(key, result, base_dir)
+    return result
+
+
+async def call_claude_async(
+    prompt: str,
+    *,
+    cwd: Path | str | None = None,
+    system_prompt: str | None = None,
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    allowed_tools: list[str] | None = None,
+    max_turns: int = 10,
+    cache: bool = True,
+) -> LLMResult:
+    """Async variant of call_claude for callers already inside an event loop.
+
+    Uses the active reuse_agent_sessions() pool if there is one. The
+    recursion guard is passed to the agent's environment rather than set in
+    this process, so concurrent calls do not interfere.
+
+    Args:
+        prompt: The prompt/instructions to send to Claude.
+        cwd: Working directory for the agent.
+        system_prompt: Optional system prompt.
+        timeout_seconds: Maximum time to wait for response.
+        allowed_tools: List of allowed tools. Defaults to ["Read", "Write", "Glob"].
+        max_turns: Maximum number of conversation turns.
+        cache: Set False to bypass the response cache for this call.
+
+    Returns:
+        LLMResult with success status, output text, and list of files written.
+    """
+    key = None
+    base_dir = Path(cwd).resolve() if cwd else Path.cwd().resolve()
+    if cache and is_cache_enabled():
+        key = _cache_key(prompt, cwd=cwd, system_prompt=system_prompt, allowed_tools=allowed_tools, max_turns=max_turns)
+        cached = _replay_cached(key, base_dir)
+        if cached is not None:
+            return cached
+
+    options = _agent_options(cwd=cwd, system_prompt=system_prompt, allowed_tools=allowed_tools, max_turns=max_turns)
+    try:
+        pool = _session_pool
+        if pool is not None:
+            output, files = await pool.arun(prompt, options, timeout_seconds=timeout_seconds)
+        else:
+            with anyio.fail_after(timeout_seconds):
+                output, files = await _collect(query(prompt=prompt, options=options.to_sdk()))
+        _logger.debug("Agent completed. Files written: %s", files)
+        result = LLMResult(success=True, output=output, files=files)
+    except TimeoutError:
+        _logger.warning("Agent call timed out after %ds", timeout_seconds)
+        return LLMResult(success=False, error=f"timed out after {timeout_seconds}s")
+    except Exception as e:
+        _logger.warning("Agent call failed: %s", e)
+        return LLMResult(success=False, error=str(e))
+
+    if key is not None:
+        _store_result(key, result, base_dir)
+    return result
+
+
+async def call_batch_async(
+    prompts: Sequence[str],
+    *,
+    system_prompt: str | None = None,
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    validate: ItemValidator | None = None,
+    max_items_per_call: int = DEFAULT_MAX_ITEMS_PER_CALL,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    cache: bool = True,
+) -> list[LLMResult]:
+    """Answer many small independent text prompts with as few agent calls as possible.
+
+    Prompts are packed into multi-task prompts that ask for a JSON array of
+    answers (see voyager.batching), and the packed calls run concurrently.
+    Answers that are missing or fail validate are retried as single calls.
+    Calls run without tools and with a single turn.
+
+    Args:
+        prompts: Independent task prompts.
+        system_prompt: System prompt shared by every task.
+        timeout_seconds: Timeout per task; packed calls get one per task they carry.
+        validate: Optional check on each packed answer's text.
+        max_items_per_call: Most prompts packed together (1 disables packing).
+        max_concurrency: Most agent calls in flight at once.
+        cache: Set False to bypass the response cache.
+
+    Returns:
+        One LLMResult per prompt, in order.
+    """
+
+    async def send(prompt: str, timeout: int) -> LLMResult:
+        return await call_claude_async(
+            prompt,
+            system_prompt=system_prompt,
+            timeout_seconds=timeout,
+            allowed_tools=[],
+            max_turns=1,
+            cache=cache,
+        )
+
+    async def send_packed(prompt: str, count: int) -> str | None:
+        result = await send(prompt, timeout_seconds * count)
+        return result.output if result.success else None
+
+    return await run_batched(
+        prompts,
+        send_packed=send_packed,
+        send_single=lambda i: send(prompts[i], timeout_seconds),
+        wrap=lambda _i, answer: LLMResult(success=True, output=answer),
+        validate=validate,
+        max_items=max_items_per_call,
+        max_concurrency=max_concurrency,
+    )
+
+
+def call_batch(
+    prompts: Sequence[str],
+    *,
+    system_prompt: str | None = None,
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    validate: ItemValidator | None = None,
+    max_items_per_call: int = DEFAULT_MAX_ITEMS_PER_CALL,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    cache: bool = True,
+) -> list[LLMResult]:
+    """Synchronous variant of call_batch_async."""
+    return anyio.run(
+        functools.partial(
+            call_batch_async,
+            prompts,
+            system_prompt=system_prompt,
+            timeout_seconds=timeout_seconds,
+            validate=validate,
+            max_items_per_call=max_items_per_call,
+            max_concurrency=max_concurrency,
+            cache=cache,
+        )
+    )
+
+
+def _call_agent(
+    prompt: str,
+    *,
+    cwd: Path | str | None,
+    system_prompt: str | None,
+    timeout_seconds: int,
+    allowed_tools: list[str] | None,
+    max_turns: int,
+) -> LLMResult:
+    """Run the agent under the recursion guard and timeout (uncached)."""
     # Set recursion guard
     env_backup = os.environ.get(RECURSION_GUARD_VAR)
     os.environ[RECURSION_GUARD_VAR] = "1"
 
     try:
+        pool = _session_pool
+        if pool is not None:
+            options = _agent_options(
+                cwd=cwd, system_prompt=system_prompt, allowed_tools=allowed_tools, max_turns=max_turns
+            )
+            output, files = pool.run(prompt, options, timeout_seconds=timeout_seconds)
+            _logger.debug("Agent completed on reused session. Files written: %s", files)
+            return LLMResult(success=True, output=output, files=files)
 
         async def _with_timeout() -> tuple[str, list[str]]:
             with anyio.fail_after(timeout_seconds):
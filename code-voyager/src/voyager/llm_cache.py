@@ -0,0 +1,371 @@
+"""Content-addressed cache for LLM responses.
+
+Curriculum planning, skill proposals and skill analysis often resend the
+exact same prompt (re-running after a failure, re-analyzing unchanged
+skills). Responses are cached in a per-project SQLite database keyed by a
+hash of everything that determines the answer: provider, model, system
+prompt, prompt, temperature and any call-specific extras.
+
+Entries expire after a TTL and the least recently used entries are evicted
+once the cache exceeds its size budget. Cache failures never break a call;
+they are logged and treated as misses.
+
+Configuration:
+    VOYAGER_LLM_CACHE=0        disable caching entirely
+    VOYAGER_LLM_CACHE_PATH     use a different database (e.g. a test fixture)
+
+Usage:
+    from voyager.llm_cache import CachedProvider
+
+    provider = CachedProvider(OllamaProvider())
+    response = provider.call(AIRequest(prompt="..."))          # cached
+    response = provider.call(AIRequest(prompt="...", cache=False))  # bypass
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from voyager.adapters.base.ai_provider import AIProvider, AIRequest, AIResponse, AIStreamChunk
+from voyager.config import get_voyager_state_dir
+from voyager.logging import get_logger
+
+_logger = get_logger("llm_cache")
+
+# Environment variable that disables caching when set to "0"/"false"/"no"
+CACHE_ENV_VAR = "VOYAGER_LLM_CACHE"
+
+# Environment variable overriding the cache database location
+CACHE_PATH_ENV_VAR = "VOYAGER_LLM_CACHE_PATH"
+
+# Entries older than this are treated as misses and pruned
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+# Total stored response bytes before least recently used entries are evicted
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used_at);
+"""
+
+
+def is_cache_enabled() -> bool:
+    """Check whether LLM response caching is enabled (VOYAGER_LLM_CACHE)."""
+    return os.environ.get(CACHE_ENV_VAR, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def get_llm_cache_path() -> Path:
+    """Get the path to the LLM response cache database."""
+    override = os.environ.get(CACHE_PATH_ENV_VAR)
+    if override:
+        return Path(override)
+    return get_voyager_state_dir() / "llm_cache.sqlite"
+
+
+def make_cache_key(
+    *,
+    provider: str,
+    model: str | None,
+    system_prompt: str | None,
+    prompt: str,
+    temperature: float | None,
+    **extra: Any,
+) -> str:
+    """Hash everything that determines an LLM response into a cache key.
+
+    Args:
+        provider: Provider name.
+        model: Model name (None for the provider default).
+        system_prompt: System prompt, if any.
+        prompt: User prompt.
+        temperature: Sampling temperature (None for the provider default).
+        **extra: Other inputs that change the response (tools, cwd, ...).
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    material = {
+        "provider": provider,
+        "model": model,
+        "system_prompt": system_prompt,
+        "prompt": prompt,
+        "temperature": temperature,
+        **extra,
+    }
+    encoded = json.dumps(material, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """Hit/miss counters for one cache instance in this process."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LLMCache:
+    """SQLite-backed response cache with TTL and size-based eviction."""
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Database path. Defaults to get_llm_cache_path().
+            ttl_seconds: Maximum entry age.
+            max_bytes: Size budget for stored values.
+        """
+        self.path = Path(path) if path is not None else get_llm_cache_path()
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Look up a cached value.
+
+        Args:
+            key: Cache key from make_cache_key.
+
+        Returns:
+            The stored value, or None on a miss, expiry or error.
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute("SELECT value, created_at FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None and now - row[1] > self.ttl_seconds:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    row = None
+                if row is None:
+                    self.stats.misses += 1
+                    return None
+                conn.execute(
+                    "UPDATE entries SET last_used_at = ?, hits = hits + 1 WHERE key = ?",
+                    (now, key),
+                )
+                self.stats.hits += 1
+            return json.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError) as e:
+            _logger.warning("LLM cache lookup failed: %s", e)
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, value: dict[str, Any]) -> bool:
+        """Store a value, evicting old entries if over budget.
+
+        Args:
+            key: Cache key from make_cache_key.
+            value: JSON-serializable value.
+
+        Returns:
+            True if stored.
+        """
+        now = time.time()
+        try:
+            encoded = json.dumps(value, ensure_ascii=False)
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, created_at, last_used_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, encoded, len(encoded.encode("utf-8")), now, now),
+                )
+                self.stats.stores += 1
+                self._evict(conn, now)
+            return True
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            _logger.warning("LLM cache store failed: %s", e)
+            return False
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then least recently used ones over budget."""
+        expired = conn.execute("DELETE FROM entries WHERE created_at < ?", (now - self.ttl_seconds,)).rowcount
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        evicted = 0
+        if total > self.max_bytes:
+            for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_used_at").fetchall():
+                if total <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+                evicted += 1
+        self.stats.evictions += expired + evicted
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        try:
+            with self._lock:
+                self._connect().execute("DELETE FROM entries")
+        except sqlite3.Error as e:
+            _logger.warning("LLM cache clear failed: %s", e)
+
+    def summary(self) -> dict[str, Any]:
+        """Describe the cache contents and this process's hit/miss counters."""
+        entries = total_bytes = total_hits = 0
+        try:
+            with self._lock:
+                entries, total_bytes, total_hits = (
+                    self._connect()
+                    .execute("SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM entries")
+                    .fetchone()
+                )
+        except sqlite3.Error as e:
+            _logger.warning("LLM cache summary failed: %s", e)
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "bytes": total_bytes,
+            "lifetime_hits": total_hits,
+            **dataclasses.asdict(self.stats),
+            "hit_rate": self.stats.hit_rate,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_caches: dict[Path, LLMCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMCache:
+    """Get the process-wide cache for the current project."""
+    path = get_llm_cache_path().resolve()
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = LLMCache(path)
+            _caches[path] = cache
+        return cache
+
+
+class CachedProvider(AIProvider):
+    """AIProvider decorator that serves repeated requests from the cache.
+
+    Only successful responses are stored. Requests with cache=False, and all
+    requests while VOYAGER_LLM_CACHE=0, go straight to the wrapped provider.
+    Streaming is passed through uncached.
+    """
+
+    def __init__(self, provider: AIProvider, cache: LLMCache | None = None):
+        """Wrap a provider.
+
+        Args:
+            provider: Provider to call on cache misses.
+            cache: Cache to use. Defaults to get_llm_cache().
+        """
+        self._provider = provider
+        self._cache = cache
+
+    @property
+    def cache(self) -> LLMCache:
+        """The cache backing this provider."""
+        return self._cache or get_llm_cache()
+
+    def _key(self, request: AIRequest) -> str | None:
+        if not request.cache or not is_cache_enabled():
+            return None
+        return make_cache_key(
+            provider=self._provider.get_name(),
+            model=request.model,
+            system_prompt=request.system_prompt,
+            prompt=request.prompt,
+            temperature=request.temperature,
+            endpoint=self._provider.pool_key(),
+            cwd=str(Path(request.cwd).resolve()) if request.cwd else None,
+            allowed_tools=request.allowed_tools,
+            max_turns=request.max_turns,
+        )
+
+    def _lookup(self, key: str | None) -> AIResponse | None:
+        if key is None:
+            return None
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        metadata = {**cached.get("metadata", {}), "cache": "hit"}
+        return AIResponse(success=True, output=cached.get("output", ""), files=[], metadata=metadata)
+
+    def _store(self, key: str | None, response: AIResponse) -> AIResponse:
+        if key is not None and response.success and not response.files:
+            self.cache.put(key, {"output": response.output, "metadata": response.metadata})
+        return response
+
+    def call(self, request: AIRequest) -> AIResponse:
+        """Call the wrapped provider unless the response is cached."""
+        key = self._key(request)
+        hit = self._lookup(key)
+        if hit is not None:
+            return hit
+        return self._store(key, self._provider.call(request))
+
+    async def acall(self, request: AIRequest) -> AIResponse:
+        """Async variant of call using the wrapped provider's acall."""
+        key = self._key(request)
+        hit = self._lookup(key)
+        if hit is not None:
+            return hit
+        return self._store(key, await self._provider.acall(request))
+
+    def stream(self, request: AIRequest) -> Iterator[AIStreamChunk]:
+        """Stream from the wrapped provider (not cached)."""
+        return self._provider.stream(request)
+
+    def is_available(self) -> bool:
+        """Delegate to the wrapped provider."""
+        return self._provider.is_available()
+
+    def pool_key(self) -> str:
+        """Delegate to the wrapped provider."""
+        return self._provider.pool_key()
+
+    def get_name(self) -> str:
+        """Name of the wrapped provider."""
+        return self._provider.get_name()
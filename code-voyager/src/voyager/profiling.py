@@ -0,0 +1,241 @@
+"""Opt-in timing traces for hooks and brain updates.
+
+Hooks run on every session event and tool call, so slow phases (repo
+snapshot, transcript parsing, SQLite, skill detection, LLM calls) add up
+without anyone noticing. Setting VOYAGER_PROFILE=1 records one trace per
+command run: its total time and the time spent in each named phase. Traces
+are appended as compact JSON lines to profile.jsonl in the state dir and
+summarized by `voyager perf report`.
+
+When profiling is off, trace() costs one environment lookup per command
+and span() returns a shared no-op context manager.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from voyager.io import file_lock, read_jsonl_tail, write_jsonl
+from voyager.logging import get_logger
+
+_logger = get_logger("profiling")
+
+# Environment variable that turns profiling on ("1")
+PROFILE_ENV_VAR = "VOYAGER_PROFILE"
+
+# Trace file name in the state dir
+PROFILE_FILENAME = "profile.jsonl"
+
+# Trace file size that triggers trimming to the newest records
+PROFILE_MAX_BYTES = 2_000_000
+
+# Records kept when the trace file is trimmed
+PROFILE_KEEP_RECORDS = 5000
+
+# Name of the phase covering a whole command in reports
+TOTAL_PHASE = "total"
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+def is_profiling_enabled() -> bool:
+    """Check if timing traces should be recorded (VOYAGER_PROFILE=1)."""
+    return os.environ.get(PROFILE_ENV_VAR) == "1"
+
+
+def get_profile_path() -> Path:
+    """Get the path to the trace file."""
+    from voyager.config import get_voyager_state_dir
+
+    return get_voyager_state_dir() / PROFILE_FILENAME
+
+
+class _Trace:
+    """Phase timings collected during one command run."""
+
+    def __init__(self, command: str) -> None:
+        self.command = command
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.spans: dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        # Repeated phases (e.g. one per pending update) are summed
+        self.spans[name] = self.spans.get(name, 0.0) + seconds * 1000
+
+    def record(self, ok: bool) -> dict[str, Any]:
+        return {
+            "command": self.command,
+            "ts": round(self.started_at, 3),
+            "ms": round((time.perf_counter() - self.start) * 1000, 3),
+            "ok": ok,
+            "spans": {name: round(ms, 3) for name, ms in self.spans.items()},
+        }
+
+
+# Trace of the command currently running in this process, if profiled
+_current: _Trace | None = None
+
+
+@contextlib.contextmanager
+def _span(trace: _Trace, name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, time.perf_counter() - start)
+
+
+def span(name: str) -> contextlib.AbstractContextManager[Any]:
+    """Time a phase of the command being traced.
+
+    Outside a profiled command this returns a shared no-op context manager.
+
+    Args:
+        name: Phase name, e.g. "snapshot" or "llm".
+    """
+    if _current is None:
+        return _NULL_SPAN
+    return _span(_current, name)
+
+
+def _succeeded(error: BaseException | None) -> bool:
+    # typer.Exit / SystemExit with status 0 is a normal return
+    if error is None:
+        return True
+    code = getattr(error, "exit_code", getattr(error, "code", 1))
+    return code in (0, None)
+
+
+@contextlib.contextmanager
+def trace(command: str) -> Iterator[None]:
+    """Record a trace for one command run if profiling is enabled.
+
+    Usable as a context manager or a decorator. A trace started while
+    another is active becomes a span of the outer one.
+
+    Args:
+        command: Command name, e.g. "hook post-tool-use".
+    """
+    global _current
+
+    if _current is not None:
+        with _span(_current, command):
+            yield
+        return
+    if not is_profiling_enabled():
+        yield
+        return
+
+    _current = current = _Trace(command)
+    error: BaseException | None = None
+    try:
+        yield
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _current = None
+        append_trace(current.record(_succeeded(error)))
+
+
+def append_trace(record: dict[str, Any], path: Path | None = None) -> bool:
+    """Append a trace record, trimming the file once it grows too large.
+
+    Never raises.
+
+    Returns:
+        True if the record was written.
+    """
+    path = path or get_profile_path()
+    written = write_jsonl(path, [record], append=True)
+    try:
+        too_large = path.stat().st_size > PROFILE_MAX_BYTES
+    except OSError:
+        return written
+    if too_large:
+        with file_lock(path.with_name(path.name + ".lock"), blocking=False) as acquired:
+            if acquired:
+                kept = read_jsonl_tail(path, PROFILE_KEEP_RECORDS).items
+                write_jsonl(path, kept)
+    return written
+
+
+def load_traces(path: Path | None = None, *, last: int = 1000, command: str | None = None) -> list[dict[str, Any]]:
+    """Load the most recent trace records.
+
+    Args:
+        path: Trace file (defaults to get_profile_path()).
+        last: Most records to read from the end of the file.
+        command: Only keep records whose command starts with this prefix.
+
+    Returns:
+        Records in file order.
+    """
+    records = [r for r in read_jsonl_tail(path or get_profile_path(), last).items if isinstance(r, dict)]
+    if command:
+        records = [r for r in records if str(r.get("command", "")).startswith(command)]
+    return records
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    """Latency percentiles for one phase of one command."""
+
+    command: str
+    phase: str
+    samples: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(records: Iterable[dict[str, Any]]) -> list[PhaseStats]:
+    """Compute per-phase percentiles for each command.
+
+    A phase missing from a run (e.g. the LLM call when it was skipped) is
+    left out of that phase's samples rather than counted as zero.
+
+    Returns:
+        Stats sorted by command, with the total first and then phases by
+        descending p95.
+    """
+    samples: dict[tuple[str, str], list[float]] = {}
+    for record in records:
+        command = str(record.get("command", "?"))
+        phases = {TOTAL_PHASE: record.get("ms"), **(record.get("spans") or {})}
+        for phase, ms in phases.items():
+            if isinstance(ms, int | float):
+                samples.setdefault((command, phase), []).append(float(ms))
+
+    stats = []
+    for (command, phase), values in samples.items():
+        values.sort()
+        stats.append(
+            PhaseStats(
+                command=command,
+                phase=phase,
+                samples=len(values),
+                p50_ms=_percentile(values, 0.5),
+                p95_ms=_percentile(values, 0.95),
+                p99_ms=_percentile(values, 0.99),
+                max_ms=values[-1],
+            )
+        )
+    stats.sort(key=lambda s: (s.command, s.phase != TOTAL_PHASE, -s.p95_ms))
+    return stats
@@ -0,0 +1,468 @@
+"""Client-side rate limiting and retry backoff for LLM calls.
+
+Parallel skill analysis, memory building and hook-triggered detection all
+share the same API keys. Without coordination they burst past the
+provider's limits and then retry in lockstep. This module provides:
+
+- RateLimiter: token buckets for requests and tokens per minute plus an
+  optional concurrency cap, shared by everything in the process that uses
+  the same limiter name.
+- FileRateLimiter: the same buckets stored in the state dir under a file
+  lock, so separate processes (hooks, workers, CLIs) share one budget.
+- Retry helpers that honor Retry-After and add jitter so retries spread out.
+
+Limits are configured per provider in its [ai.<name>] section:
+    requests_per_minute = 50
+    tokens_per_minute = 40000
+    max_concurrency = 4
+    shared_rate_limit = true   # coordinate across processes
+
+Usage:
+    limiter = limiter_for_provider("openrouter")
+    response = run_with_rate_limit(limiter, send, tokens=estimate)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import email.utils
+import json
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from voyager.config import get_config, get_voyager_state_dir
+from voyager.io import file_lock
+from voyager.logging import get_logger
+from voyager.transcript import estimate_tokens
+
+_logger = get_logger("ratelimit")
+
+# Attempts made by run_with_rate_limit before giving up on rate limit errors
+DEFAULT_MAX_ATTEMPTS = 4
+
+# Base and cap for exponential backoff, in seconds
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_CAP_SECONDS = 60.0
+
+# Polling interval bounds while an async caller waits for a concurrency slot
+SLOT_POLL_MIN_SECONDS = 0.001
+SLOT_POLL_MAX_SECONDS = 0.05
+
+# HTTP statuses treated as "slow down" signals
+RATE_LIMIT_STATUSES = frozenset({429, 503})
+
+
+@dataclasses.dataclass
+class TokenBucket:
+    """A token bucket refilled continuously at rate_per_minute.
+
+    Reservations may overdraw the bucket; the caller then waits until the
+    debt is repaid. This keeps requests in arrival order without polling.
+    """
+
+    rate_per_minute: float
+    level: float = 0.0
+    updated_at: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.updated_at:
+            self.level = self.rate_per_minute
+            self.updated_at = time.time()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take amount from the bucket.
+
+        Args:
+            amount: Units to take (requests or tokens).
+            now: Current wall-clock time.
+
+        Returns:
+            Seconds to wait before the reservation is covered.
+        """
+        elapsed = max(0.0, now - self.updated_at)
+        self.level = min(self.rate_per_minute, self.level + elapsed * self.rate_per_minute / 60)
+        self.updated_at = now
+        self.level -= amount
+        return 0.0 if self.level >= 0 else -self.level * 60 / self.rate_per_minute
+
+
+class RateLimiter:
+    """In-process rate limiter for one API key or endpoint."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        max_concurrency: int | None = None,
+    ):
+        """Initialize the limiter. Limits left as None are not enforced.
+
+        Args:
+            name: Limiter name (usually the provider config name).
+            requests_per_minute: Request budget.
+            tokens_per_minute: Token budget.
+            max_concurrency: Maximum calls in flight in this process.
+        """
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._buckets = self._new_buckets()
+        self._blocked_until = 0.0
+        self._semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+
+    def _new_buckets(self) -> dict[str, TokenBucket]:
+        buckets = {}
+        if self.requests_per_minute:
+            buckets["requests"] = TokenBucket(self.requests_per_minute)
+        if self.tokens_per_minute:
+            buckets["tokens"] = TokenBucket(self.tokens_per_minute)
+        return buckets
+
+    def _reserve_in(self, buckets: dict[str, TokenBucket], blocked_until: float, tokens: int, now: float) -> float:
+        wait = max(0.0, blocked_until - now)
+        if "requests" in buckets:
+            wait = max(wait, buckets["requests"].reserve(1, now))
+        if "tokens" in buckets and tokens:
+            wait = max(wait, buckets["tokens"].reserve(tokens, now))
+        return wait
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve budget for one call.
+
+        Args:
+            tokens: Estimated tokens the call will use.
+
+        Returns:
+            Seconds the caller must wait before sending.
+        """
+        with self._lock:
+            return self._reserve_in(self._buckets, self._blocked_until, tokens, time.time())
+
+    def penalize(self, seconds: float) -> None:
+        """Pause all callers for seconds (e.g. after a 429 with Retry-After)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.time() + seconds)
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Reserve budget and sleep until it is available.
+
+        Returns:
+            Seconds waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            _logger.debug("Rate limiter %s: waiting %.2fs", self.name, wait)
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Async variant of acquire."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            _logger.debug("Rate limiter %s: waiting %.2fs", self.name, wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    @contextlib.contextmanager
+    def slot(self, tokens: int = 0) -> Iterator[None]:
+        """Hold a concurrency slot and rate budget for one call."""
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        try:
+            self.acquire(tokens)
+            yield
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    @contextlib.asynccontextmanager
+    async def aslot(self, tokens: int = 0) -> AsyncIterator[None]:
+        """Async variant of slot; waits for a concurrency slot without blocking the event loop."""
+        if self._semaphore is not None:
+            await self._aacquire_semaphore()
+        try:
+            await self.aacquire(tokens)
+            yield
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    async def _aacquire_semaphore(self) -> None:
+        # Poll with non-blocking acquires rather than blocking in a worker
+        # thread: a cancelled waiter (e.g. a hedge loser) then never ends up
+        # holding a slot nobody releases. The semaphore stays shared with
+        # sync callers in other threads.
+        assert self._semaphore is not None
+        delay = SLOT_POLL_MIN_SECONDS
+        while not self._semaphore.acquire(blocking=False):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, SLOT_POLL_MAX_SECONDS)
+
+
+class FileRateLimiter(RateLimiter):
+    """Rate limiter whose buckets are shared across processes.
+
+    Bucket state lives in a JSON file guarded by an exclusive file lock.
+    The concurrency cap still applies per process.
+    """
+
+    def __init__(self, name: str, path: Path | str | None = None, **limits: Any):
+        """Initialize the limiter.
+
+        Args:
+            name: Limiter name.
+            path: State file. Defaults to <state dir>/ratelimit/<name>.json.
+            **limits: Same limits as RateLimiter.
+        """
+        super().__init__(name, **limits)
+        self.path = Path(path) if path else get_voyager_state_dir() / "ratelimit" / f"{name}.json"
+
+    def _update(self, fn: Callable[[dict[str, TokenBucket], float], tuple[float, float]]) -> float:
+        """Apply fn to the shared state under the file lock.
+
+        fn receives the buckets and blocked_until time and returns a
+        (result, new blocked_until) pair; buckets are updated in place.
+        """
+        with file_lock(self.path.with_suffix(".lock")):
+            try:
+                state = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                state = {}
+            buckets = self._new_buckets()
+            for key, bucket in buckets.items():
+                saved = state.get("buckets", {}).get(key)
+                if saved:
+                    bucket.level, bucket.updated_at = saved["level"], saved["updated_at"]
+            blocked_until = float(state.get("blocked_until", 0.0))
+
+            result, blocked_until = fn(buckets, blocked_until)
+
+            self.path.write_text(
+                json.dumps(
+                    {
+                        "buckets": {k: {"level": b.level, "updated_at": b.updated_at} for k, b in buckets.items()},
+                        "blocked_until": blocked_until,
+                    }
+                ),
+                encoding="utf-8",
+            )
+            return result
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve budget for one call from the shared buckets."""
+        try:
+            return self._update(
+                lambda buckets, blocked: (self._reserve_in(buckets, blocked, tokens, time.time()), blocked)
+            )
+        except OSError as e:
+            _logger.warning("Shared rate limiter %s unavailable, using local budget: %s", self.name, e)
+            return super().reserve(tokens)
+
+    def penalize(self, seconds: float) -> None:
+        """Pause callers in every process for seconds."""
+        try:
+            self._update(lambda _buckets, blocked: (0.0, max(blocked, time.time() + seconds)))
+        except OSError as e:
+            _logger.warning("Shared rate limiter %s unavailable: %s", self.name, e)
+            super().penalize(seconds)
+
+
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, *, shared: bool = False, **limits: Any) -> RateLimiter:
+    """Get the process-wide limiter for a name, creating it on first use.
+
+    Args:
+        name: Limiter name; callers using the same API key should share it.
+        shared: Coordinate across processes via FileRateLimiter.
+        **limits: requests_per_minute, tokens_per_minute, max_concurrency.
+
+    Returns:
+        The limiter registered under name (first registration's limits win).
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = FileRateLimiter(name, **limits) if shared else RateLimiter(name, **limits)
+            _limiters[name] = limiter
+        return limiter
+
+
+def limiter_for_provider(config_name: str) -> RateLimiter:
+    """Get the limiter configured in a provider's [ai.<name>] section.
+
+    Args:
+        config_name: Provider config name (e.g., "openrouter").
+
+    Returns:
+        Shared limiter; unlimited if the section sets no limits.
+    """
+    try:
+        extra = get_config().get_ai_config(config_name).extra
+    except KeyError:
+        extra = {}
+    return get_rate_limiter(
+        config_name,
+        shared=bool(extra.get("shared_rate_limit", False)),
+        requests_per_minute=extra.get("requests_per_minute"),
+        tokens_per_minute=extra.get("tokens_per_minute"),
+        max_concurrency=extra.get("max_concurrency"),
+    )
+
+
+def estimate_request_tokens(*texts: str | None) -> int:
+    """Estimate the prompt tokens a call will charge against tokens_per_minute."""
+    return sum(estimate_tokens(text) for text in texts if text)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta seconds or HTTP date).
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def _error_status_and_headers(error: BaseException) -> tuple[int | None, Any]:
+    """Extract HTTP status and headers from httpx or OpenAI SDK errors."""
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    headers = getattr(response, "headers", None) or {}
+    return status, headers
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an exception signals rate limiting (429/503)."""
+    status, _ = _error_status_and_headers(error)
+    return status in RATE_LIMIT_STATUSES
+
+
+def retry_after_from_error(error: BaseException) -> float | None:
+    """Get the Retry-After delay carried by an HTTP error, if any."""
+    _, headers = _error_status_and_headers(error)
+    try:
+        return parse_retry_after(headers.get("retry-after"))
+    except AttributeError:
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    *,
+    retry_after: float | None = None,
+    base: float = BACKOFF_BASE_SECONDS,
+    cap: float = BACKOFF_CAP_SECONDS,
+) -> float:
+    """Compute a jittered retry delay.
+
+    Uses "full jitter" exponential backoff, so concurrent clients spread out
+    instead of retrying together. A server-supplied Retry-After is a floor,
+    with up to one base interval of jitter added.
+
+    Args:
+        attempt: Zero-based retry attempt.
+        retry_after: Server-requested delay in seconds, if any.
+        base: Base delay.
+        cap: Maximum exponential delay.
+
+    Returns:
+        Seconds to sleep.
+    """
+    if retry_after is not None:
+        return retry_after + random.uniform(0, base)
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def penalize_if_rate_limited(limiter: RateLimiter, error: BaseException, attempt: int = 0) -> float | None:
+    """Pause a limiter's callers if error is a rate limit response.
+
+    Args:
+        limiter: Limiter whose callers should back off.
+        error: Exception raised by the call.
+        attempt: Zero-based retry attempt, for the backoff delay.
+
+    Returns:
+        The backoff delay applied, or None if error is not a rate limit.
+    """
+    if not is_rate_limit_error(error):
+        return None
+    delay = backoff_delay(attempt, retry_after=retry_after_from_error(error))
+    _logger.warning("Rate limited by %s; backing off %.1fs", limiter.name, delay)
+    limiter.penalize(delay)
+    return delay
+
+
+def run_with_rate_limit[T](
+    limiter: RateLimiter,
+    fn: Callable[[], T],
+    *,
+    tokens: int = 0,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> T:
+    """Call fn within the limiter, retrying rate limit errors with backoff.
+
+    A 429/503 pauses every caller of the limiter for the Retry-After delay
+    (or the backoff delay), then fn is retried. Other errors propagate.
+
+    Args:
+        limiter: Limiter to draw budget from.
+        fn: Zero-argument callable making the request; raises on HTTP errors.
+        tokens: Estimated tokens per attempt.
+        max_attempts: Total attempts before the last error is raised.
+
+    Returns:
+        fn's result.
+    """
+    for attempt in range(max_attempts):
+        try:
+            with limiter.slot(tokens):
+                return fn()
+        except Exception as e:
+            if attempt == max_attempts - 1 or penalize_if_rate_limited(limiter, e, attempt) is None:
+                raise
+    raise AssertionError("unreachable")
+
+
+async def arun_with_rate_limit[T](
+    limiter: RateLimiter,
+    fn: Callable[[], Awaitable[T]],
+    *,
+    tokens: int = 0,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> T:
+    """Async variant of run_with_rate_limit."""
+    for attempt in range(max_attempts):
+        try:
+            async with limiter.aslot(tokens):
+                return await fn()
+        except Exception as e:
+            if attempt == max_attempts - 1 or penalize_if_rate_limited(limiter, e, attempt) is None:
+                raise
+    raise AssertionError("unreachable")
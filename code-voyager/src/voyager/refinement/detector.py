@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Any
 
 from voyager.config import get_feedback_db_path
+from voyager.io import iter_jsonl_reverse
 from voyager.logging import get_logger
 
 _logger = get_logger("refinement.detector")
@@ -136,27 +137,25 @@ class SkillDetector:
             if not transcript.exists():
                 return None
 
-            skill_reads: list[str] = []
-            for line in transcript.read_text().splitlines():
-                try:
-                    entry = json.loads(line)
-                    # Look for file reads of SKILL.md
-                    if entry.get("tool_name") == "Read":
-                        path = entry.get("tool_input", {}).get("file_path", "")
-                        if "SKILL.md" in path:
-                            # Extract skill ID from path
-                            # e.g., "/mnt/skills/docx/SKILL.md" -> "docx"
-                            # or "skills/session-brain/SKILL.md" -> "session-brain"
-                            parts = Path(path).parts
-                            if "skills" in parts:
-                                idx = list(parts).index("skills")
-                                if idx + 1 < len(parts) - 1:
-                                    skill_reads.append(parts[idx + 1])
-                except json.JSONDecodeError:
+            # Walk backwards from EOF: the most recent skill read wins, so
+            # there is no need to parse the rest of the transcript
+            for entry in iter_jsonl_reverse(transcript):
+                if not isinstance(entry, dict):
                     continue
+                # Look for file reads of SKILL.md
+                if entry.get("tool_name") == "Read":
+                    path = entry.get("tool_input", {}).get("file_path", "")
+                    if "SKILL.md" in path:
+                        # Extract skill ID from path
+                        # e.g., "/mnt/skills/docx/SKILL.md" -> "docx"
+                        # or "skills/session-brain/SKILL.md" -> "session-brain"
+                        parts = Path(path).parts
+                        if "skills" in parts:
+                            idx = list(parts).index("skills")
+                            if idx + 1 < len(parts) - 1:
+                                return parts[idx + 1]
 
-            # Return most recently read skill
-            return skill_reads[-1] if skill_reads else None
+            return None
 
         except Exception as e:
             _logger.debug("Error reading transcript: %s", e)
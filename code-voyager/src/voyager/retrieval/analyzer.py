@@ -8,10 +8,11 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from voyager.llm import call_claude
+from voyager.llm import LLMResult, call_batch, call_claude
 from voyager.logging import get_logger
 
 _logger = get_logger("retrieval.analyzer")
@@ -90,19 +91,15 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
         return {}, content
 
 
-def analyze_skill(
-    skill_path: Path,
-    *,
-    skip_llm: bool = False,
-) -> SkillMetadata:
-    """Analyze a skill directory to extract metadata.
+# System prompt for skill metadata extraction calls
+EXTRACTION_SYSTEM_PROMPT = "You are a skill analyzer. Extract metadata as JSON."
 
-    Args:
-        skill_path: Path to the skill directory containing SKILL.md.
-        skip_llm: If True, skip LLM analysis and only use frontmatter.
+
+def _read_skill(skill_path: Path) -> tuple[SkillMetadata, str]:
+    """Read SKILL.md and build metadata from its frontmatter.
 
     Returns:
-        SkillMetadata with extracted fields.
+        Tuple of (metadata, full SKILL.md content).
 
     Raises:
         FileNotFoundError: If SKILL.md doesn't exist.
@@ -130,6 +127,50 @@ def analyze_skill(
     else:
         metadata.purpose = ""
 
+    return metadata, content
+
+
+def _extraction_prompt(content: str) -> str:
+    return EXTRACTION_PROMPT.format(content=content[:8000])  # Truncate if huge
+
+
+def _apply_llm_result(metadata: SkillMetadata, result: LLMResult) -> None:
+    """Fill LLM-extracted fields, falling back to description triggers on failure."""
+    if result.success and result.output:
+        # Parse JSON from output
+        extracted = _parse_json_response(result.output)
+        if extracted:
+            metadata.purpose = extracted.get("purpose", metadata.purpose)
+            metadata.task_types = extracted.get("task_types", [])
+            metadata.file_types = extracted.get("file_types", [])
+            metadata.capabilities = extracted.get("capabilities", [])
+            metadata.when_to_use = extracted.get("when_to_use", "")
+            metadata.when_not_to_use = extracted.get("when_not_to_use", "")
+            metadata.example_queries = extracted.get("example_queries", [])
+    else:
+        _logger.warning("LLM call failed for %s: %s", metadata.path.name, result.error)
+        _extract_triggers_from_description(metadata)
+
+
+def analyze_skill(
+    skill_path: Path,
+    *,
+    skip_llm: bool = False,
+) -> SkillMetadata:
+    """Analyze a skill directory to extract metadata.
+
+    Args:
+        skill_path: Path to the skill directory containing SKILL.md.
+        skip_llm: If True, skip LLM analysis and only use frontmatter.
+
+    Returns:
+        SkillMetadata with extracted fields.
+
+    Raises:
+        FileNotFoundError: If SKILL.md doesn't exist.
+    """
+    metadata, content = _read_skill(skill_path)
+
     if skip_llm:
         # Extract basic info from description trigger phrases
         _extract_triggers_from_description(metadata)
@@ -138,30 +179,14 @@ def analyze_skill(
     # Call LLM for rich extraction
     try:
         _logger.debug("Analyzing skill with LLM: %s", skill_path.name)
-        prompt = EXTRACTION_PROMPT.format(content=content[:8000])  # Truncate if huge
-
         result = call_claude(
-            prompt,
-            system_prompt="You are a skill analyzer. Extract metadata as JSON.",
+            _extraction_prompt(content),
+            system_prompt=EXTRACTION_SYSTEM_PROMPT,
             allowed_tools=[],  # No tools needed, just text response
             max_turns=1,
             timeout_seconds=30,
         )
-
-        if result.success and result.output:
-            # Parse JSON from output
-            extracted = _parse_json_response(result.output)
-            if extracted:
-                metadata.purpose = extracted.get("purpose", metadata.purpose)
-                metadata.task_types = extracted.get("task_types", [])
-                metadata.file_types = extracted.get("file_types", [])
-                metadata.capabilities = extracted.get("capabilities", [])
-                metadata.when_to_use = extracted.get("when_to_use", "")
-                metadata.when_not_to_use = extracted.get("when_not_to_use", "")
-                metadata.example_queries = extracted.get("example_queries", [])
-        else:
-            _logger.warning("LLM call failed for %s: %s", skill_path.name, result.error)
-            _extract_triggers_from_description(metadata)
+        _apply_llm_result(metadata, result)
 
     except Exception as e:
         _logger.warning("LLM extraction failed for %s: %s", skill_path.name, e)
@@ -170,6 +195,59 @@ def analyze_skill(
     return metadata
 
 
+def analyze_skills(
+    skill_paths: Sequence[Path],
+    *,
+    skip_llm: bool = False,
+) -> list[SkillMetadata | Exception]:
+    """Analyze several skills, packing the LLM extractions into few calls.
+
+    Equivalent to calling analyze_skill on each path, but the extraction
+    prompts go through call_batch. Answers that are not valid JSON are
+    retried one skill at a time.
+
+    Args:
+        skill_paths: Skill directories containing SKILL.md.
+        skip_llm: If True, skip LLM analysis and only use frontmatter.
+
+    Returns:
+        One entry per path, in order: the metadata, or the exception raised
+        while reading that skill.
+    """
+    outcomes: list[SkillMetadata | Exception] = []
+    pending: list[tuple[SkillMetadata, str]] = []
+    for skill_path in skill_paths:
+        try:
+            metadata, content = _read_skill(skill_path)
+        except Exception as e:
+            outcomes.append(e)
+            continue
+        outcomes.append(metadata)
+        if skip_llm:
+            _extract_triggers_from_description(metadata)
+        else:
+            pending.append((metadata, content))
+
+    if not pending:
+        return outcomes
+
+    _logger.debug("Analyzing %d skills with LLM", len(pending))
+    try:
+        results = call_batch(
+            [_extraction_prompt(content) for _, content in pending],
+            system_prompt=EXTRACTION_SYSTEM_PROMPT,
+            timeout_seconds=30,
+            validate=lambda text: _parse_json_response(text) is not None,
+        )
+    except Exception as e:
+        _logger.warning("Batched LLM extraction failed: %s", e)
+        results = [LLMResult(success=False, error=str(e))] * len(pending)
+
+    for (metadata, _), result in zip(pending, results, strict=True):
+        _apply_llm_result(metadata, result)
+    return outcomes
+
+
 def _parse_json_response(text: str) -> dict | None:
     """Parse JSON from LLM response, handling common issues."""
     # Try direct parse first
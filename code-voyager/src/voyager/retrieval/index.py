@@ -6,13 +6,15 @@ Gracefully degrades to simple text matching when dependencies are unavailable.
 
 from __future__ import annotations
 
+import contextlib
 import json
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 from voyager.config import get_skill_index_dir
+from voyager.llm import reuse_agent_sessions
 from voyager.logging import get_logger
-from voyager.retrieval.analyzer import SkillMetadata, analyze_skill
+from voyager.retrieval.analyzer import SkillMetadata, analyze_skills
 from voyager.retrieval.discovery import discover_all_skills
 from voyager.retrieval.embedding import (
     generate_embedding_text,
@@ -113,20 +115,22 @@ class SkillIndex:
         if verbose:
             print(f"Found {len(skills)} skills to index")
 
-        # Analyze each skill
+        # Analyze the skills, packing LLM extractions into few calls on reused agent processes
+        if verbose:
+            print("  Analyzing skills...")
+        with contextlib.nullcontext() if skip_llm else reuse_agent_sessions():
+            outcomes = analyze_skills(skills, skip_llm=skip_llm)
+
         analyzed: list[SkillMetadata] = []
-        for i, skill_path in enumerate(skills, 1):
-            if verbose:
-                print(f"  [{i}/{len(skills)}] Analyzing {skill_path.name}...", end=" ")
-            try:
-                metadata = analyze_skill(skill_path, skip_llm=skip_llm)
-                analyzed.append(metadata)
+        for i, (skill_path, outcome) in enumerate(zip(skills, outcomes, strict=True), 1):
+            if isinstance(outcome, Exception):
                 if verbose:
-                    print("OK")
-            except Exception as e:
-                if verbose:
-                    print(f"FAIL: {e}")
-                _logger.warning("Failed to analyze %s: %s", skill_path.name, e)
+                    print(f"  [{i}/{len(skills)}] {skill_path.name}: FAIL: {outcome}")
+                _logger.warning("Failed to analyze %s: %s", skill_path.name, outcome)
+                continue
+            analyzed.append(outcome)
+            if verbose:
+                print(f"  [{i}/{len(skills)}] {skill_path.name}: OK")
 
         if not analyzed:
             _logger.warning("No skills successfully analyzed")
@@ -14,9 +14,10 @@ from typing import Annotated, Any
 import typer
 
 from voyager.config import get_brain_json_path, get_brain_md_path, get_voyager_state_dir
+from voyager.guard import is_internal_call
 from voyager.io import read_file, read_json
-from voyager.llm import is_internal_call
 from voyager.logging import get_logger
+from voyager.profiling import span
 from voyager.repo.snapshot import snapshot_to_json
 
 _logger = get_logger("inject_context")
@@ -168,19 +169,22 @@ def inject_from_stdin() -> dict[str, Any]:
     state_dir = get_voyager_state_dir()
     state_dir.mkdir(parents=True, exist_ok=True)
 
-    # Read brain.md
-    brain_md_path = get_brain_md_path()
-    brain_md = read_file(brain_md_path)
+    with span("brain"):
+        # Read brain.md
+        brain_md_path = get_brain_md_path()
+        brain_md = read_file(brain_md_path)
 
-    # Read brain.json for next actions
-    brain_json_path = get_brain_json_path()
-    brain = read_json(brain_json_path)
+        # Read brain.json for next actions
+        brain_json_path = get_brain_json_path()
+        brain = read_json(brain_json_path)
 
     # Generate repo snapshot
-    snapshot = snapshot_to_json(cwd)
+    with span("snapshot"):
+        snapshot = snapshot_to_json(cwd)
 
     # Build context
-    context = build_context(brain_md, brain, snapshot)
+    with span("render"):
+        context = build_context(brain_md, brain, snapshot)
 
     # Build output
     output: dict[str, Any] = {
@@ -2,6 +2,11 @@
 
 Reads a session transcript (JSONL), invokes the LLM to update brain.json,
 validates the result, renders brain.md, and saves an episode snapshot.
+
+Updates are incremental: the byte offset consumed by the last successful
+update is remembered per session, so only the newly appended transcript
+segment is sent to the LLM, and the LLM call is skipped when that segment
+contains no conversational entries.
 """
 
 from __future__ import annotations
@@ -16,14 +21,18 @@ import typer
 from voyager.brain.render import render_and_save, render_compact
 from voyager.brain.store import (
     load_brain,
+    load_transcript_offset,
     save_brain,
     save_episode,
     save_last_update,
+    save_transcript_offset,
 )
 from voyager.config import get_brain_json_path, get_brain_md_path, get_plugin_root
-from voyager.io import read_file, read_json, read_jsonl
+from voyager.io import read_file, read_json, read_jsonl_tail
 from voyager.llm import call_claude, is_internal_call
 from voyager.logging import get_logger
+from voyager.profiling import span, trace
+from voyager.transcript import compress_transcript
 
 _logger = get_logger("update_brain")
 
@@ -32,9 +41,13 @@ app = typer.Typer(
     help="Update Session Brain from a transcript.",
 )
 
-# Limits to keep prompts bounded
-MAX_TRANSCRIPT_LINES = 200
-MAX_TRANSCRIPT_CHARS = 50000
+# Limits to keep prompts bounded: the most recent lines are read, then
+# compressed to the token budget
+MAX_TRANSCRIPT_LINES = 1000
+TRANSCRIPT_TOKEN_BUDGET = 12000
+
+# Transcript entry types worth an LLM round-trip (others are bookkeeping)
+MEANINGFUL_ENTRY_TYPES = frozenset({"user", "assistant", "tool_use", "tool_result"})
 
 
 def _load_prompt_template() -> str:
@@ -50,58 +63,33 @@ Write the updated brain JSON matching the brain schema."""
 
 def _format_transcript_for_prompt(
     lines: list[dict[str, Any]],
-    max_lines: int = MAX_TRANSCRIPT_LINES,
-    max_chars: int = MAX_TRANSCRIPT_CHARS,
+    budget_tokens: int = TRANSCRIPT_TOKEN_BUDGET,
 ) -> str:
     """Format transcript lines for LLM prompt.
 
-    Truncates to stay within bounds while keeping recent context.
+    Compresses the transcript to the token budget, favouring user and
+    assistant turns and recent context over repeated tool noise.
 
     Args:
         lines: Parsed transcript lines.
-        max_lines: Maximum lines to include.
-        max_chars: Maximum characters in output.
+        budget_tokens: Maximum estimated tokens in output.
 
     Returns:
         Formatted transcript string.
     """
-    if not lines:
-        return "(empty transcript)"
-
-    # Take last N lines (most recent context is most relevant)
-    recent = lines[-max_lines:]
-
-    formatted = []
-    total_chars = 0
-
-    for entry in recent:
-        # Format based on entry type
-        entry_type = entry.get("type", "unknown")
-        content = ""
-
-        if entry_type == "user":
-            message = entry.get("message", "")
-            content = f"USER: {message}"
-        elif entry_type == "assistant":
-            message = entry.get("message", "")
-            content = f"ASSISTANT: {message[:500]}"  # Truncate long responses
-        elif entry_type == "tool_use":
-            tool = entry.get("tool", "")
-            content = f"TOOL: {tool}"
-        elif entry_type == "tool_result":
-            tool = entry.get("tool", "")
-            content = f"RESULT: {tool} completed"
-        else:
-            # Generic format
-            content = json.dumps(entry, ensure_ascii=False)[:200]
-
-        if total_chars + len(content) > max_chars:
-            break
+    compressed = compress_transcript(lines, budget_tokens=budget_tokens)
+    _logger.debug(
+        "Compressed transcript: kept %d/%d line(s), ~%d tokens",
+        compressed.kept_lines,
+        compressed.total_lines,
+        compressed.estimated_tokens,
+    )
+    return compressed.text
 
-        formatted.append(content)
-        total_chars += len(content) + 1
 
-    return "\n".join(formatted)
+def _has_meaningful_entries(lines: list[dict[str, Any]]) -> bool:
+    """Check whether transcript lines contain anything worth an LLM update."""
+    return any(entry.get("type") in MEANINGFUL_ENTRY_TYPES for entry in lines)
 
 
 def _build_update_prompt(
@@ -110,6 +98,8 @@ def _build_update_prompt(
     snapshot: dict[str, Any] | None,
     session_id: str,
     output_path: Path,
+    *,
+    incremental: bool = False,
 ) -> str:
     """Build the full prompt for brain update.
 
@@ -119,6 +109,8 @@ def _build_update_prompt(
         snapshot: Optional repo snapshot.
         session_id: Session identifier.
         output_path: Path where brain JSON should be written.
+        incremental: Whether the transcript only holds entries appended
+            since the previous successful update.
 
     Returns:
         Complete prompt string.
@@ -132,7 +124,15 @@ def _build_update_prompt(
     parts.append("```")
     parts.append("")
 
-    parts.append("## Session Transcript")
+    if incremental:
+        parts.append("## Session Transcript (new since last update)")
+        parts.append("")
+        parts.append(
+            "Only entries appended since the previous brain update are shown. "
+            "The current brain already reflects everything before them."
+        )
+    else:
+        parts.append("## Session Transcript")
     parts.append("")
     parts.append("```")
     parts.append(transcript_text)
@@ -162,6 +162,7 @@ def _build_update_prompt(
 
 
 @app.callback(invoke_without_command=True)
+@trace("brain update")
 def main(
     transcript: Annotated[
         Path | None,
@@ -183,11 +184,16 @@ def main(
         bool,
         typer.Option("--skip-llm", help="Skip LLM call, just update timestamps"),
     ] = False,
+    full: Annotated[
+        bool,
+        typer.Option("--full", help="Re-read the whole transcript, ignoring the saved offset"),
+    ] = False,
 ) -> None:
     """Update the Session Brain from a transcript.
 
-    Reads the transcript, invokes the LLM to produce an updated brain,
-    validates the result, and saves brain.json + brain.md + episode file.
+    Reads the transcript segment appended since the last successful update,
+    invokes the LLM to produce an updated brain, validates the result, and
+    saves brain.json + brain.md + episode file.
     """
     # Recursion guard
     if is_internal_call():
@@ -201,15 +207,24 @@ def main(
     _logger.info("Updating brain for session %s", session_id)
 
     # Load current brain
-    current_brain = load_brain()
+    with span("load"):
+        current_brain = load_brain()
     _logger.debug("Loaded brain: %s", render_compact(current_brain))
 
-    # Read transcript
+    # Read transcript (only the segment appended since the last update)
     transcript_lines: list[dict[str, Any]] = []
     total_lines = 0
+    start_offset = 0
+    end_offset = 0
     if transcript and transcript.exists():
-        result = read_jsonl(transcript)
+        if not full:
+            start_offset = load_transcript_offset(session_id, transcript)
+        # Only the most recent lines reach the prompt, so read backwards
+        # from EOF instead of parsing the whole (possibly huge) transcript
+        with span("transcript"):
+            result = read_jsonl_tail(transcript, MAX_TRANSCRIPT_LINES, offset=start_offset)
         total_lines = result.total_lines
+        end_offset = result.end_offset
         if result.invalid_lines:
             _logger.warning(
                 "Skipped %d invalid transcript line(s) in %s",
@@ -217,7 +232,13 @@ def main(
                 transcript,
             )
         transcript_lines = [item for item in result.items if isinstance(item, dict)]
-        _logger.info("Read %d transcript line(s) from %s", total_lines, transcript)
+        _logger.info(
+            "Read %d transcript line(s) from %s (bytes %d-%d)",
+            total_lines,
+            transcript,
+            start_offset,
+            end_offset,
+        )
     else:
         _logger.warning("No transcript provided or file not found")
 
@@ -231,7 +252,7 @@ def main(
     brain_path = get_brain_json_path()
 
     # Determine if we should call LLM
-    if skip_llm or not transcript_lines:
+    if skip_llm or not _has_meaningful_entries(transcript_lines):
         # Minimal update: just update timestamps
         _logger.info("Skipping LLM call, minimal update only")
         updated_brain = current_brain.copy()
@@ -240,22 +261,36 @@ def main(
             "last_updated_at": datetime.now(UTC).isoformat(),
         }
         status = "skipped"
-        error = "No transcript or LLM skipped"
+        if skip_llm:
+            error = "LLM skipped"
+        elif start_offset:
+            error = "No new transcript content since last update"
+        else:
+            error = "No transcript content"
     elif dry_run:
         # For dry run, we need to get the brain without writing
         typer.echo("Dry run not supported with LLM mode", err=True)
         raise typer.Exit(1)
     else:
         # Build prompt and call LLM agent
-        transcript_text = _format_transcript_for_prompt(transcript_lines)
-        prompt = _build_update_prompt(current_brain, transcript_text, snapshot, session_id, brain_path)
+        with span("prompt"):
+            transcript_text = _format_transcript_for_prompt(transcript_lines)
+            prompt = _build_update_prompt(
+                current_brain,
+                transcript_text,
+                snapshot,
+                session_id,
+                brain_path,
+                incremental=start_offset > 0,
+            )
 
         _logger.info("Calling LLM agent to update brain...")
-        result = call_claude(
-            prompt,
-            cwd=brain_path.parent,
-            timeout_seconds=120,
-        )
+        with span("llm"):
+            result = call_claude(
+                prompt,
+                cwd=brain_path.parent,
+                timeout_seconds=120,
+            )
 
         if result.success and result.files:
             _logger.info("LLM update successful")
@@ -276,6 +311,9 @@ def main(
             save_brain(updated_brain, brain_path)
             status = "success"
             error = None
+
+            # Only advance the offset once the segment made it into the brain
+            save_transcript_offset(session_id, transcript, end_offset)
         else:
             # LLM failed, do minimal update
             _logger.warning("LLM call failed: %s", result.error)
@@ -297,32 +335,33 @@ def main(
         typer.echo(json.dumps(updated_brain, indent=2, ensure_ascii=False))
         raise typer.Exit(0)
 
-    # Save brain.json (if not already saved by LLM)
-    if status != "success":
-        if save_brain(updated_brain, brain_path):
-            _logger.info("Saved brain to %s", brain_path)
-        else:
-            _logger.error("Failed to save brain")
-            save_last_update(session_id, "failed", error="Failed to save brain.json")
-            raise typer.Exit(1)
-
-    # Render brain.md
-    md_path = get_brain_md_path()
-    if render_and_save(updated_brain, output_path=md_path):
-        _logger.info("Rendered brain.md to %s", md_path)
-
-    # Save episode
-    episode_path = save_episode(updated_brain, session_id)
-    if episode_path:
-        _logger.info("Saved episode to %s", episode_path)
-
-    # Save last update metadata
-    save_last_update(
-        session_id,
-        status,
-        error=error,
-        transcript_lines=total_lines,
-    )
+    with span("save"):
+        # Save brain.json (if not already saved by LLM)
+        if status != "success":
+            if save_brain(updated_brain, brain_path):
+                _logger.info("Saved brain to %s", brain_path)
+            else:
+                _logger.error("Failed to save brain")
+                save_last_update(session_id, "failed", error="Failed to save brain.json")
+                raise typer.Exit(1)
+
+        # Render brain.md
+        md_path = get_brain_md_path()
+        if render_and_save(updated_brain, output_path=md_path):
+            _logger.info("Rendered brain.md to %s", md_path)
+
+        # Save episode
+        episode_path = save_episode(updated_brain, session_id)
+        if episode_path:
+            _logger.info("Saved episode to %s", episode_path)
+
+        # Save last update metadata
+        save_last_update(
+            session_id,
+            status,
+            error=error,
+            transcript_lines=total_lines,
+        )
 
     typer.echo(f"Brain updated: {render_compact(updated_brain)}", err=True)
 
@@ -29,6 +29,7 @@ from voyager.io import read_file, read_json
 from voyager.llm import call_claude, is_internal_call
 from voyager.logging import get_logger
 from voyager.repo.snapshot import snapshot_to_json
+from voyager.transcript import truncate_to_tokens
 
 _logger = get_logger("curriculum.plan")
 
@@ -37,6 +38,9 @@ app = typer.Typer(
     help="Generate a curriculum from brain state and repo snapshot.",
 )
 
+# Token budget for the repo snapshot section of the prompt
+SNAPSHOT_TOKEN_BUDGET = 2000
+
 
 def _load_prompt_template() -> str:
     """Load the plan_curriculum prompt template."""
@@ -78,9 +82,7 @@ def _build_plan_prompt(
     parts.append("```json")
     # Truncate snapshot if too large
     snapshot_str = json.dumps(snapshot, indent=2, ensure_ascii=False)
-    if len(snapshot_str) > 8000:
-        snapshot_str = snapshot_str[:8000] + "\n... (truncated)"
-    parts.append(snapshot_str)
+    parts.append(truncate_to_tokens(snapshot_str, SNAPSHOT_TOKEN_BUDGET))
     parts.append("```")
     parts.append("")
 
@@ -21,9 +21,10 @@ from voyager.factory.store import (
     save_last_update,
     validate_proposals,
 )
-from voyager.io import read_file, read_json
+from voyager.io import read_file, read_json, read_jsonl_tail
 from voyager.llm import call_claude, is_internal_call
 from voyager.logging import get_logger
+from voyager.transcript import compress_transcript
 
 _logger = get_logger("factory.propose")
 
@@ -32,6 +33,9 @@ app = typer.Typer(
     help="Propose new skills from observed patterns.",
 )
 
+# Token budget for the transcript section of the prompt
+TRANSCRIPT_TOKEN_BUDGET = 1000
+
 
 def _load_prompt_template() -> str:
     """Load the propose_skills prompt template."""
@@ -44,12 +48,17 @@ Write the proposals as valid JSON matching the skill_proposal schema."""
     return content
 
 
-def _summarize_transcript(transcript_path: Path, max_lines: int = 500) -> str:
+def _summarize_transcript(
+    transcript_path: Path,
+    max_lines: int = 500,
+    budget_tokens: int = TRANSCRIPT_TOKEN_BUDGET,
+) -> str:
     """Summarize transcript for skill pattern detection.
 
     Args:
         transcript_path: Path to transcript JSONL file.
-        max_lines: Maximum lines to read.
+        max_lines: Maximum number of most recent lines to read.
+        budget_tokens: Maximum estimated tokens in the summary.
 
     Returns:
         Summarized transcript as string.
@@ -57,41 +66,12 @@ def _summarize_transcript(transcript_path: Path, max_lines: int = 500) -> str:
     if not transcript_path.exists():
         return ""
 
-    lines = []
-    try:
-        with transcript_path.open("r", encoding="utf-8") as f:
-            for i, line in enumerate(f):
-                if i >= max_lines:
-                    break
-                try:
-                    entry = json.loads(line.strip())
-                    # Extract relevant fields for pattern detection
-                    msg_type = entry.get("type", "")
-                    if msg_type == "assistant":
-                        # Look for tool uses
-                        message = entry.get("message", {})
-                        content = message.get("content", [])
-                        for block in content:
-                            if isinstance(block, dict):
-                                if block.get("type") == "tool_use":
-                                    tool_name = block.get("name", "")
-                                    lines.append(f"Tool: {tool_name}")
-                                elif block.get("type") == "text":
-                                    text = block.get("text", "")[:200]
-                                    if text:
-                                        lines.append(f"Assistant: {text}...")
-                    elif msg_type == "user":
-                        message = entry.get("message", {})
-                        content = message.get("content", "")
-                        if isinstance(content, str) and content:
-                            lines.append(f"User: {content[:200]}...")
-                except (json.JSONDecodeError, KeyError):
-                    continue
-    except OSError as e:
-        _logger.warning("Failed to read transcript: %s", e)
-        return ""
+    # Read backwards from EOF so large transcripts are not parsed in full
+    result = read_jsonl_tail(transcript_path, max_lines)
+    entries = [item for item in result.items if isinstance(item, dict)]
 
-    return "\n".join(lines[-100:])  # Keep last 100 entries
+    compressed = compress_transcript(entries, budget_tokens=budget_tokens)
+    return compressed.text if compressed.kept_lines else ""
 
 
 def _build_propose_prompt(
@@ -162,7 +142,7 @@ def _build_propose_prompt(
         parts.append("### Recent Session Activity")
         parts.append("")
         parts.append("```")
-        parts.append(transcript_summary[:4000])  # Limit size
+        parts.append(transcript_summary)
         parts.append("```")
         parts.append("")
 
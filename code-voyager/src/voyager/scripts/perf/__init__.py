@@ -0,0 +1 @@
+"""Performance tracing scripts."""
@@ -0,0 +1,55 @@
+"""Hook timing report CLI.
+
+Summarizes traces recorded with VOYAGER_PROFILE=1 as per-phase latency
+percentiles.
+
+Run: voyager perf report
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import typer
+
+from voyager.profiling import PROFILE_ENV_VAR, get_profile_path, load_traces, summarize
+
+
+def main(
+    path: Path | None = None,
+    last: int = 1000,
+    command: str | None = None,
+    json_output: bool = False,
+) -> None:
+    """Print p50/p95/p99 per phase over recent traced runs.
+
+    Args:
+        path: Trace file (defaults to profile.jsonl in the state dir).
+        last: Number of most recent runs to include.
+        command: Only include commands starting with this prefix.
+        json_output: Output results as JSON.
+    """
+    records = load_traces(path, last=last, command=command)
+    if not records:
+        typer.echo(f"No traces in {path or get_profile_path()}.")
+        typer.echo(f"Set {PROFILE_ENV_VAR}=1 to record hook and brain update timings.")
+        return
+
+    stats = summarize(records)
+    if json_output:
+        typer.echo(json.dumps([asdict(s) for s in stats], indent=2))
+        return
+
+    failed = sum(1 for r in records if not r.get("ok", True))
+    typer.echo(f"\nTimings over {len(records)} run(s), {failed} failed (ms)\n")
+    typer.echo(f"  {'phase':<24} {'n':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    current = None
+    for s in stats:
+        if s.command != current:
+            current = s.command
+            typer.echo(f"\n{current}")
+        typer.echo(
+            f"  {s.phase:<24} {s.samples:>6} {s.p50_ms:>9.1f} {s.p95_ms:>9.1f} {s.p99_ms:>9.1f} {s.max_ms:>9.1f}"
+        )
@@ -0,0 +1,276 @@
+"""Token-budgeted transcript compression for LLM prompts.
+
+Session transcripts are dominated by tool noise: the same file read five
+times, identical test output after every edit. Instead of truncating at a
+fixed character count, this module renders transcript entries to one line
+each, scores them by type and recency, deduplicates repeated tool calls
+together with their results when those are unchanged, and keeps the highest-value lines
+that fit an explicit token budget (in original order).
+
+Usage:
+    from voyager.transcript import compress_transcript
+
+    compressed = compress_transcript(entries, budget_tokens=4000)
+    prompt_parts.append(compressed.text)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import re
+from typing import Any
+
+# Default token budget for a compressed transcript
+DEFAULT_BUDGET_TOKENS = 12000
+
+# Relative value of each entry kind; recency scales these down to half
+KIND_WEIGHTS = {
+    "user": 3.0,
+    "assistant": 2.0,
+    "tool_use": 1.0,
+    "tool_result": 0.5,
+    "other": 0.25,
+}
+
+# Per-entry character caps so one huge entry cannot eat the whole budget
+KIND_MAX_CHARS = {
+    "user": 2000,
+    "assistant": 1000,
+    "tool_use": 200,
+    "tool_result": 200,
+    "other": 200,
+}
+
+_LABELS = {
+    "user": "USER",
+    "assistant": "ASSISTANT",
+    "tool_use": "TOOL",
+    "tool_result": "RESULT",
+}
+
+# Word runs and single punctuation marks approximate BPE pieces well enough
+_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the token count of text without a real tokenizer.
+
+    Counts word runs and punctuation marks, charging long words one token per
+    six characters. Close enough to BPE tokenizers for prompt budgeting, and
+    fast enough to run on every prompt.
+
+    Args:
+        text: Text to measure.
+
+    Returns:
+        Estimated number of tokens.
+    """
+    return sum((len(piece) + 5) // 6 for piece in _PIECE_RE.findall(text))
+
+
+def truncate_to_tokens(text: str, budget_tokens: int, marker: str = "\n... (truncated)") -> str:
+    """Truncate text to roughly fit a token budget.
+
+    Args:
+        text: Text to truncate.
+        budget_tokens: Maximum estimated tokens to keep.
+        marker: Appended when text was cut.
+
+    Returns:
+        The original text if it fits, otherwise a prefix plus marker.
+    """
+    total = estimate_tokens(text)
+    if total <= budget_tokens:
+        return text
+    # Cut proportionally, then trim until the estimate fits
+    cut = int(len(text) * budget_tokens / total)
+    while cut > 0 and estimate_tokens(text[:cut]) > budget_tokens:
+        cut = int(cut * 0.9)
+    return text[:cut] + marker
+
+
+@dataclasses.dataclass(frozen=True)
+class CompressedTranscript:
+    """Result of compressing a transcript."""
+
+    text: str
+    total_lines: int
+    kept_lines: int
+    estimated_tokens: int
+
+
+@dataclasses.dataclass(eq=False)
+class _Line:
+    """One rendered transcript line awaiting selection."""
+
+    index: int
+    kind: str
+    text: str
+    key: str
+    repeat: int = 1
+    score: float = 0.0
+    tokens: int = 0
+
+
+def _stringify(value: Any) -> str:
+    """Render a content value (string, blocks, or arbitrary JSON) as text."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        texts = [
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in value
+            if not isinstance(block, dict) or block.get("type") in (None, "text")
+        ]
+        if any(texts):
+            return " ".join(t for t in texts if t)
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _render_entry(entry: dict[str, Any]) -> list[tuple[str, str, str, str]]:
+    """Render a transcript entry to ``(kind, text, dedupe_key, tool_use_id)`` lines.
+
+    Handles both Claude Code transcripts (``message.content`` block lists)
+    and the flat ``{"type": ..., "message": str, "tool": ...}`` format. The
+    tool_use_id links a result to its call; it is empty when absent.
+    """
+    entry_type = entry.get("type", "")
+    message = entry.get("message", "")
+
+    if entry_type == "tool_use":
+        tool = str(entry.get("tool", ""))
+        return [("tool_use", tool, f"use:{tool}", "")]
+    if entry_type == "tool_result":
+        tool = str(entry.get("tool", ""))
+        return [("tool_result", f"{tool} completed", f"result:{tool}", "")]
+
+    if entry_type not in ("user", "assistant"):
+        text = json.dumps(entry, ensure_ascii=False, default=str)
+        return [("other", text, f"other:{text}", "")]
+
+    content = message.get("content", "") if isinstance(message, dict) else message
+    if not isinstance(content, list):
+        text = _stringify(content)
+        return [(entry_type, text, f"{entry_type}:{text}", "")] if text.strip() else []
+
+    lines: list[tuple[str, str, str, str]] = []
+    for block in content:
+        if not isinstance(block, dict):
+            continue
+        block_type = block.get("type")
+        if block_type == "text":
+            text = str(block.get("text", ""))
+            if text.strip():
+                lines.append((entry_type, text, f"{entry_type}:{text}", ""))
+        elif block_type == "tool_use":
+            name = str(block.get("name", ""))
+            tool_input = json.dumps(block.get("input", {}), ensure_ascii=False, sort_keys=True, default=str)
+            text = f"{name} {tool_input}"
+            lines.append(("tool_use", text, f"use:{text}", str(block.get("id", ""))))
+        elif block_type == "tool_result":
+            text = _stringify(block.get("content", ""))
+            if block.get("is_error"):
+                text = f"ERROR {text}"
+            lines.append(("tool_result", text, f"result:{text}", str(block.get("tool_use_id", ""))))
+    return lines
+
+
+def _collect_lines(entries: list[dict[str, Any]]) -> list[_Line]:
+    """Render entries, collapsing repeated tool calls and their unchanged results."""
+    lines: list[_Line] = []
+    last_use: dict[str, _Line] = {}
+    use_by_id: dict[str, _Line] = {}
+    # Latest result line for each call key
+    last_result: dict[str, _Line] = {}
+    previous_use: _Line | None = None
+
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        for kind, text, key, tool_use_id in _render_entry(entry):
+            max_chars = KIND_MAX_CHARS[kind]
+            if len(text) > max_chars:
+                text = text[:max_chars] + "..."
+            line = _Line(index=0, kind=kind, text=text, key=key)
+
+            # Repeated tool calls: keep only the latest occurrence
+            if kind == "tool_use":
+                earlier = last_use.get(key)
+                if earlier is not None:
+                    lines.remove(earlier)
+                    line.repeat = earlier.repeat + 1
+                last_use[key] = previous_use = line
+                if tool_use_id:
+                    use_by_id[tool_use_id] = line
+
+            # A result matching the previous result of the same call replaces
+            # it; results pair with calls by id, else with the latest call
+            elif kind == "tool_result":
+                call = use_by_id.get(tool_use_id) if tool_use_id else previous_use
+                if call is not None:
+                    earlier = last_result.get(call.key)
+                    if earlier is not None and earlier.key == key and earlier in lines:
+                        lines.remove(earlier)
+                        line.repeat = earlier.repeat + 1
+                    last_result[call.key] = line
+
+            lines.append(line)
+
+    for i, line in enumerate(lines):
+        line.index = i
+    return lines
+
+
+def compress_transcript(
+    entries: list[dict[str, Any]],
+    *,
+    budget_tokens: int = DEFAULT_BUDGET_TOKENS,
+) -> CompressedTranscript:
+    """Compress transcript entries to fit a token budget.
+
+    Lines are scored by kind (user > assistant > tool call > tool result >
+    other) and recency, then greedily kept by score while they fit the
+    budget. Kept lines are emitted in their original order.
+
+    Args:
+        entries: Parsed transcript entries, oldest first.
+        budget_tokens: Maximum estimated tokens in the output.
+
+    Returns:
+        CompressedTranscript with the rendered text and selection stats.
+    """
+    lines = _collect_lines(entries)
+    if not lines:
+        return CompressedTranscript(text="(empty transcript)", total_lines=0, kept_lines=0, estimated_tokens=0)
+
+    count = len(lines)
+    for line in lines:
+        label = _LABELS.get(line.kind)
+        rendered = f"{label}: {line.text}" if label else line.text
+        if line.repeat > 1:
+            rendered += f" (x{line.repeat})"
+        line.text = rendered
+        line.tokens = estimate_tokens(rendered) + 1
+        recency = 0.5 + 0.5 * (line.index + 1) / count
+        line.score = KIND_WEIGHTS[line.kind] * recency
+
+    kept: list[_Line] = []
+    used = 0
+    for line in sorted(lines, key=lambda ln: (ln.score, ln.index), reverse=True):
+        if used + line.tokens <= budget_tokens:
+            kept.append(line)
+            used += line.tokens
+
+    kept.sort(key=lambda ln: ln.index)
+    parts = [line.text for line in kept]
+    omitted = count - len(kept)
+    if omitted:
+        parts.insert(0, f"({omitted} lower-priority line(s) omitted)")
+
+    return CompressedTranscript(
+        text="\n".join(parts),
+        total_lines=count,
+        kept_lines=len(kept),
+        estimated_tokens=used,
+    )